@@ -11,12 +11,28 @@ class Settings(BaseSettings):
         "https://roomwaves.vercel.app"
     ]
 
-    # S3/R2 settings
-    R2_ENDPOINT_URL: str
-    R2_ACCESS_KEY_ID: str
-    R2_SECRET_ACCESS_KEY: str
-    R2_BUCKET_NAME: str
-    R2_ACCOUNT_ID: str
+    # Storage settings ("r2" or "local")
+    STORAGE_BACKEND: str = "r2"
+    LOCAL_STORAGE_DIR: str = "storage"
+    PUBLIC_BASE_URL: str = "http://localhost:8000"
+
+    # Local disk cache in front of R2 (disabled when STORAGE_CACHE_DIR is unset)
+    STORAGE_CACHE_DIR: str | None = None
+    STORAGE_CACHE_MAX_MB: int = 2048
+    STORAGE_CACHE_MMAP: bool = True
+
+    # S3/R2 settings, required only by the "r2" storage backend
+    R2_ENDPOINT_URL: str | None = None
+    R2_ACCESS_KEY_ID: str | None = None
+    R2_SECRET_ACCESS_KEY: str | None = None
+    R2_BUCKET_NAME: str | None = None
+    R2_ACCOUNT_ID: str | None = None
+
+    # S3 client connection pool settings
+    S3_MAX_POOL_CONNECTIONS: int = 50
+    S3_CONNECT_TIMEOUT_S: float = 5.0
+    S3_READ_TIMEOUT_S: float = 60.0
+    S3_MAX_ATTEMPTS: int = 3
     
     # File settings
     MAX_FILE_SIZE_MB: int = 25
@@ -25,10 +41,99 @@ class Settings(BaseSettings):
         "audio/ogg", "audio/x-m4a", "audio/mp4"
     ]
 
+    # Streaming upload settings
+    UPLOAD_PART_SIZE_MB: int = 8
+    UPLOAD_MAX_IN_FLIGHT_PARTS: int = 2
+
+    # Decoded audio cache settings
+    AUDIO_CACHE_MAX_MB: int = 256
+
+    # DSP worker pool settings (0 workers runs DSP jobs in the threadpool)
+    DSP_WORKERS: int = 2
+    DSP_MAX_PENDING: int = 16
+    DSP_SHARED_MEMORY_MIN_BYTES: int = 1024 * 1024
+    # Threads per pipeline run processing the bands concurrently (1 = serial);
+    # keep DSP_WORKERS * PIPELINE_BAND_WORKERS close to the number of cores
+    PIPELINE_BAND_WORKERS: int = 1
+    # dtype of the analysis arrays ("float64" or "float32"); float32 halves
+    # memory and bandwidth, see the README for the deviations
+    DSP_PRECISION: str = "float64"
+
+    # Sweeps of the /signal registry: limits, and the inverse filters and
+    # spectra cached by each process (API and every DSP worker)
+    SWEEP_MAX_DURATION_S: float = 120.0
+    SWEEP_MAX_SAMPLE_RATE: int = 384000
+    SWEEP_CACHE_MAX_MB: int = 256
+    # Rendered sweep WAV downloads, shared by the processes of a node
+    SWEEP_FILE_CACHE_DIR: str = "sweep_cache"
+    SWEEP_FILE_CACHE_MAX_MB: int = 1024
+    # Recordings accepted by one /calculate-ir request
+    CALCULATE_IR_MAX_RECORDINGS: int = 8
+
+    # POST /parameters/batch: files analysed concurrently and files per request
+    PARAMETERS_BATCH_CONCURRENCY: int = 4
+    PARAMETERS_BATCH_MAX_FILES: int = 200
+
+    # Background job queue ("memory", "sqlite" or "redis"). Only the sqlite
+    # and redis queues are visible to workers started with
+    # ``python -m app.services.jobs.worker``; the redis one across nodes.
+    JOB_QUEUE_BACKEND: str = "memory"
+    JOB_QUEUE_SQLITE_PATH: str = "jobs.sqlite3"
+    JOB_QUEUE_REDIS_URL: str = "redis://localhost:6379/0"
+    # Jobs run concurrently by the API process itself (0 = external workers only)
+    JOB_WORKERS: int = 1
+    JOB_POLL_INTERVAL_S: float = 0.5
+    # A running job whose worker sent no heartbeat for this long is retried
+    JOB_LEASE_S: float = 60.0
+    JOB_MAX_ATTEMPTS: int = 2
+    # Finished jobs and their results are kept for this long
+    JOB_RETENTION_S: float = 86400.0
+
+    # Persistent analysis result cache (disabled when RESULT_CACHE_DIR is unset)
+    RESULT_CACHE_DIR: str | None = "result_cache"
+    RESULT_CACHE_MAX_MB: int = 1024
+
+    # Response compression settings (gzip when the client accepts it)
+    GZIP_MIN_SIZE_BYTES: int = 1024
+    GZIP_COMPRESS_LEVEL: int = 6
+
+    # Cold-start settings
+    WARMUP_ON_STARTUP: bool = True
+    PRELOAD_MODULES: list[str] = [
+        "numpy", "scipy.signal", "scipy.interpolate", "scipy.ndimage",
+        "scipy.fft", "soundfile", "boto3"
+    ]
+    # Sample rates whose octave and third-octave filter banks are designed at startup
+    FILTER_BANK_SAMPLE_RATES: list[int] = [44100, 48000, 96000]
+
     @property
     def MAX_FILE_SIZE_BYTES(self) -> int:
         return self.MAX_FILE_SIZE_MB * 1024 * 1024
 
+    @property
+    def UPLOAD_PART_SIZE_BYTES(self) -> int:
+        return self.UPLOAD_PART_SIZE_MB * 1024 * 1024
+
+    @property
+    def STORAGE_CACHE_MAX_BYTES(self) -> int:
+        return self.STORAGE_CACHE_MAX_MB * 1024 * 1024
+
+    @property
+    def AUDIO_CACHE_MAX_BYTES(self) -> int:
+        return self.AUDIO_CACHE_MAX_MB * 1024 * 1024
+
+    @property
+    def SWEEP_CACHE_MAX_BYTES(self) -> int:
+        return self.SWEEP_CACHE_MAX_MB * 1024 * 1024
+
+    @property
+    def SWEEP_FILE_CACHE_MAX_BYTES(self) -> int:
+        return self.SWEEP_FILE_CACHE_MAX_MB * 1024 * 1024
+
+    @property
+    def RESULT_CACHE_MAX_BYTES(self) -> int:
+        return self.RESULT_CACHE_MAX_MB * 1024 * 1024
+
     class Config:
         env_file = ".env"
 
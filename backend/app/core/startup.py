@@ -0,0 +1,154 @@
+"""
+Cold-start helpers: module preloading, warm-up passes and import-time reports.
+
+Run ``python -m app.core.startup --budget-ms 4000`` to print the import-time
+breakdown of the application and fail when it exceeds the budget (for CI).
+"""
+import argparse
+import importlib
+import re
+import subprocess
+import sys
+import time
+
+def preload_modules(modules: list[str]) -> dict[str, float]:
+    """Imports the given modules and returns the time each one took in ms."""
+    timings = {}
+    for module in modules:
+        start = time.perf_counter()
+        importlib.import_module(module)
+        timings[module] = round((time.perf_counter() - start) * 1000, 1)
+    return timings
+
+def _synthetic_impulse_response(fs: int, duration_s: float = 0.5):
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    t = np.arange(int(fs * duration_s)) / fs
+    return (np.exp(-6.9 * t / 0.3) * rng.standard_normal(len(t))).astype(np.float32)
+
+def run_dsp_warmup(fs: int = 48000) -> dict[str, float]:
+    """
+    Runs a tiny end-to-end pass through the acoustic pipeline, spectrogram and
+    CSD so their code paths, lazy imports and caches are warm. Returns the
+    time each stage took in ms.
+    """
+    from app.services.get_parameters import process_impulse_response
+    from app.services.plotting import plot_spectrogram, plot_csd
+
+    ri = _synthetic_impulse_response(fs)
+    timings = {}
+    for name, run in (
+        ('pipeline', lambda: process_impulse_response(ri=ri, fs=fs, filter_type=1, smoothing_window_ms=10)),
+        ('spectrogram', lambda: plot_spectrogram(ri, fs)),
+        ('csd', lambda: plot_csd(ri, fs, bands_per_oct=24))
+    ):
+        start = time.perf_counter()
+        run()
+        timings[name] = round((time.perf_counter() - start) * 1000, 1)
+    return timings
+
+def prebuild_filter_banks(sample_rates: list[int] | None) -> float:
+    """Designs the band-pass filter banks of the given sample rates, in ms."""
+    from app.utils.pipeline.filter_bank import prebuild_filter_banks as prebuild
+
+    start = time.perf_counter()
+    prebuild(sample_rates or [])
+    return round((time.perf_counter() - start) * 1000, 1)
+
+def warm_dsp_worker(modules: list[str], filter_bank_sample_rates: list[int] | None = None) -> dict:
+    """Warm-up job executed inside each DSP worker process."""
+    return {
+        'imports_ms': preload_modules(modules),
+        'filter_banks_ms': prebuild_filter_banks(filter_bank_sample_rates),
+        'dsp_ms': run_dsp_warmup()
+    }
+
+async def warm_up(modules: list[str], filter_bank_sample_rates: list[int] | None = None) -> dict:
+    """
+    Preloads modules, builds the storage client, prebuilds the filter banks
+    and warms the DSP code paths in this process and in the DSP worker pool.
+    Returns a timing report.
+    """
+    import asyncio
+    from starlette.concurrency import run_in_threadpool
+
+    from app.services.dsp_pool import get_dsp_pool
+    from app.services.storage import get_storage, R2Storage, DiskCachedStorage
+
+    report = {}
+    start = time.perf_counter()
+
+    report['imports_ms'] = await run_in_threadpool(preload_modules, modules)
+
+    def build_storage():
+        storage = get_storage()
+        backend = storage.backend if isinstance(storage, DiskCachedStorage) else storage
+        if isinstance(backend, R2Storage):
+            backend.client
+        return type(backend).__name__
+
+    report['storage'] = await run_in_threadpool(build_storage)
+    report['filter_banks_ms'] = await run_in_threadpool(prebuild_filter_banks, filter_bank_sample_rates)
+    report['dsp_ms'] = await run_in_threadpool(run_dsp_warmup)
+
+    pool = get_dsp_pool()
+    if pool.max_workers > 0:
+        # One job per worker so every process is spawned and warmed
+        report['workers'] = await asyncio.gather(*(
+            pool.run(warm_dsp_worker, modules, filter_bank_sample_rates) for _ in range(pool.max_workers)
+        ))
+
+    report['total_ms'] = round((time.perf_counter() - start) * 1000, 1)
+    return report
+
+def import_time_report(modules: list[str]) -> list[dict]:
+    """
+    Imports ``modules`` in a fresh interpreter with ``-X importtime`` and
+    returns the import time spent in each top-level package, slowest first.
+    """
+    code = '; '.join(f'import {module}' for module in modules)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    line_pattern = re.compile(r'import time:\s+(\d+)\s+\|\s+\d+\s+\|\s*(\S+)')
+    packages = {}
+    for line in result.stderr.splitlines():
+        match = line_pattern.match(line)
+        if match is None:
+            continue
+        self_us, module = match.groups()
+        package = module.split('.')[0]
+        packages[package] = packages.get(package, 0) + int(self_us)
+
+    report = [
+        {'package': package, 'ms': round(total_us / 1000, 1)}
+        for package, total_us in packages.items()
+    ]
+    return sorted(report, key=lambda entry: entry['ms'], reverse=True)
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Import-time breakdown of the RoomWaves API.")
+    parser.add_argument('modules', nargs='*', default=['app.main'], help="Modules to import (default: app.main)")
+    parser.add_argument('--budget-ms', type=float, default=None, help="Fail when the total exceeds this budget")
+    parser.add_argument('--top', type=int, default=15, help="Number of packages to list")
+    args = parser.parse_args(argv)
+
+    report = import_time_report(args.modules)
+    total_ms = round(sum(entry['ms'] for entry in report), 1)
+
+    for entry in report[:args.top]:
+        print(f"{entry['package']:<30} {entry['ms']:>9.1f} ms")
+    print(f"{'total':<30} {total_ms:>9.1f} ms")
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"Import time {total_ms} ms exceeds the budget of {args.budget_ms} ms", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,13 +1,61 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
 
 from app.core.config import settings
-from app.routers import upload, plot, parameters, signal, snr, calculate_ir
+from app.core.startup import warm_up
+from app.routers import upload, plot, parameters, signal, snr, calculate_ir, cache, analysis, jobs
+from app.services.dsp_pool import get_dsp_pool
+
+logger = logging.getLogger(__name__)
+
+async def _run_warmup(app: FastAPI):
+    try:
+        app.state.startup_report = await warm_up(settings.PRELOAD_MODULES, settings.FILTER_BANK_SAMPLE_RATES)
+    except Exception as e:
+        # Stay not ready: /ready reports the failure so the instance is replaced
+        logger.exception("Startup warm-up failed")
+        app.state.startup_report = {"error": str(e)}
+        return
+    app.state.ready = True
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm up in the background so the server accepts connections right away;
+    # /ready only reports success once the warm-up is done.
+    app.state.ready = False
+    app.state.startup_report = {}
+    if settings.WARMUP_ON_STARTUP:
+        app.state.warmup_task = asyncio.create_task(_run_warmup(app))
+    else:
+        app.state.warmup_task = None
+        app.state.ready = True
+
+    app.state.job_worker = None
+    if settings.JOB_WORKERS > 0:
+        from app.services.jobs.worker import create_worker
+
+        app.state.job_worker = create_worker(settings.JOB_WORKERS)
+        app.state.job_worker.start()
+
+    yield
+
+    if app.state.warmup_task is not None:
+        app.state.warmup_task.cancel()
+    if app.state.job_worker is not None:
+        app.state.job_worker.stop(timeout=5)
+    get_dsp_pool().shutdown()
 
 app = FastAPI(
     title=settings.APP_NAME,
     description=settings.APP_DESCRIPTION,
     version=settings.APP_VERSION,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -17,6 +65,11 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=settings.GZIP_MIN_SIZE_BYTES,
+    compresslevel=settings.GZIP_COMPRESS_LEVEL,
+)
 
 # Include the routers
 app.include_router(upload.router, prefix="/api", tags=["upload"])
@@ -25,15 +78,27 @@ app.include_router(parameters.router, prefix="/api", tags=["parameters"])
 app.include_router(signal.router, prefix="/api", tags=["signal"])
 app.include_router(snr.router, prefix="/api", tags=["snr"])
 app.include_router(calculate_ir.router, prefix="/api", tags=["calculate-ir"])
+app.include_router(cache.router, prefix="/api", tags=["cache"])
+app.include_router(analysis.router, prefix="/api", tags=["analysis"])
+app.include_router(jobs.router, prefix="/api", tags=["jobs"])
 
 @app.get("/")
 def read_root():
     return {"message": f"Hi, welcome to {settings.APP_NAME} API! visit /docs for more information."}
 
+@app.get("/ready")
+def ready():
+    if not app.state.ready:
+        if "error" in app.state.startup_report:
+            return JSONResponse(status_code=503, content={"status": "failed", "startup": app.state.startup_report})
+        return JSONResponse(status_code=503, content={"status": "warming up"})
+    return {"status": "ready", "startup": app.state.startup_report}
+
 @app.get("/warmup")
-def warmup():
-    import numpy as np
-    dummy_signal = np.random.randn(1000)
-    dummy_fft = np.fft.fft(dummy_signal)
-    result = np.abs(dummy_fft).mean()
-    return {"status": "warm", "result": float(result)}
\ No newline at end of file
+async def warmup():
+    """Waits for the startup warm-up to finish, so callers can wake an instance."""
+    if app.state.warmup_task is not None:
+        await asyncio.shield(app.state.warmup_task)
+    if "error" in app.state.startup_report:
+        return JSONResponse(status_code=503, content={"status": "failed", "startup": app.state.startup_report})
+    return {"status": "warm", "startup": app.state.startup_report}
@@ -0,0 +1,56 @@
+from enum import Enum
+
+from fastapi import APIRouter, HTTPException, Request
+
+from app.services.analysis_bundle import ANALYSIS_VIEWS, get_analysis_views
+from app.services.http_cache import view_response
+
+router = APIRouter()
+
+class ParameterBandsPerOctave(int, Enum):
+    one = 1
+    three = 3
+
+class BandsPerOctave(int, Enum):
+    one = 1
+    three = 3
+    six = 6
+    twelve = 12
+    twenty_four = 24
+    forty_eight = 48
+
+@router.get("/analysis/{file_path:path}")
+async def get_analysis_bundle(
+    file_path: str,
+    request: Request,
+    views: str = ",".join(ANALYSIS_VIEWS),
+    parameter_bands: ParameterBandsPerOctave = ParameterBandsPerOctave.one,
+    frequency_bands: BandsPerOctave = BandsPerOctave.twenty_four,
+    csd_bands: BandsPerOctave = BandsPerOctave.twenty_four):
+    """
+    Returns any subset of the analysis views of a file. Cached views are
+    reused and the rest are computed from a single download and decode,
+    sharing intermediates between views.
+
+    Args:
+        views: Comma-separated list of views among waveform, envelope_db,
+            spectrogram, csd, frequency_response, parameters and snr (default: all)
+    """
+    requested_views = list(dict.fromkeys(view.strip() for view in views.split(",") if view.strip()))
+    unknown = [view for view in requested_views if view not in ANALYSIS_VIEWS]
+    if unknown or not requested_views:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown analysis views: {', '.join(unknown)}. Choose from: {', '.join(ANALYSIS_VIEWS)}"
+        )
+
+    band_settings = {
+        'parameter_bands': parameter_bands.value,
+        'frequency_bands': frequency_bands.value,
+        'csd_bands': csd_bands.value
+    }
+
+    async def compute():
+        return await get_analysis_views(file_path, requested_views, **band_settings)
+
+    return await view_response(request, file_path, requested_views, compute, **band_settings)
@@ -0,0 +1,22 @@
+from fastapi import APIRouter
+
+from app.services.audio_cache import get_audio_cache
+from app.services.result_cache import get_result_cache
+from app.services.storage import get_storage
+from app.services.sweep_registry import get_sweep_file_cache, get_sweep_registry
+
+router = APIRouter()
+
+@router.get("/cache/stats")
+async def get_cache_stats():
+    """
+    Returns hit/miss/eviction counters of the caches, useful to size them.
+    """
+    result_cache = get_result_cache()
+    return {
+        "audio": get_audio_cache().stats(),
+        "storage": get_storage().stats(),
+        "results": result_cache.stats() if result_cache is not None else None,
+        "sweeps": get_sweep_registry().stats(),
+        "sweep_files": get_sweep_file_cache().stats()
+    }
@@ -0,0 +1,115 @@
+import os
+import uuid
+
+from fastapi import APIRouter, File, HTTPException, UploadFile
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
+
+from app.schemas.parameters import ParametersJobRequest
+from app.services.ir_service import validate_ir_uploads
+from app.services.jobs import CANCELLED, FAILED, SUCCEEDED, Job, get_job_queue
+from app.services.jobs.tasks import JOB_INPUTS_PREFIX, delete_job_inputs
+from app.services.storage import upload_file_async
+from app.services.sweep_registry import parse_sweep_id
+
+router = APIRouter()
+
+def _accepted(job: Job) -> JSONResponse:
+    return JSONResponse(
+        status_code=202,
+        content=job.to_status(),
+        headers={"Location": f"/api/jobs/{job.id}"}
+    )
+
+async def _get_job(job_id: str) -> Job:
+    job = await run_in_threadpool(get_job_queue().get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    return job
+
+@router.post("/jobs/calculate-ir")
+async def submit_calculate_ir_job(
+    recorded_sweep: UploadFile = File(...),
+    inverse_filter: UploadFile | None = File(None),
+    sweep_id: str | None = None,
+    start_margin_ms: float = 20.0,
+    duration_factor: float = 4.0
+):
+    """
+    Queues the calculation of an Impulse Response (see ``POST /calculate-ir``).
+    Returns 202 with the job status; its result is the ``/calculate-ir`` response.
+    """
+    validate_ir_uploads([recorded_sweep], inverse_filter, sweep_id)
+    if sweep_id is not None:
+        parse_sweep_id(sweep_id)
+
+    uploads = [("recorded_sweep_key", recorded_sweep)]
+    if inverse_filter is not None:
+        uploads.append(("inverse_filter_key", inverse_filter))
+    keys = {}
+    try:
+        for name, upload in uploads:
+            extension = os.path.splitext(upload.filename or "")[1]
+            keys[name] = f"{JOB_INPUTS_PREFIX}{uuid.uuid4()}{extension}"
+            await upload_file_async(upload.file, keys[name])
+
+        job = await run_in_threadpool(
+            get_job_queue().submit,
+            'calculate_ir',
+            {**keys, "sweep_id": sweep_id, "start_margin_ms": start_margin_ms, "duration_factor": duration_factor}
+        )
+    except Exception:
+        # Nothing will ever run (and clean up) a job that was not queued
+        await run_in_threadpool(delete_job_inputs, Job(kind='calculate_ir', params=keys))
+        raise
+    return _accepted(job)
+
+@router.post("/jobs/parameters")
+async def submit_parameters_job(request: ParametersJobRequest):
+    """
+    Queues the acoustic parameters of a stored file (see ``GET /parameters``).
+    Returns 202 with the job status.
+    """
+    job = await run_in_threadpool(
+        get_job_queue().submit,
+        'parameters',
+        {"file_key": request.file, "bands": request.bands, "multichannel": request.multichannel}
+    )
+    return _accepted(job)
+
+@router.get("/jobs/stats")
+async def get_job_stats():
+    """Returns the job counts per status of the configured queue."""
+    return await run_in_threadpool(get_job_queue().stats)
+
+@router.get("/jobs/{job_id}")
+async def get_job_status(job_id: str):
+    """Returns the status and progress of a job."""
+    return (await _get_job(job_id)).to_status()
+
+@router.get("/jobs/{job_id}/result")
+async def get_job_result(job_id: str):
+    """
+    Returns the result of a succeeded job. Answers 202 with the job status
+    while it is queued or running, and 409 when it failed or was cancelled.
+    """
+    job = await _get_job(job_id)
+    if job.status == SUCCEEDED:
+        return job.result
+    if job.status in (FAILED, CANCELLED):
+        raise HTTPException(status_code=409, detail=job.error or f"Job {job.status}.")
+    return JSONResponse(status_code=202, content=job.to_status(), headers={"Retry-After": "1"})
+
+@router.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str):
+    """
+    Cancels a queued job, or asks the worker of a running one to stop at its
+    next checkpoint. Returns the updated job status.
+    """
+    job = await run_in_threadpool(get_job_queue().cancel, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    if job.status == CANCELLED:
+        # Queued jobs are cancelled right away, before any worker sees them
+        await run_in_threadpool(delete_job_inputs, job)
+    return job.to_status()
@@ -1,9 +1,12 @@
 from enum import Enum
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
-from app.services.get_parameters import process_impulse_response
-from app.services.s3_service import download_file_from_s3
+from app.core.config import settings
+from app.schemas.parameters import ParametersBatchRequest
+from app.services.http_cache import cached_view_response
+from app.services.parameters_service import NDJSON_MEDIA_TYPE, compute_parameters, stream_parameters_batch
 
 router = APIRouter()
 
@@ -11,20 +14,40 @@ class BandsPerOctave(int, Enum):
     one = 1
     three = 3
 
+@router.post("/parameters/batch")
+async def get_acoustic_parameters_batch(batch: ParametersBatchRequest):
+    """
+    Streams the parameters of several files as NDJSON, one line per file in
+    completion order (see stream_parameters_batch for the line format).
+    """
+    if len(batch.files) > settings.PARAMETERS_BATCH_MAX_FILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"A batch can hold at most {settings.PARAMETERS_BATCH_MAX_FILES} files."
+        )
+
+    return StreamingResponse(
+        stream_parameters_batch(batch.files, batch.bands, batch.multichannel),
+        media_type=NDJSON_MEDIA_TYPE,
+        # GZipMiddleware would hold the lines back until its compressor fills up
+        headers={"Content-Encoding": "identity", "Cache-Control": "no-store"}
+    )
+
 @router.get("/parameters/{file_path:path}")
 async def get_acoustic_parameters(
     file_path: str,
-    bands: BandsPerOctave = BandsPerOctave.one):
-    import librosa
+    request: Request,
+    bands: BandsPerOctave = BandsPerOctave.one,
+    multichannel: bool = False):
+    async def compute():
+        return await compute_parameters(file_path, bands.value, multichannel)
     
-    file_stream = download_file_from_s3(file_path)
-    y, fs = librosa.load(file_stream, sr=None, mono=True)
-    
-    results = process_impulse_response(
-        ri=y,
-        fs=fs,
-        filter_type=bands,
-        smoothing_window_ms=10
+    return await cached_view_response(
+        request,
+        file_path,
+        'parameters',
+        compute,
+        arrays=False,
+        parameter_bands=bands.value,
+        multichannel=multichannel
     )
-    
-    return results
\ No newline at end of file
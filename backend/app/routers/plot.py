@@ -1,9 +1,11 @@
 from enum import Enum
 
-from app.services.s3_service import download_file_from_s3
+from app.services.audio_loader import load_audio_async
+from app.services.dsp_pool import run_dsp
 from app.services.plotting import plot_waveform, plot_frequency_response, plot_spectrogram, plot_csd, plot_envelope_db
+from app.services.http_cache import cached_view_response
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 
 router = APIRouter()
 
@@ -16,56 +18,47 @@ class BandsPerOctave(int, Enum):
     forty_eight = 48
 
 @router.get("/plot/{file_path:path}")
-async def get_plot_data(file_path: str):
-    import librosa
-    
-    file_stream = download_file_from_s3(file_path)
-    y, sr = librosa.load(file_stream, sr=None, mono=True)
-    plot_data = plot_waveform(y, sr)
-    
-    return plot_data
+async def get_plot_data(file_path: str, request: Request):
+    async def compute():
+        y, sr = await load_audio_async(file_path)
+        return plot_waveform(y, sr)
+
+    return await cached_view_response(request, file_path, 'waveform', compute)
 
 @router.get("/envelope-db/{file_path:path}")
-async def get_envelope_db_data(file_path: str):
-    import librosa
-    
-    file_stream = download_file_from_s3(file_path)
-    y, sr = librosa.load(file_stream, sr=None, mono=True)
-    plot_data = plot_envelope_db(y, sr)
-    
-    return plot_data
+async def get_envelope_db_data(file_path: str, request: Request):
+    async def compute():
+        y, sr = await load_audio_async(file_path)
+        return plot_envelope_db(y, sr)
+
+    return await cached_view_response(request, file_path, 'envelope_db', compute)
 
 @router.get("/spectrogram/{file_path:path}")
-async def get_spectrogram_data(file_path: str):
-    import librosa
-    
-    file_stream = download_file_from_s3(file_path)
-    y, sr = librosa.load(file_stream, sr=None, mono=True)
-    plot_data = plot_spectrogram(y, sr)
-    
-    return plot_data
+async def get_spectrogram_data(file_path: str, request: Request):
+    async def compute():
+        y, sr = await load_audio_async(file_path)
+        return await run_dsp(plot_spectrogram, y, sr)
+
+    return await cached_view_response(request, file_path, 'spectrogram', compute)
 
 @router.get("/csd/{file_path:path}")
 async def get_csd_data(
     file_path: str,
+    request: Request,
     bands: BandsPerOctave = BandsPerOctave.twenty_four):
-    import librosa
-    
-    file_stream = download_file_from_s3(file_path)
-    y, sr = librosa.load(file_stream, sr=None, mono=True)
-    plot_data = plot_csd(y, sr, bands_per_oct=bands.value)
+    async def compute():
+        y, sr = await load_audio_async(file_path)
+        return await run_dsp(plot_csd, y, sr, bands_per_oct=bands.value)
 
-    return plot_data
+    return await cached_view_response(request, file_path, 'csd', compute, csd_bands=bands.value)
 
 @router.get("/frequency-response/{file_path:path}")
 async def get_frequency_response_data(
     file_path: str,
+    request: Request,
     bands: BandsPerOctave = BandsPerOctave.twenty_four):
-    import librosa
-    
-    file_stream = download_file_from_s3(file_path)
-    y, sr = librosa.load(file_stream, sr=None, mono=True)
-
-    frequency_data = plot_frequency_response(y, sr, bands_per_oct=bands.value)
+    async def compute():
+        y, sr = await load_audio_async(file_path)
+        return plot_frequency_response(y, sr, bands_per_oct=bands.value)
 
-    return frequency_data
+    return await cached_view_response(request, file_path, 'frequency_response', compute, frequency_bands=bands.value)
@@ -1,6 +1,12 @@
-from fastapi import APIRouter
+from typing import Literal
 
+from fastapi import APIRouter, Request
+from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
+
+from app.services.http_cache import IMMUTABLE_CACHE_CONTROL, etag_matches, file_response, make_etag
 from app.services.signal_service import generate_sweep_signals
+from app.services.sweep_registry import get_sweep_file_cache, parse_sweep_id, sweep_filename
 
 router = APIRouter()
 
@@ -8,10 +14,44 @@ router = APIRouter()
 async def get_signal(duration: float = 10,
                      f_inf: int = 20,
                      f_sup: int = 20000,
-                     fs: int = 44100):
-    return generate_sweep_signals(
+                     fs: int = 44100,
+                     include_audio: bool = True):
+    """
+    Generates a sweep and its inverse filter. ``include_audio=false`` leaves
+    out the base64 audio; the files are then downloaded from
+    /signal/{sweep_id}/sweep.wav and /signal/{sweep_id}/inverse.wav.
+    """
+    return await run_in_threadpool(
+        generate_sweep_signals,
         duration=duration,
         f_inf=f_inf,
         f_sup=f_sup,
-        fs=fs
+        fs=fs,
+        include_audio=include_audio
+    )
+
+@router.get("/signal/{sweep_id}/{kind}.wav")
+async def download_signal(request: Request, sweep_id: str, kind: Literal['sweep', 'inverse']):
+    """
+    Downloads the sweep or the inverse filter of a sweep returned by /signal,
+    as a 16-bit WAV file. Supports Range requests, and answers 304 to a
+    matching If-None-Match: a sweep ID always maps to the same file.
+    """
+    parse_sweep_id(sweep_id)
+    headers = {
+        'ETag': make_etag('signal', sweep_id, kind),
+        'Cache-Control': IMMUTABLE_CACHE_CONTROL,
+        # A compressed body would break byte ranges, and PCM barely compresses
+        'Content-Encoding': 'identity'
+    }
+    if etag_matches(request, headers['ETag']):
+        return Response(status_code=304, headers=headers)
+
+    wav_file = await run_in_threadpool(get_sweep_file_cache().open, sweep_id, kind)
+    return file_response(
+        request,
+        wav_file,
+        media_type='audio/wav',
+        filename=sweep_filename(sweep_id, kind),
+        headers=headers
     )
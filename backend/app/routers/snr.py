@@ -1,19 +1,20 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 
 from app.services.get_snr import calculate_snr
-from app.services.s3_service import download_file_from_s3
+from app.services.audio_loader import load_audio_async
+from app.services.http_cache import cached_view_response
 
 router = APIRouter()
 
 @router.get("/snr/{filename:path}")
-async def get_snr(filename: str):
-    import librosa
-    
+async def get_snr(filename: str, request: Request):
     file_key = filename
+
+    async def compute():
+        y, fs = await load_audio_async(file_key)
+
+        snr_db = calculate_snr(y)
+
+        return {"snr_db": snr_db}
     
-    file_stream = download_file_from_s3(file_key)
-    y, fs = librosa.load(file_stream, sr=None, mono=True)
-    
-    snr_db = calculate_snr(y)
-    
-    return {"snr_db": snr_db}
+    return await cached_view_response(request, file_key, 'snr', compute, arrays=False)
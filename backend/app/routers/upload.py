@@ -1,45 +1,59 @@
-import os
-import uuid
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
+from fastapi.responses import FileResponse
 
-from fastapi import APIRouter, UploadFile, File, HTTPException
-
-from app.core.config import settings
-from app.services.s3_service import upload_file_to_s3, generate_presigned_url
+from app.services.audio_loader import ingest_audio
+from app.services.storage import LocalStorage, get_storage, generate_file_url_async
+from app.services.upload_service import stream_upload
 
 router = APIRouter()
 
-@router.post("/upload")
-async def upload_audio_file(file: UploadFile = File(...)):
-    if file.content_type not in settings.ALLOWED_MIME_TYPES:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File type not allowed. Please upload one of: {', '.join(settings.ALLOWED_MIME_TYPES)}"
-        )
-
-    file.file.seek(0, os.SEEK_END)
-    file_size = file.file.tell()
-    if file_size > settings.MAX_FILE_SIZE_BYTES:
-        raise HTTPException(
-            status_code=413,
-            detail=f"File size exceeds the {settings.MAX_FILE_SIZE_MB}MB limit."
-        )
-    file.file.seek(0)
-
-    _, extension = os.path.splitext(file.filename)
-    unique_filename = f"{uuid.uuid4()}{extension}"
-    file_key = f"uploads/{unique_filename}"
-    
-    upload_file_to_s3(file.file, file_key)
-    
+@router.post(
+    "/upload",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "required": ["file"],
+                        "properties": {"file": {"type": "string", "format": "binary"}}
+                    }
+                }
+            }
+        }
+    }
+)
+async def upload_audio_file(request: Request, background_tasks: BackgroundTasks):
+    upload = await stream_upload(request)
+
+    # Decode once at ingest; analysis routes then read the PCM sidecar
+    background_tasks.add_task(ingest_audio, upload["path"])
+
     return {
         "status": "upload successful",
-        "filename": unique_filename,
-        "path": file_key
+        "filename": upload["filename"],
+        "path": upload["path"]
     }
 
 @router.get("/file-url/{file_path:path}")
 async def get_file_url(file_path: str):
-    presigned_url = generate_presigned_url(file_path, expiration=3600)
+    presigned_url = await generate_file_url_async(file_path, expiration=3600)
     return {
         "url": presigned_url
-    }
\ No newline at end of file
+    }
+
+@router.get("/files/{file_path:path}")
+async def get_local_file(file_path: str):
+    """
+    Serves stored files when the local storage backend is in use.
+    With R2 the URLs returned by /file-url point to the bucket instead.
+    """
+    storage = get_storage()
+    if not isinstance(storage, LocalStorage):
+        raise HTTPException(status_code=404, detail="File not found")
+
+    path = storage.local_path(file_path)
+    if path is None:
+        raise HTTPException(status_code=404, detail="File not found")
+    return FileResponse(path)
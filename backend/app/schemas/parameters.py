@@ -1,11 +1,25 @@
-from pydantic import BaseModel
+from typing import Literal
+
+from pydantic import BaseModel, Field
 
 class FrequencyBandParams(BaseModel):
     EDT: float
     T60_from_T20: float
     T60_from_T30: float
     C50: float
+    C80: float
     D50: float
+    Ts: float
 
 class AnalysisResult(BaseModel):
-    parameters: dict[str, FrequencyBandParams]
\ No newline at end of file
+    parameters: dict[str, FrequencyBandParams]
+
+class ParametersBatchRequest(BaseModel):
+    files: list[str] = Field(min_length=1)
+    bands: Literal[1, 3] = 1
+    multichannel: bool = False
+
+class ParametersJobRequest(BaseModel):
+    file: str
+    bands: Literal[1, 3] = 1
+    multichannel: bool = False
@@ -0,0 +1,204 @@
+from functools import cached_property
+
+from app.services import get_snr
+from app.services.get_parameters import process_impulse_response
+from app.services.get_snr import calculate_snr
+from app.services.plotting import (
+    find_truncation_index,
+    plot_waveform,
+    plot_envelope_db,
+    plot_frequency_response,
+    plot_spectrogram,
+    plot_csd
+)
+from app.services.result_cache import cached_result, result_cache_for
+from app.utils.graph import csd, envelope, freq_domain, spectrogram, time_domain
+from app.utils.pipeline.orchestrator import AcousticPipeline
+from app.utils.pipeline.processor import DecayAnalyzer, EnvelopeSmoother
+
+ANALYSIS_VIEWS = (
+    'waveform',
+    'envelope_db',
+    'spectrogram',
+    'csd',
+    'frequency_response',
+    'parameters',
+    'snr'
+)
+
+class AnalysisContext:
+    """
+    Holds one decoded signal and the decay truncation shared by its views.
+
+    The truncation index (smoothed energy envelope plus Lundeby crossover) is
+    the only intermediate shared: it is computed on first use, once for both
+    the spectrogram and the CSD. Nothing else is worth sharing. The truncated
+    signal is a zero-copy slice. The envelope view plots the raw magnitude
+    rather than the smoothed envelope. Each view also needs its own transform:
+    a 46 ms STFT for the spectrogram, 8192-point Hann-windowed slices for the
+    CSD and one zero-padded rfft of the whole signal for the frequency response.
+    """
+    def __init__(self, signal, sr: int):
+        self.signal = signal
+        self.sr = sr
+
+    @cached_property
+    def truncation_index(self) -> int:
+        return find_truncation_index(self.signal, self.sr)
+
+    def waveform(self) -> dict:
+        return plot_waveform(self.signal, self.sr)
+
+    def envelope_db(self) -> dict:
+        return plot_envelope_db(self.signal, self.sr)
+
+    def spectrogram(self) -> dict:
+        return plot_spectrogram(self.signal, self.sr, truncation_index=self.truncation_index)
+
+    def csd(self, bands_per_oct: int) -> dict:
+        return plot_csd(self.signal, self.sr, bands_per_oct=bands_per_oct, truncation_index=self.truncation_index)
+
+    def frequency_response(self, bands_per_oct: int) -> dict:
+        return plot_frequency_response(self.signal, self.sr, bands_per_oct=bands_per_oct)
+
+    def parameters(self, filter_type: int) -> dict:
+        return process_impulse_response(
+            ri=self.signal,
+            fs=self.sr,
+            filter_type=filter_type,
+            smoothing_window_ms=10
+        )
+
+    def snr(self) -> dict:
+        return {"snr_db": calculate_snr(self.signal)}
+
+
+def compute_analysis_bundle(
+    signal,
+    sr: int,
+    views: list[str],
+    parameter_bands: int = 1,
+    frequency_bands: int = 24,
+    csd_bands: int = 24
+) -> dict:
+    """
+    Computes several analysis views of one impulse response in a single pass.
+
+    Each view holds the same payload as its standalone endpoint
+    (``/plot``, ``/envelope-db``, ``/spectrogram``, ``/csd``,
+    ``/frequency-response``, ``/parameters`` and ``/snr``).
+    """
+    context = AnalysisContext(signal, sr)
+    builders = {
+        'waveform': context.waveform,
+        'envelope_db': context.envelope_db,
+        'spectrogram': context.spectrogram,
+        'csd': lambda: context.csd(csd_bands),
+        'frequency_response': lambda: context.frequency_response(frequency_bands),
+        'parameters': lambda: context.parameters(parameter_bands),
+        'snr': context.snr
+    }
+
+    unknown = [view for view in views if view not in builders]
+    if unknown:
+        raise ValueError(f"Unknown analysis views: {', '.join(unknown)}")
+
+    return {view: builders[view]() for view in views}
+
+
+def view_version(view: str) -> str:
+    """
+    Version of the algorithms behind a view, used in its result cache key.
+
+    Built from the ``VERSION`` of every graph module and pipeline processor
+    the view goes through, so bumping one of them invalidates its results.
+    Results computed with ``DSP_PRECISION=float32`` get their own versions.
+    """
+    from app.core.config import settings
+
+    truncation = f"{EnvelopeSmoother.VERSION}.{DecayAnalyzer.VERSION}"
+    versions = {
+        'waveform': str(time_domain.VERSION),
+        'envelope_db': str(envelope.VERSION),
+        'spectrogram': f"{spectrogram.VERSION}-{truncation}",
+        'csd': f"{csd.VERSION}-{truncation}",
+        'frequency_response': str(freq_domain.VERSION),
+        'parameters': AcousticPipeline.algorithm_version(),
+        'snr': str(get_snr.VERSION)
+    }
+    if settings.DSP_PRECISION != 'float64' and view not in ('waveform', 'snr'):
+        return f"{versions[view]}-{settings.DSP_PRECISION}"
+    return versions[view]
+
+def view_params(
+    view: str,
+    parameter_bands: int = 1,
+    frequency_bands: int = 24,
+    csd_bands: int = 24,
+    multichannel: bool = False
+) -> dict:
+    """Query parameters a view depends on, used in its result cache key."""
+    params = {
+        'csd': {'bands_per_oct': csd_bands},
+        'frequency_response': {'bands_per_oct': frequency_bands},
+        'parameters': {'filter_type': parameter_bands, 'smoothing_window_ms': 10}
+    }
+    if multichannel:
+        params['parameters']['multichannel'] = True
+    return params.get(view, {})
+
+async def cached_view(file_key: str, view: str, compute, **band_settings):
+    """Returns the cached result of one view of a file, or awaits ``compute()``."""
+    return await cached_result(
+        file_key,
+        view,
+        view_params(view, **band_settings),
+        view_version(view),
+        compute
+    )
+
+async def get_analysis_views(
+    file_key: str,
+    views: list[str],
+    parameter_bands: int = 1,
+    frequency_bands: int = 24,
+    csd_bands: int = 24
+) -> dict:
+    """
+    Returns the requested views of a stored file. Views found in the result
+    cache are reused; the missing ones are computed in a single DSP job and
+    stored.
+    """
+    from starlette.concurrency import run_in_threadpool
+
+    from app.services.audio_loader import load_audio_async
+    from app.services.dsp_pool import run_dsp
+
+    band_settings = {
+        'parameter_bands': parameter_bands,
+        'frequency_bands': frequency_bands,
+        'csd_bands': csd_bands
+    }
+    cache = result_cache_for(file_key)
+
+    bundle = {}
+    if cache is not None:
+        for view in views:
+            result = await run_in_threadpool(
+                cache.get, file_key, view, view_params(view, **band_settings), view_version(view)
+            )
+            if result is not None:
+                bundle[view] = result
+
+    missing = [view for view in views if view not in bundle]
+    if missing:
+        y, sr = await load_audio_async(file_key)
+        computed = await run_dsp(compute_analysis_bundle, y, sr, views=missing, **band_settings)
+        for view, result in computed.items():
+            bundle[view] = result
+            if cache is not None:
+                await run_in_threadpool(
+                    cache.put, file_key, view, view_params(view, **band_settings), view_version(view), result
+                )
+
+    return {view: bundle[view] for view in views}
@@ -0,0 +1,120 @@
+import threading
+from collections import OrderedDict
+
+class DecodedAudioCache:
+    """
+    Thread-safe LRU cache of decoded PCM signals, bounded by a byte budget.
+
+    Entries are keyed by ``(file_key, sr, mono)`` and hold the ``(signal, sr)``
+    tuple returned by the decoder. Arrays passed to ``put`` (and so every
+    signal ``get_or_load`` returns) are marked read-only, whether or not they
+    fit the budget, so that a route cannot corrupt the data seen by the next
+    request and callers can rely on it either way.
+    """
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple, tuple] = OrderedDict()
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+        self._loading: dict[tuple, threading.Lock] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _entry_size(value: tuple) -> int:
+        signal = value[0]
+        return int(getattr(signal, 'nbytes', 0))
+
+    def get(self, key: tuple):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: tuple, value: tuple) -> None:
+        signal = value[0]
+        if hasattr(signal, 'flags'):
+            signal.flags.writeable = False
+
+        size = self._entry_size(value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._current_bytes -= self._entry_size(previous)
+
+            self._entries[key] = value
+            self._current_bytes += size
+
+            while self._current_bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._current_bytes -= self._entry_size(evicted)
+                self.evictions += 1
+
+    def get_or_load(self, key: tuple, loader) -> tuple:
+        """
+        Returns the cached value for ``key`` or builds it with ``loader()``.
+
+        Concurrent callers asking for the same key wait for the first one
+        instead of downloading and decoding the same file in parallel.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            key_lock = self._loading.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                value = self._entries.get(key)
+                if value is not None:
+                    self._entries.move_to_end(key)
+            if value is not None:
+                return value
+
+            try:
+                value = loader()
+                self.put(key, value)
+            finally:
+                with self._lock:
+                    self._loading.pop(key, None)
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'current_bytes': self._current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+
+_audio_cache: DecodedAudioCache | None = None
+_audio_cache_lock = threading.Lock()
+
+def get_audio_cache() -> DecodedAudioCache:
+    """Returns the process-wide decoded audio cache, creating it on first use."""
+    global _audio_cache
+    if _audio_cache is None:
+        with _audio_cache_lock:
+            if _audio_cache is None:
+                from app.core.config import settings
+                _audio_cache = DecodedAudioCache(settings.AUDIO_CACHE_MAX_BYTES)
+    return _audio_cache
@@ -0,0 +1,122 @@
+import logging
+
+from starlette.concurrency import run_in_threadpool
+
+from app.services.audio_cache import get_audio_cache
+from app.services.audio_sidecar import read_sidecar, write_sidecar
+from app.services.storage import download_file
+
+logger = logging.getLogger(__name__)
+
+def _from_canonical(signal, native_sr: int, sr: int | None, mono: bool) -> tuple:
+    """Converts a decoded native-rate signal to the requested layout and rate."""
+    import numpy as np
+
+    if mono and signal.ndim == 2:
+        signal = np.mean(signal, axis=0, dtype=np.float32)
+
+    if sr is not None and sr != native_sr:
+        import librosa
+        signal = librosa.resample(signal, orig_sr=native_sr, target_sr=sr)
+        return signal, sr
+
+    return signal, native_sr
+
+def _decode_with_soundfile(file) -> tuple:
+    """
+    Decodes a file straight into a preallocated float32 ``(frames, channels)``
+    buffer with libsndfile.
+    """
+    import numpy as np
+    import soundfile as sf
+
+    with sf.SoundFile(file) as sound_file:
+        buffer = np.empty((sound_file.frames, sound_file.channels), dtype=np.float32)
+        frames_read = sound_file.read(out=buffer).shape[0]
+        native_sr = sound_file.samplerate
+
+    # Frame counts of some compressed formats are only an estimate
+    return buffer[:frames_read], native_sr
+
+def decode_audio(file, sr: int | None = None, mono: bool = True) -> tuple:
+    """
+    Decodes an audio file object into a float32 ``(signal, sr)`` pair.
+
+    Formats supported by libsndfile (WAV, FLAC, OGG, MP3, ...) are decoded
+    directly by soundfile; anything else falls back to librosa. Like
+    ``librosa.load``, the signal is 1-D when ``mono`` is set or the file has a
+    single channel and ``(channels, frames)`` otherwise, and ``sr=None``
+    keeps the native sample rate.
+    """
+    import numpy as np
+    import soundfile as sf
+
+    try:
+        buffer, native_sr = _decode_with_soundfile(file)
+    except (sf.LibsndfileError, RuntimeError):
+        import librosa
+
+        file.seek(0)
+        return librosa.load(file, sr=sr, mono=mono)
+
+    channels = buffer.shape[1]
+    if channels == 1:
+        signal = buffer[:, 0]
+    elif mono:
+        # Downmix in place into the first channel before compacting it
+        signal = buffer[:, 0]
+        for channel in range(1, channels):
+            signal += buffer[:, channel]
+        signal *= np.float32(1.0 / channels)
+    else:
+        signal = buffer.T
+    signal = np.ascontiguousarray(signal)
+
+    return _from_canonical(signal, native_sr, sr, mono)
+
+def _download_and_decode(file_key: str, sr: int | None, mono: bool) -> tuple:
+    canonical = read_sidecar(file_key)
+    if canonical is not None:
+        signal, native_sr = canonical
+        return _from_canonical(signal, native_sr, sr, mono)
+
+    return decode_audio(download_file(file_key), sr=sr, mono=mono)
+
+def load_audio(file_key: str, sr: int | None = None, mono: bool = True) -> tuple:
+    """
+    Returns the decoded ``(signal, sr)`` pair for a stored audio file.
+
+    The canonical PCM sidecar is read when it exists, so compressed formats
+    are not decoded again. The file is downloaded and decoded only once per
+    ``(file_key, sr, mono)``; later calls are served from the shared decoded
+    audio cache. The returned signal is read-only.
+    """
+    cache = get_audio_cache()
+    return cache.get_or_load(
+        (file_key, sr, mono),
+        lambda: _download_and_decode(file_key, sr, mono)
+    )
+
+async def load_audio_async(file_key: str, sr: int | None = None, mono: bool = True) -> tuple:
+    """Runs load_audio in the threadpool so downloads and decodes overlap."""
+    return await run_in_threadpool(load_audio, file_key, sr, mono)
+
+def store_canonical_audio(file_key: str, signal, sr: int) -> None:
+    """
+    Writes the PCM sidecar of an already decoded file and primes the decoded
+    audio cache with its mono version.
+    """
+    write_sidecar(file_key, signal, sr)
+    get_audio_cache().put((file_key, None, True), _from_canonical(signal, sr, None, True))
+
+def ingest_audio(file_key: str) -> None:
+    """
+    Decodes a freshly uploaded file once at its native rate and channel count
+    and stores the result as its canonical PCM sidecar.
+    """
+    try:
+        signal, sr = decode_audio(download_file(file_key), sr=None, mono=False)
+        store_canonical_audio(file_key, signal, sr)
+    except Exception:
+        # The original file is still readable, requests just decode it themselves
+        logger.exception("Could not create the PCM sidecar for %s", file_key)
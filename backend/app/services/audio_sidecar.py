@@ -0,0 +1,89 @@
+"""
+Canonical decoded PCM sidecars for stored audio files.
+
+Every uploaded object ``<key>`` gets a ``<key>.pcm`` sidecar next to it that
+holds the decoded signal at its native sample rate, so that compressed
+formats are decoded once at ingest instead of on every request.
+
+Layout (little-endian):
+    32-byte header: magic b'RWPC', format version (uint16), channels (uint16),
+                    sample rate (uint32), frames (uint64), zero padding
+    payload:        float32 samples, channel-planar (channels x frames)
+"""
+import io
+import mmap
+import struct
+
+from fastapi import HTTPException
+
+from app.services.storage import download_file, upload_file
+
+SIDECAR_SUFFIX = '.pcm'
+SIDECAR_MAGIC = b'RWPC'
+SIDECAR_VERSION = 1
+HEADER_FORMAT = '<4sHHIQ12x'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+def sidecar_key(file_key: str) -> str:
+    return f"{file_key}{SIDECAR_SUFFIX}"
+
+def encode_sidecar(signal, sr: int) -> io.BytesIO:
+    """
+    Serializes a decoded signal, either 1-D (mono) or ``(channels, frames)``.
+    """
+    import numpy as np
+
+    planar = np.atleast_2d(np.asarray(signal, dtype='<f4'))
+    channels, frames = planar.shape
+
+    buffer = io.BytesIO()
+    buffer.write(struct.pack(HEADER_FORMAT, SIDECAR_MAGIC, SIDECAR_VERSION, channels, int(sr), frames))
+    buffer.write(np.ascontiguousarray(planar).data)
+    buffer.seek(0)
+    return buffer
+
+def decode_sidecar(file) -> tuple:
+    """
+    Reads a sidecar and returns ``(signal, sr)``.
+
+    The signal is 1-D for mono files and ``(channels, frames)`` otherwise.
+    Memory-mapped inputs are wrapped without copying the samples.
+    """
+    import numpy as np
+
+    if isinstance(file, io.BytesIO):
+        data = file.getbuffer()
+    elif isinstance(file, mmap.mmap):
+        data = memoryview(file)
+    else:
+        data = file.read()
+
+    if len(data) < HEADER_SIZE:
+        raise ValueError("Truncated audio sidecar.")
+
+    magic, version, channels, sr, frames = struct.unpack_from(HEADER_FORMAT, data)
+    if magic != SIDECAR_MAGIC or version != SIDECAR_VERSION:
+        raise ValueError("Unsupported audio sidecar format.")
+
+    signal = np.frombuffer(data, dtype='<f4', count=channels * frames, offset=HEADER_SIZE)
+    signal = signal.reshape(channels, frames)
+    if channels == 1:
+        signal = signal[0]
+    return signal, int(sr)
+
+def read_sidecar(file_key: str) -> tuple | None:
+    """Returns the decoded ``(signal, sr)`` of a stored file, or None without a sidecar."""
+    try:
+        sidecar_file = download_file(sidecar_key(file_key))
+    except HTTPException as e:
+        if e.status_code == 404:
+            return None
+        raise
+
+    try:
+        return decode_sidecar(sidecar_file)
+    except ValueError:
+        return None
+
+def write_sidecar(file_key: str, signal, sr: int) -> None:
+    upload_file(encode_sidecar(signal, sr), sidecar_key(file_key))
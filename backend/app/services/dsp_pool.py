@@ -0,0 +1,210 @@
+import asyncio
+import threading
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from functools import partial
+
+from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+
+@dataclass(frozen=True)
+class SharedArray:
+    """Picklable reference to a numpy array stored in a shared memory block."""
+    name: str
+    shape: tuple
+    dtype: str
+
+def _attach_shared_memory(name: str):
+    from multiprocessing import shared_memory
+
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 has no ``track`` argument. Spawned workers share the
+        # parent's resource tracker, so registering the block again is a
+        # no-op and the parent remains responsible for unlinking it.
+        return shared_memory.SharedMemory(name=name)
+
+def _run_in_worker(func, args: tuple, kwargs: dict):
+    """Entry point executed inside a worker process."""
+    import numpy as np
+
+    attached = []
+
+    def resolve(value):
+        if isinstance(value, SharedArray):
+            shm = _attach_shared_memory(value.name)
+            attached.append(shm)
+            array = np.ndarray(value.shape, dtype=value.dtype, buffer=shm.buf)
+            array.flags.writeable = False
+            return array
+        return value
+
+    try:
+        resolved_args = tuple(resolve(arg) for arg in args)
+        resolved_kwargs = {key: resolve(value) for key, value in kwargs.items()}
+        result = func(*resolved_args, **resolved_kwargs)
+    finally:
+        resolved_args = resolved_kwargs = None
+        for shm in attached:
+            try:
+                shm.close()
+            except BufferError:
+                # The result still holds a view of the block; the mapping is
+                # released when that view is garbage collected.
+                pass
+    return result
+
+
+class DSPPool:
+    """
+    Bounded process pool for CPU-heavy DSP work.
+
+    Large numpy arguments are handed to the workers through shared memory
+    instead of being pickled. When more than ``max_pending`` jobs are in
+    flight, new submissions are rejected with a 503 so requests do not pile
+    up behind a saturated pool. With ``max_workers == 0`` jobs run in the
+    threadpool instead, which is convenient for development and tests.
+
+    A worker that dies (e.g. killed by the OS for memory) breaks the whole
+    executor; the jobs it held fail with a 503 and the next job starts a
+    new pool.
+    """
+    def __init__(self, max_workers: int, max_pending: int, shared_memory_min_bytes: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.shared_memory_min_bytes = shared_memory_min_bytes
+        self._executor = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+
+                # Worker processes are spawned rather than forked so they do not
+                # inherit the threads and sockets of the server process.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._executor
+
+    def _discard_executor(self, executor) -> None:
+        """Drops a broken executor, unless another job already replaced it."""
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _acquire_slot(self) -> None:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise HTTPException(
+                    status_code=503,
+                    detail="Server is busy processing other analyses. Please retry shortly.",
+                    headers={"Retry-After": "1"}
+                )
+            self._pending += 1
+
+    def _release_slot(self) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def _share(self, value, blocks: list):
+        import numpy as np
+        from multiprocessing import shared_memory
+
+        if not isinstance(value, np.ndarray) or value.nbytes < self.shared_memory_min_bytes:
+            return value
+
+        shm = shared_memory.SharedMemory(create=True, size=value.nbytes)
+        blocks.append(shm)
+        shared = np.ndarray(value.shape, dtype=value.dtype, buffer=shm.buf)
+        shared[...] = value
+        del shared
+        return SharedArray(name=shm.name, shape=value.shape, dtype=value.dtype.str)
+
+    def _release(self, blocks: list) -> None:
+        for shm in blocks:
+            shm.close()
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+        self._release_slot()
+
+    def _worker_died(self, executor) -> HTTPException:
+        self._discard_executor(executor)
+        return HTTPException(
+            status_code=503,
+            detail="An analysis worker stopped unexpectedly. Please retry shortly.",
+            headers={"Retry-After": "1"}
+        )
+
+    async def run(self, func, *args, **kwargs):
+        """Runs ``func(*args, **kwargs)`` in a worker and returns its result."""
+        self._acquire_slot()
+        if self.max_workers == 0:
+            try:
+                return await run_in_threadpool(func, *args, **kwargs)
+            finally:
+                self._release_slot()
+
+        blocks = []
+        executor = None
+        try:
+            shared_args = tuple(self._share(arg, blocks) for arg in args)
+            shared_kwargs = {key: self._share(value, blocks) for key, value in kwargs.items()}
+            executor = self._get_executor()
+            future = executor.submit(partial(_run_in_worker, func, shared_args, shared_kwargs))
+        except BaseException as e:
+            self._release(blocks)
+            if isinstance(e, BrokenProcessPool):
+                raise self._worker_died(executor)
+            raise
+
+        # A cancelled caller (e.g. a client that went away) does not stop a job
+        # a worker already started: the slot and the shared memory are released
+        # when the job itself ends. Registered first, so it runs before the
+        # caller is resumed with the result.
+        future.add_done_callback(lambda _: self._release(blocks))
+        try:
+            return await asyncio.wrap_future(future)
+        except BrokenProcessPool:
+            raise self._worker_died(executor)
+
+    def pending(self) -> int:
+        with self._lock:
+            return self._pending
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_dsp_pool: DSPPool | None = None
+_dsp_pool_lock = threading.Lock()
+
+def get_dsp_pool() -> DSPPool:
+    """Returns the process-wide DSP pool, creating it on first use."""
+    global _dsp_pool
+    if _dsp_pool is None:
+        with _dsp_pool_lock:
+            if _dsp_pool is None:
+                from app.core.config import settings
+                _dsp_pool = DSPPool(
+                    max_workers=settings.DSP_WORKERS,
+                    max_pending=settings.DSP_MAX_PENDING,
+                    shared_memory_min_bytes=settings.DSP_SHARED_MEMORY_MIN_BYTES
+                )
+    return _dsp_pool
+
+async def run_dsp(func, *args, **kwargs):
+    """Runs a DSP function in the shared worker pool."""
+    return await get_dsp_pool().run(func, *args, **kwargs)
@@ -4,15 +4,35 @@ def process_impulse_response(
     ri,
     fs: int,
     filter_type: int,
-    smoothing_window_ms: int
+    smoothing_window_ms: int,
+    band_workers: int | None = None,
+    precision: str | None = None
 ) -> dict:
     """
     Processes an impulse response using the acoustic pipeline.
+
+    ``ri`` is 1-D, or ``(channels x samples)`` to analyse every channel in one
+    pass; ``parameters`` is then a list with the results of each channel.
+
+    ``band_workers`` threads process the bands concurrently (defaults to
+    ``PIPELINE_BAND_WORKERS``; 1 runs the bands serially). Only the
+    parameters are needed here, so the pipeline runs in lean mode.
+    ``precision`` defaults to ``DSP_PRECISION``.
     """
+    from app.core.config import settings
+
+    if band_workers is None:
+        band_workers = settings.PIPELINE_BAND_WORKERS
+    if precision is None:
+        precision = settings.DSP_PRECISION
+
     pipeline = AcousticPipeline(
         fs=fs,
         filter_type=filter_type,
-        smoothing_window_ms=smoothing_window_ms
+        smoothing_window_ms=smoothing_window_ms,
+        max_workers=band_workers,
+        lean=True,
+        precision=precision
     )
 
     pipeline.run(ri)
@@ -1,5 +1,7 @@
 import warnings
 
+VERSION = 1
+
 def calculate_snr(
     ri,
     noise_tail_percentage: float = 0.2
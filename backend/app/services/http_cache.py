@@ -0,0 +1,191 @@
+"""
+Conditional GET support for the analysis endpoints.
+
+Objects under ``uploads/`` get UUID keys and are never rewritten, so an
+analysis response only depends on the file key, the endpoint, its query
+parameters, the algorithm version and the negotiated representation. The
+ETag is derived from those alone, which lets ``If-None-Match`` be answered
+with a 304 before anything is downloaded or computed.
+"""
+import hashlib
+import os
+from typing import BinaryIO
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+from app.core.config import settings
+from app.services.analysis_bundle import cached_view, view_params, view_version
+from app.services.response_encoding import array_response, negotiate_array_dtype, to_json_compatible
+from app.services.result_cache import is_immutable_key, result_cache_key
+
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+# Analysis URLs do not carry the algorithm version, so clients revalidate
+# every time: a version bump changes the ETag and reaches them, while an
+# unchanged result costs a 304
+VIEW_CACHE_CONTROL = 'public, no-cache'
+
+def _accepts_gzip(request: Request) -> bool:
+    return 'gzip' in request.headers.get('accept-encoding', '').lower()
+
+def make_etag(*parts: str) -> str:
+    """Strong ETag built from the parts that determine the response body."""
+    digest = hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()
+    return f'"{digest[:32]}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of ``etag`` against the request's If-None-Match header."""
+    if_none_match = request.headers.get('if-none-match')
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+
+    candidates = (candidate.strip() for candidate in if_none_match.split(','))
+    return any(candidate.removeprefix('W/') == etag for candidate in candidates)
+
+FILE_CHUNK_SIZE = 64 * 1024
+
+def parse_byte_range(range_header: str | None, size: int) -> tuple[int, int] | None:
+    """
+    ``(start, stop)`` of a single ``bytes=`` range over ``size`` bytes, or
+    None to send the whole body: no header, a malformed one, or several
+    ranges. Raises ValueError when the range is not satisfiable.
+    """
+    if not range_header or not range_header.startswith('bytes=') or ',' in range_header:
+        return None
+    first, _, last = range_header[len('bytes='):].strip().partition('-')
+    if not (first or last) or not all(part.isdigit() for part in (first, last) if part):
+        return None
+    if not first:
+        if int(last) == 0:
+            raise ValueError("Empty suffix range")
+        return max(0, size - int(last)), size
+
+    start = int(first)
+    stop = int(last) + 1 if last else size
+    if last and stop <= start:
+        return None
+    if start >= size:
+        raise ValueError("Range starts past the end")
+    return start, min(stop, size)
+
+def file_response(
+    request: Request,
+    file: BinaryIO,
+    media_type: str,
+    filename: str | None = None,
+    headers: dict | None = None
+) -> Response:
+    """
+    Streams an open file, honouring a single-range ``Range`` request (and
+    ``If-Range`` against the ``ETag`` in ``headers``). The response owns the
+    file and closes it, so the file may be unlinked in the meantime.
+    """
+    size = os.fstat(file.fileno()).st_size
+    headers = {**(headers or {}), 'Accept-Ranges': 'bytes'}
+    if filename is not None:
+        headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+
+    byte_range = None
+    if_range = request.headers.get('if-range')
+    if if_range is None or if_range.strip() == headers.get('ETag'):
+        try:
+            byte_range = parse_byte_range(request.headers.get('range'), size)
+        except ValueError:
+            file.close()
+            return Response(status_code=416, headers={'Content-Range': f'bytes */{size}'})
+
+    start, stop = byte_range or (0, size)
+    headers['Content-Length'] = str(stop - start)
+    if byte_range is not None:
+        headers['Content-Range'] = f'bytes {start}-{stop - 1}/{size}'
+
+    def chunks():
+        with file:
+            file.seek(start)
+            remaining = stop - start
+            while remaining > 0:
+                chunk = file.read(min(FILE_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+    return StreamingResponse(
+        chunks(),
+        status_code=206 if byte_range is not None else 200,
+        media_type=media_type,
+        headers=headers
+    )
+
+def _cache_headers(etag: str, vary: str) -> dict:
+    return {
+        'ETag': etag,
+        'Cache-Control': VIEW_CACHE_CONTROL,
+        'Vary': vary
+    }
+
+def view_etag(request: Request, file_key: str, views: list[str], representation: str, **band_settings) -> str:
+    """
+    ETag of one or several views of a file. Whether the client accepts gzip
+    is part of it, as the compressed body differs from the identity one.
+    """
+    keys = [
+        result_cache_key(file_key, view, view_params(view, **band_settings), view_version(view))
+        for view in views
+    ]
+    return make_etag(*keys, representation, 'gzip' if _accepts_gzip(request) else 'identity')
+
+async def view_response(
+    request: Request,
+    file_key: str,
+    views: list[str],
+    compute,
+    arrays: bool = True,
+    **band_settings
+) -> Response:
+    """
+    Renders the result of ``compute()`` for one or several views of a file,
+    answering with a 304 when the client already holds the current version.
+
+    Array payloads are rendered with content negotiation (JSON or binary);
+    set ``arrays=False`` for plain JSON results.
+    """
+    etag = None
+    vary = 'Accept, Accept-Encoding' if arrays else 'Accept-Encoding'
+    if is_immutable_key(file_key):
+        dtype = negotiate_array_dtype(request.headers.get('accept')) if arrays else None
+        etag = view_etag(request, file_key, views, dtype or 'json', **band_settings)
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers=_cache_headers(etag, vary))
+
+    result = await compute()
+
+    if arrays:
+        response = await array_response(request, result)
+    else:
+        response = JSONResponse(to_json_compatible(result))
+
+    if etag is not None:
+        response.headers.update(_cache_headers(etag, vary))
+        if _accepts_gzip(request) and len(response.body) >= settings.GZIP_MIN_SIZE_BYTES:
+            # GZipMiddleware appends Accept-Encoding to the responses it compresses
+            del response.headers['Vary']
+            if arrays:
+                response.headers['Vary'] = 'Accept'
+    return response
+
+async def cached_view_response(
+    request: Request,
+    file_key: str,
+    view: str,
+    compute,
+    arrays: bool = True,
+    **band_settings
+) -> Response:
+    """:func:`view_response` for a single view served from the result cache."""
+    async def compute_cached():
+        return await cached_view(file_key, view, compute, **band_settings)
+
+    return await view_response(request, file_key, [view], compute_cached, arrays=arrays, **band_settings)
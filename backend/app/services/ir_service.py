@@ -0,0 +1,146 @@
+"""
+Impulse-response extraction from recorded sweeps and an inverse filter (or
+a sweep of the registry), shared by ``POST /calculate-ir`` and the
+background job that does the same.
+"""
+import io
+import uuid
+from typing import BinaryIO
+
+from fastapi import HTTPException, UploadFile
+
+from app.core.config import settings
+from app.services.audio_loader import decode_audio, store_canonical_audio
+from app.services.storage import upload_file
+
+def validate_ir_uploads(
+    recorded_sweeps: list[UploadFile],
+    inverse_filter: UploadFile | None,
+    sweep_id: str | None = None
+) -> None:
+    """
+    Rejects requests without exactly one reference (an inverse filter or a
+    sweep ID), with too many recordings, or with files whose content type
+    is not an allowed audio format.
+    """
+    if (inverse_filter is None) == (sweep_id is None):
+        raise HTTPException(status_code=400, detail="Provide either an inverse filter or a sweep ID.")
+    if len(recorded_sweeps) > settings.CALCULATE_IR_MAX_RECORDINGS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.CALCULATE_IR_MAX_RECORDINGS} recorded sweeps can be processed at once."
+        )
+
+    uploads = [("Recorded sweep", upload) for upload in recorded_sweeps]
+    if inverse_filter is not None:
+        uploads.append(("Inverse filter", inverse_filter))
+    for label, upload in uploads:
+        if upload.content_type not in settings.ALLOWED_MIME_TYPES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"{label} file type not allowed. Please upload one of: {', '.join(settings.ALLOWED_MIME_TYPES)}"
+            )
+
+def decode_ir_inputs(
+    recorded_sweeps: list[BinaryIO],
+    inverse_filter: BinaryIO | None = None,
+    sweep_fs: int | None = None
+) -> tuple:
+    """
+    Decodes the recordings and the inverse filter, if any, and returns
+    ``(recordings, inverse_filter, fs)``. Rejects inputs whose sample rates
+    differ, from each other or from ``sweep_fs`` (that of a registered sweep).
+    """
+    decoded = [decode_audio(recorded_sweep) for recorded_sweep in recorded_sweeps]
+    recordings = [audio for audio, _ in decoded]
+    sample_rates = {fs for _, fs in decoded}
+    if len(sample_rates) > 1:
+        raise HTTPException(status_code=400, detail="All recorded sweeps must have the same sample rate.")
+    sweep_rate = decoded[0][1]
+
+    filter_audio = None
+    if inverse_filter is not None:
+        filter_audio, filter_fs = decode_audio(inverse_filter)
+        if sweep_rate != filter_fs:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Sample rates must match. Recorded sweep: {sweep_rate} Hz, Inverse filter: {filter_fs} Hz"
+            )
+    elif sweep_fs is not None and sweep_rate != sweep_fs:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Sample rates must match. Recorded sweep: {sweep_rate} Hz, Sweep: {sweep_fs} Hz"
+        )
+    return recordings, filter_audio, sweep_rate
+
+async def calculate_impulse_responses(
+    recordings: list,
+    fs: int,
+    inverse_filter=None,
+    sweep_id: str | None = None,
+    start_margin_ms: float = 20.0,
+    duration_factor: float = 4.0
+) -> list[dict]:
+    """
+    Extracts and stores the impulse response of each recording, in the DSP
+    pool, against the inverse filter or the registered sweep ``sweep_id``.
+    Returns the ``/calculate-ir`` response of each one.
+    """
+    import asyncio
+    from starlette.concurrency import run_in_threadpool
+
+    from app.services.dsp_pool import run_dsp
+    from app.services.sweep_registry import get_ir_from_sweep
+    from app.utils.signals.signals import get_ir_from_deconvolution
+
+    options = {'start_margin_ms': start_margin_ms, 'duration_factor': duration_factor}
+    if sweep_id is not None:
+        jobs = [run_dsp(get_ir_from_sweep, recording, sweep_id, **options) for recording in recordings]
+    else:
+        jobs = [
+            run_dsp(get_ir_from_deconvolution, recording, inverse_filter, fs, **options)
+            for recording in recordings
+        ]
+    ir_results = await asyncio.gather(*jobs)
+
+    if any(ir_result is None for ir_result in ir_results):
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to calculate IR. Please check your input files."
+        )
+    return [await run_in_threadpool(store_impulse_response, ir_result) for ir_result in ir_results]
+
+def store_impulse_response(ir_result: dict) -> dict:
+    """
+    Uploads an extracted impulse response as a 16-bit WAV together with its
+    canonical PCM sidecar, and returns the ``/calculate-ir`` response.
+    """
+    import soundfile as sf
+
+    wav_buffer = io.BytesIO()
+    sf.write(
+        wav_buffer,
+        ir_result['audio_data'],
+        ir_result['fs'],
+        format='WAV',
+        subtype='PCM_16'
+    )
+    wav_buffer.seek(0)
+
+    unique_filename = f"calculated_ir_{uuid.uuid4()}.wav"
+    file_key = f"uploads/{unique_filename}"
+
+    upload_file(wav_buffer, file_key)
+
+    # The canonical sidecar holds exactly what decoding the 16-bit WAV yields
+    wav_buffer.seek(0)
+    ir_pcm, _ = sf.read(wav_buffer, dtype='float32')
+    store_canonical_audio(file_key, ir_pcm, ir_result['fs'])
+
+    return {
+        "status": "IR calculation successful",
+        "filename": unique_filename,
+        "path": file_key,
+        "sample_rate": ir_result['fs'],
+        "duration_samples": len(ir_result['audio_data'])
+    }
@@ -0,0 +1,55 @@
+import threading
+
+from .base import (
+    CANCELLED,
+    FAILED,
+    FINISHED_STATUSES,
+    QUEUED,
+    RUNNING,
+    SUCCEEDED,
+    Job,
+    JobCancelled,
+    JobQueue
+)
+from .memory_queue import MemoryJobQueue
+from .redis_queue import RedisJobQueue
+from .sqlite_queue import SQLiteJobQueue
+
+_job_queue: JobQueue | None = None
+_job_queue_lock = threading.Lock()
+
+def _build_job_queue() -> JobQueue:
+    from app.core.config import settings
+
+    if settings.JOB_QUEUE_BACKEND == 'memory':
+        return MemoryJobQueue()
+    if settings.JOB_QUEUE_BACKEND == 'sqlite':
+        return SQLiteJobQueue(settings.JOB_QUEUE_SQLITE_PATH)
+    if settings.JOB_QUEUE_BACKEND == 'redis':
+        return RedisJobQueue(settings.JOB_QUEUE_REDIS_URL)
+    raise ValueError(f"Unknown job queue backend '{settings.JOB_QUEUE_BACKEND}'. Use 'memory', 'sqlite' or 'redis'.")
+
+def get_job_queue() -> JobQueue:
+    """Returns the process-wide job queue configured in the settings."""
+    global _job_queue
+    if _job_queue is None:
+        with _job_queue_lock:
+            if _job_queue is None:
+                _job_queue = _build_job_queue()
+    return _job_queue
+
+__all__ = [
+    "QUEUED",
+    "RUNNING",
+    "SUCCEEDED",
+    "FAILED",
+    "CANCELLED",
+    "FINISHED_STATUSES",
+    "Job",
+    "JobCancelled",
+    "JobQueue",
+    "MemoryJobQueue",
+    "SQLiteJobQueue",
+    "RedisJobQueue",
+    "get_job_queue"
+]
@@ -0,0 +1,116 @@
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+
+QUEUED = 'queued'
+RUNNING = 'running'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+FINISHED_STATUSES = (SUCCEEDED, FAILED, CANCELLED)
+
+
+class JobCancelled(Exception):
+    """Raised inside a job handler when its job was cancelled."""
+
+
+@dataclass
+class Job:
+    """
+    A unit of background work. ``params`` and ``result`` must be
+    JSON-serializable, as they may cross process and node boundaries.
+    """
+    kind: str
+    params: dict
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = QUEUED
+    progress: float = 0.0
+    message: str | None = None
+    result: dict | None = None
+    error: str | None = None
+    attempts: int = 0
+    cancel_requested: bool = False
+    worker_id: str | None = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def to_status(self) -> dict:
+        """Public view of the job, without its parameters and result."""
+        status = asdict(self)
+        for key in ('params', 'result', 'worker_id', 'cancel_requested'):
+            del status[key]
+        return status
+
+
+class JobQueue(ABC):
+    """
+    Interface of the queues that hand jobs from the API to the workers.
+
+    Workers ``claim`` the oldest queued job and keep their lease alive with
+    ``heartbeat`` while they run it. A running job whose worker stopped
+    sending heartbeats for ``lease_s`` seconds is handed to another worker,
+    up to ``max_attempts`` runs in total, and fails after that.
+    """
+
+    @abstractmethod
+    def submit(self, kind: str, params: dict) -> Job:
+        pass
+
+    @abstractmethod
+    def get(self, job_id: str) -> Job | None:
+        pass
+
+    @abstractmethod
+    def claim(self, worker_id: str, lease_s: float, max_attempts: int) -> Job | None:
+        """Marks the next runnable job as running for ``worker_id`` and returns it."""
+        pass
+
+    @abstractmethod
+    def heartbeat(
+        self,
+        job_id: str,
+        worker_id: str,
+        progress: float | None = None,
+        message: str | None = None
+    ) -> bool:
+        """
+        Renews the lease of a running job and records its progress. Returns
+        False when the worker should stop: the job was cancelled, or it was
+        handed to another worker.
+        """
+        pass
+
+    @abstractmethod
+    def finish(
+        self,
+        job_id: str,
+        worker_id: str,
+        status: str,
+        result: dict | None = None,
+        error: str | None = None
+    ) -> None:
+        """Stores the outcome of a job, if ``worker_id`` still holds it."""
+        pass
+
+    @abstractmethod
+    def cancel(self, job_id: str) -> Job | None:
+        """
+        Cancels a queued job right away, or asks the worker of a running job
+        to stop. Returns the updated job, or None when it does not exist.
+        """
+        pass
+
+    @abstractmethod
+    def purge(self, max_age_s: float) -> list[Job]:
+        """Removes jobs that finished more than ``max_age_s`` seconds ago and returns them."""
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict:
+        pass
@@ -0,0 +1,103 @@
+import copy
+import threading
+import time
+from collections import Counter
+
+from app.services.jobs.base import CANCELLED, FAILED, QUEUED, RUNNING, Job, JobQueue
+
+class MemoryJobQueue(JobQueue):
+    """
+    Job queue held in the memory of the API process.
+
+    Only workers running inside that process (``JOB_WORKERS``) can see it, and
+    jobs are lost on restart; meant for development and single-node setups.
+    """
+    def __init__(self):
+        self._jobs: dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, kind: str, params: dict) -> Job:
+        job = Job(kind=kind, params=params)
+        with self._lock:
+            self._jobs[job.id] = job
+            return copy.deepcopy(job)
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return copy.deepcopy(job) if job is not None else None
+
+    def claim(self, worker_id: str, lease_s: float, max_attempts: int) -> Job | None:
+        now = time.time()
+        with self._lock:
+            # Dicts keep insertion order, so the first match is the oldest job
+            for job in self._jobs.values():
+                stale = job.status == RUNNING and job.updated_at < now - lease_s
+                if stale and job.attempts >= max_attempts:
+                    job.status, job.error, job.updated_at = FAILED, "The job's worker stopped responding.", now
+                    continue
+                if job.status == QUEUED or stale:
+                    job.status = RUNNING
+                    job.attempts += 1
+                    job.worker_id = worker_id
+                    job.updated_at = now
+                    return copy.deepcopy(job)
+        return None
+
+    def heartbeat(
+        self,
+        job_id: str,
+        worker_id: str,
+        progress: float | None = None,
+        message: str | None = None
+    ) -> bool:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status != RUNNING or job.worker_id != worker_id:
+                return False
+            job.updated_at = time.time()
+            if progress is not None:
+                job.progress = progress
+            if message is not None:
+                job.message = message
+            return not job.cancel_requested
+
+    def finish(
+        self,
+        job_id: str,
+        worker_id: str,
+        status: str,
+        result: dict | None = None,
+        error: str | None = None
+    ) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status != RUNNING or job.worker_id != worker_id:
+                return
+            job.status, job.result, job.error = status, result, error
+            job.updated_at = time.time()
+            if status != CANCELLED and error is None:
+                job.progress = 1.0
+
+    def cancel(self, job_id: str) -> Job | None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            if job.status == QUEUED:
+                job.status = CANCELLED
+                job.updated_at = time.time()
+            elif job.status == RUNNING:
+                job.cancel_requested = True
+            return copy.deepcopy(job)
+
+    def purge(self, max_age_s: float) -> list[Job]:
+        cutoff = time.time() - max_age_s
+        with self._lock:
+            expired = [job_id for job_id, job in self._jobs.items() if job.finished and job.updated_at < cutoff]
+            return [self._jobs.pop(job_id) for job_id in expired]
+
+    def stats(self) -> dict:
+        with self._lock:
+            counts = Counter(job.status for job in self._jobs.values())
+        return {'backend': type(self).__name__, **counts}
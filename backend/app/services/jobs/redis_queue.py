@@ -0,0 +1,197 @@
+import json
+import time
+from dataclasses import asdict
+
+from app.services.jobs.base import CANCELLED, FAILED, QUEUED, RUNNING, Job, JobQueue
+
+class RedisJobQueue(JobQueue):
+    """
+    Job queue stored in Redis, or any server speaking its protocol (Valkey,
+    KeyDB, ...), so workers on other nodes can share it.
+
+    Each job is a JSON string under ``{prefix}:job:{id}``. The ids of queued
+    jobs are kept in a list in submission order, those of running and
+    finished jobs in sorted sets scored by their last update, which is what
+    stale-lease detection and purging look up. State changes run in
+    WATCH/MULTI transactions. Requires the optional ``redis`` package.
+
+    ``client`` replaces the connection to ``url`` with a ready client, e.g. a
+    ``fakeredis`` one in tests; it must decode responses.
+    """
+    def __init__(self, url: str | None = None, prefix: str = 'roomwaves:jobs', client=None):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("The 'redis' job queue backend requires the redis package: pip install redis") from e
+
+        self._client = client if client is not None else redis.Redis.from_url(url, decode_responses=True)
+        self._watch_error = redis.WatchError
+        self.prefix = prefix
+        self._queued_key = f'{prefix}:queued'
+        self._running_key = f'{prefix}:running'
+        self._finished_key = f'{prefix}:finished'
+
+    def _job_key(self, job_id: str) -> str:
+        return f'{self.prefix}:job:{job_id}'
+
+    def _write(self, pipe, job: Job, previous_status: str | None) -> None:
+        pipe.set(self._job_key(job.id), json.dumps(asdict(job)))
+        if previous_status == QUEUED and job.status != QUEUED:
+            pipe.lrem(self._queued_key, 1, job.id)
+        if job.status == RUNNING:
+            pipe.zadd(self._running_key, {job.id: job.updated_at})
+        elif previous_status == RUNNING:
+            pipe.zrem(self._running_key, job.id)
+        if job.finished:
+            pipe.zadd(self._finished_key, {job.id: job.updated_at})
+
+    def _update(self, job_id: str, mutate) -> tuple[Job | None, bool]:
+        """
+        Applies ``mutate(job)`` atomically; it returns False to leave the job
+        untouched. Returns the job and whether it was changed.
+        """
+        key = self._job_key(job_id)
+        with self._client.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(key)
+                    raw = pipe.get(key)
+                    if raw is None:
+                        pipe.unwatch()
+                        return None, False
+
+                    job = Job(**json.loads(raw))
+                    previous_status = job.status
+                    if not mutate(job):
+                        pipe.unwatch()
+                        return job, False
+
+                    pipe.multi()
+                    self._write(pipe, job, previous_status)
+                    pipe.execute()
+                    return job, True
+                except self._watch_error:
+                    # Another client changed the job in between; start over
+                    continue
+
+    def submit(self, kind: str, params: dict) -> Job:
+        job = Job(kind=kind, params=params)
+        with self._client.pipeline() as pipe:
+            pipe.set(self._job_key(job.id), json.dumps(asdict(job)))
+            pipe.rpush(self._queued_key, job.id)
+            pipe.execute()
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        raw = self._client.get(self._job_key(job_id))
+        return Job(**json.loads(raw)) if raw is not None else None
+
+    def claim(self, worker_id: str, lease_s: float, max_attempts: int) -> Job | None:
+        now = time.time()
+
+        def reclaim(job: Job) -> bool:
+            if job.status != RUNNING or job.updated_at >= now - lease_s:
+                return False
+            if job.attempts >= max_attempts:
+                job.status, job.error = FAILED, "The job's worker stopped responding."
+            else:
+                job.attempts += 1
+                job.worker_id = worker_id
+            job.updated_at = now
+            return True
+
+        for job_id in self._client.zrangebyscore(self._running_key, '-inf', now - lease_s):
+            job, changed = self._update(job_id, reclaim)
+            if changed and job.status == RUNNING:
+                return job
+
+        def start(job: Job) -> bool:
+            if job.status != QUEUED:
+                return False
+            job.status = RUNNING
+            job.attempts += 1
+            job.worker_id = worker_id
+            job.updated_at = now
+            return True
+
+        while (job_id := self._client.lindex(self._queued_key, 0)) is not None:
+            job, changed = self._update(job_id, start)
+            if changed:
+                return job
+            if job is None or job.status != QUEUED:
+                # Left behind by a purge or taken by another worker
+                self._client.lrem(self._queued_key, 1, job_id)
+        return None
+
+    def heartbeat(
+        self,
+        job_id: str,
+        worker_id: str,
+        progress: float | None = None,
+        message: str | None = None
+    ) -> bool:
+        def renew(job: Job) -> bool:
+            if job.status != RUNNING or job.worker_id != worker_id:
+                return False
+            job.updated_at = time.time()
+            if progress is not None:
+                job.progress = progress
+            if message is not None:
+                job.message = message
+            return True
+
+        job, changed = self._update(job_id, renew)
+        return changed and not job.cancel_requested
+
+    def finish(
+        self,
+        job_id: str,
+        worker_id: str,
+        status: str,
+        result: dict | None = None,
+        error: str | None = None
+    ) -> None:
+        def complete(job: Job) -> bool:
+            if job.status != RUNNING or job.worker_id != worker_id:
+                return False
+            job.status, job.result, job.error = status, result, error
+            job.updated_at = time.time()
+            if status != CANCELLED and error is None:
+                job.progress = 1.0
+            return True
+
+        self._update(job_id, complete)
+
+    def cancel(self, job_id: str) -> Job | None:
+        def request_cancel(job: Job) -> bool:
+            if job.status == QUEUED:
+                job.status = CANCELLED
+                job.updated_at = time.time()
+                return True
+            if job.status == RUNNING and not job.cancel_requested:
+                job.cancel_requested = True
+                return True
+            return False
+
+        job, _ = self._update(job_id, request_cancel)
+        return job
+
+    def purge(self, max_age_s: float) -> list[Job]:
+        expired = self._client.zrangebyscore(self._finished_key, '-inf', time.time() - max_age_s)
+        if not expired:
+            return []
+        keys = [self._job_key(job_id) for job_id in expired]
+        with self._client.pipeline() as pipe:
+            pipe.mget(keys)
+            pipe.delete(*keys)
+            pipe.zrem(self._finished_key, *expired)
+            raw_jobs, _, _ = pipe.execute()
+        return [Job(**json.loads(raw)) for raw in raw_jobs if raw is not None]
+
+    def stats(self) -> dict:
+        return {
+            'backend': type(self).__name__,
+            QUEUED: self._client.llen(self._queued_key),
+            RUNNING: self._client.zcard(self._running_key),
+            'finished': self._client.zcard(self._finished_key)
+        }
@@ -0,0 +1,180 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from app.services.jobs.base import CANCELLED, FAILED, FINISHED_STATUSES, QUEUED, RUNNING, Job, JobQueue
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id               TEXT PRIMARY KEY,
+    kind             TEXT NOT NULL,
+    params           TEXT NOT NULL,
+    status           TEXT NOT NULL,
+    progress         REAL NOT NULL,
+    message          TEXT,
+    result           TEXT,
+    error            TEXT,
+    attempts         INTEGER NOT NULL,
+    cancel_requested INTEGER NOT NULL,
+    worker_id        TEXT,
+    created_at       REAL NOT NULL,
+    updated_at       REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at);
+"""
+
+_COLUMNS = (
+    'id', 'kind', 'params', 'status', 'progress', 'message', 'result', 'error',
+    'attempts', 'cancel_requested', 'worker_id', 'created_at', 'updated_at'
+)
+
+def _to_row(job: Job) -> tuple:
+    return (
+        job.id, job.kind, json.dumps(job.params), job.status, job.progress, job.message,
+        json.dumps(job.result) if job.result is not None else None, job.error,
+        job.attempts, int(job.cancel_requested), job.worker_id, job.created_at, job.updated_at
+    )
+
+def _from_row(row: tuple) -> Job:
+    values = dict(zip(_COLUMNS, row))
+    values['params'] = json.loads(values['params'])
+    values['result'] = json.loads(values['result']) if values['result'] is not None else None
+    values['cancel_requested'] = bool(values['cancel_requested'])
+    return Job(**values)
+
+class SQLiteJobQueue(JobQueue):
+    """
+    Job queue stored in a SQLite database.
+
+    Every process that opens the same database file (the API and any number
+    of ``python -m app.services.jobs.worker`` processes on the node) shares
+    the queue; claims run in ``BEGIN IMMEDIATE`` transactions so a job is
+    handed to a single worker.
+    """
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._lock = threading.Lock()
+        # Autocommit mode: write transactions are opened explicitly below
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, timeout=30, isolation_level=None)
+        with self._lock:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.executescript(_SCHEMA)
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                yield self._connection
+            except BaseException:
+                self._connection.execute('ROLLBACK')
+                raise
+            self._connection.execute('COMMIT')
+
+    def _select(self, connection, job_id: str) -> Job | None:
+        row = connection.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        return _from_row(row) if row is not None else None
+
+    def submit(self, kind: str, params: dict) -> Job:
+        job = Job(kind=kind, params=params)
+        with self._transaction() as connection:
+            connection.execute(f"INSERT INTO jobs VALUES ({', '.join('?' * len(_COLUMNS))})", _to_row(job))
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            return self._select(self._connection, job_id)
+
+    def claim(self, worker_id: str, lease_s: float, max_attempts: int) -> Job | None:
+        now = time.time()
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE jobs SET status = ?, error = ?, updated_at = ? "
+                "WHERE status = ? AND updated_at < ? AND attempts >= ?",
+                (FAILED, "The job's worker stopped responding.", now, RUNNING, now - lease_s, max_attempts)
+            )
+            row = connection.execute(
+                "SELECT id FROM jobs WHERE status = ? OR (status = ? AND updated_at < ?) "
+                "ORDER BY created_at LIMIT 1",
+                (QUEUED, RUNNING, now - lease_s)
+            ).fetchone()
+            if row is None:
+                return None
+
+            connection.execute(
+                "UPDATE jobs SET status = ?, attempts = attempts + 1, worker_id = ?, updated_at = ? WHERE id = ?",
+                (RUNNING, worker_id, now, row[0])
+            )
+            return self._select(connection, row[0])
+
+    def heartbeat(
+        self,
+        job_id: str,
+        worker_id: str,
+        progress: float | None = None,
+        message: str | None = None
+    ) -> bool:
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET updated_at = ?, progress = COALESCE(?, progress), message = COALESCE(?, message) "
+                "WHERE id = ? AND status = ? AND worker_id = ?",
+                (time.time(), progress, message, job_id, RUNNING, worker_id)
+            )
+            if cursor.rowcount == 0:
+                return False
+            (cancel_requested,) = connection.execute(
+                "SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            return not cancel_requested
+
+    def finish(
+        self,
+        job_id: str,
+        worker_id: str,
+        status: str,
+        result: dict | None = None,
+        error: str | None = None
+    ) -> None:
+        succeeded = status != CANCELLED and error is None
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, updated_at = ?, "
+                "progress = CASE WHEN ? THEN 1.0 ELSE progress END "
+                "WHERE id = ? AND status = ? AND worker_id = ?",
+                (
+                    status, json.dumps(result) if result is not None else None, error, time.time(),
+                    succeeded, job_id, RUNNING, worker_id
+                )
+            )
+
+    def cancel(self, job_id: str) -> Job | None:
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE id = ? AND status = ?",
+                (CANCELLED, time.time(), job_id, QUEUED)
+            )
+            connection.execute(
+                "UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = ?",
+                (job_id, RUNNING)
+            )
+            return self._select(connection, job_id)
+
+    def purge(self, max_age_s: float) -> list[Job]:
+        with self._transaction() as connection:
+            rows = connection.execute(
+                f"DELETE FROM jobs WHERE status IN ({', '.join('?' * len(FINISHED_STATUSES))}) AND updated_at < ? "
+                f"RETURNING {', '.join(_COLUMNS)}",
+                (*FINISHED_STATUSES, time.time() - max_age_s)
+            ).fetchall()
+            return [_from_row(row) for row in rows]
+
+    def stats(self) -> dict:
+        with self._lock:
+            rows = self._connection.execute('SELECT status, COUNT(*) FROM jobs GROUP BY status').fetchall()
+        return {'backend': type(self).__name__, **dict(rows)}
@@ -0,0 +1,97 @@
+"""
+Handlers of the background job kinds.
+
+A handler receives the job's ``params`` and a ``progress(fraction, message)``
+callback, and returns the JSON-serializable result of the job. The callback
+raises :class:`JobCancelled` once the job was cancelled, so handlers call it
+between their stages.
+
+Files uploaded for a job live under ``JOB_INPUTS_PREFIX`` and are deleted by
+:func:`delete_job_inputs` once the job is finished.
+"""
+import logging
+
+from app.services.storage import download_file
+
+logger = logging.getLogger(__name__)
+
+JOB_INPUTS_PREFIX = 'jobs/inputs/'
+
+def delete_job_inputs(job) -> None:
+    """Deletes the uploaded inputs of a finished job, logging failures."""
+    from app.services.storage import delete_file
+
+    for value in job.params.values():
+        if isinstance(value, str) and value.startswith(JOB_INPUTS_PREFIX):
+            try:
+                delete_file(value)
+            except Exception:
+                logger.exception("Failed to delete input %s of job %s", value, job.id)
+
+def calculate_ir(params: dict, progress) -> dict:
+    """Same as ``POST /calculate-ir``, reading the inputs from storage."""
+    from fastapi import HTTPException
+
+    from app.services.ir_service import decode_ir_inputs, store_impulse_response
+    from app.services.sweep_registry import get_ir_from_sweep, parse_sweep_id
+    from app.utils.signals.signals import get_ir_from_deconvolution
+
+    sweep_id = params.get('sweep_id')
+    progress(0.0, "Decoding the recorded sweep and inverse filter")
+    if sweep_id is not None:
+        recordings, _, fs = decode_ir_inputs(
+            [download_file(params['recorded_sweep_key'])],
+            sweep_fs=parse_sweep_id(sweep_id)[3]
+        )
+    else:
+        recordings, filter_audio, fs = decode_ir_inputs(
+            [download_file(params['recorded_sweep_key'])],
+            download_file(params['inverse_filter_key'])
+        )
+
+    progress(0.3, "Deconvolving the impulse response")
+    options = {'start_margin_ms': params['start_margin_ms'], 'duration_factor': params['duration_factor']}
+    if sweep_id is not None:
+        ir_result = get_ir_from_sweep(recordings[0], sweep_id, **options)
+    else:
+        ir_result = get_ir_from_deconvolution(recordings[0], filter_audio, fs, **options)
+    if ir_result is None:
+        raise HTTPException(status_code=500, detail="Failed to calculate IR. Please check your input files.")
+
+    progress(0.8, "Storing the impulse response")
+    return store_impulse_response(ir_result)
+
+def parameters(params: dict, progress) -> dict:
+    """Same as ``GET /parameters``, sharing its result cache entries."""
+    from app.services.analysis_bundle import view_params, view_version
+    from app.services.audio_loader import load_audio
+    from app.services.get_parameters import process_impulse_response
+    from app.services.response_encoding import to_json_compatible
+    from app.services.result_cache import result_cache_for
+
+    file_key, bands, multichannel = params['file_key'], params['bands'], params['multichannel']
+    cache_entry = (
+        file_key,
+        'parameters',
+        view_params('parameters', parameter_bands=bands, multichannel=multichannel),
+        view_version('parameters')
+    )
+    cache = result_cache_for(file_key)
+    if cache is not None and (result := cache.get(*cache_entry)) is not None:
+        return result
+
+    progress(0.0, "Loading the audio file")
+    y, fs = load_audio(file_key, mono=not multichannel)
+    if multichannel and y.ndim == 1:
+        y = y.reshape(1, -1)
+
+    progress(0.2, "Computing the acoustic parameters")
+    result = to_json_compatible(process_impulse_response(ri=y, fs=fs, filter_type=bands, smoothing_window_ms=10))
+    if cache is not None:
+        cache.put(*cache_entry, result)
+    return result
+
+JOB_HANDLERS = {
+    'calculate_ir': calculate_ir,
+    'parameters': parameters
+}
@@ -0,0 +1,224 @@
+"""
+Workers that run the background jobs.
+
+The API process runs ``JOB_WORKERS`` of them in threads. More can run in
+separate processes, on this node or on others sharing the queue:
+
+    JOB_QUEUE_BACKEND=sqlite python -m app.services.jobs.worker --concurrency 2
+"""
+import argparse
+import logging
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+import uuid
+
+from fastapi import HTTPException
+
+from app.services.jobs.base import CANCELLED, FAILED, SUCCEEDED, Job, JobCancelled, JobQueue
+
+logger = logging.getLogger(__name__)
+
+PURGE_INTERVAL_S = 300.0
+
+class JobWorker:
+    """
+    Claims jobs from a queue and runs them in ``concurrency`` threads.
+
+    A maintenance thread renews the lease of the running jobs every third of
+    ``lease_s``, so handlers do not have to report progress to keep their
+    job, and purges the jobs that finished more than ``retention_s`` ago.
+    ``cleanup(job)`` runs once a job is finished, and again when it is
+    purged, so jobs that failed or were cancelled elsewhere are covered too.
+    """
+    def __init__(
+        self,
+        queue: JobQueue,
+        concurrency: int = 1,
+        poll_interval_s: float = 0.5,
+        lease_s: float = 60.0,
+        max_attempts: int = 2,
+        retention_s: float = 86400.0,
+        worker_id: str | None = None,
+        handlers: dict | None = None,
+        cleanup=None
+    ):
+        if handlers is None:
+            from app.services.jobs.tasks import JOB_HANDLERS
+            handlers = JOB_HANDLERS
+        if cleanup is None:
+            from app.services.jobs.tasks import delete_job_inputs
+            cleanup = delete_job_inputs
+
+        self.queue = queue
+        self.concurrency = concurrency
+        self.poll_interval_s = poll_interval_s
+        self.lease_s = lease_s
+        self.max_attempts = max_attempts
+        self.retention_s = retention_s
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.handlers = handlers
+        self.cleanup = cleanup
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._active: set[str] = set()
+        self._revoked: set[str] = set()
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._run_loop, name=f"job-worker-{i}", daemon=True)
+            for i in range(self.concurrency)
+        ]
+        self._threads.append(threading.Thread(target=self._maintenance_loop, name="job-maintenance", daemon=True))
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        Stops claiming jobs and waits up to ``timeout`` seconds for the
+        running ones. Jobs left running are retried by another worker once
+        their lease expires.
+        """
+        self.request_stop()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        self._threads = []
+
+    def request_stop(self) -> None:
+        """Asks the worker to stop, without waiting; safe in signal handlers."""
+        self._stop.set()
+
+    def wait(self) -> None:
+        """Blocks until the worker is asked to stop."""
+        self._stop.wait()
+
+    def run_one(self) -> Job | None:
+        """Claims and runs a single job. Returns the job, or None when the queue is empty."""
+        job = self.queue.claim(self.worker_id, self.lease_s, self.max_attempts)
+        if job is not None:
+            self._run_job(job)
+        return job
+
+    def _run_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                job = self.run_one()
+            except Exception:
+                logger.exception("Job worker %s failed to claim a job", self.worker_id)
+                job = None
+            if job is None:
+                self._stop.wait(self.poll_interval_s)
+
+    def _maintenance_loop(self) -> None:
+        next_purge = 0.0
+        while not self._stop.wait(self.lease_s / 3):
+            with self._lock:
+                active = list(self._active)
+            for job_id in active:
+                try:
+                    if not self.queue.heartbeat(job_id, self.worker_id):
+                        with self._lock:
+                            self._revoked.add(job_id)
+                except Exception:
+                    logger.exception("Failed to renew the lease of job %s", job_id)
+
+            if time.monotonic() >= next_purge:
+                next_purge = time.monotonic() + PURGE_INTERVAL_S
+                try:
+                    purged = self.queue.purge(self.retention_s)
+                except Exception:
+                    logger.exception("Failed to purge finished jobs")
+                    purged = []
+                for job in purged:
+                    self._cleanup(job)
+
+    def _cleanup(self, job: Job) -> None:
+        try:
+            self.cleanup(job)
+        except Exception:
+            logger.exception("Failed to clean up job %s", job.id)
+
+    def _run_job(self, job: Job) -> None:
+        try:
+            self._execute(job)
+        finally:
+            # A job handed to another worker in the meantime still needs its inputs
+            current = self.queue.get(job.id)
+            if current is None or current.finished:
+                self._cleanup(job)
+
+    def _execute(self, job: Job) -> None:
+        handler = self.handlers.get(job.kind)
+        if handler is None:
+            self.queue.finish(job.id, self.worker_id, FAILED, error=f"Unknown job kind '{job.kind}'.")
+            return
+
+        def progress(fraction: float, message: str | None = None) -> None:
+            with self._lock:
+                revoked = job.id in self._revoked
+            if revoked or not self.queue.heartbeat(job.id, self.worker_id, fraction, message):
+                raise JobCancelled(job.id)
+
+        with self._lock:
+            self._active.add(job.id)
+        try:
+            result = handler(job.params, progress)
+        except JobCancelled:
+            self.queue.finish(job.id, self.worker_id, CANCELLED)
+        except HTTPException as e:
+            self.queue.finish(job.id, self.worker_id, FAILED, error=str(e.detail))
+        except Exception as e:
+            logger.exception("Job %s (%s) failed", job.id, job.kind)
+            self.queue.finish(job.id, self.worker_id, FAILED, error=f"Error processing job: {e}")
+        else:
+            self.queue.finish(job.id, self.worker_id, SUCCEEDED, result=result)
+        finally:
+            with self._lock:
+                self._active.discard(job.id)
+                self._revoked.discard(job.id)
+
+def create_worker(concurrency: int, queue: JobQueue | None = None) -> JobWorker:
+    """Builds a worker for the configured job queue and settings."""
+    from app.core.config import settings
+    from app.services.jobs import get_job_queue
+
+    return JobWorker(
+        queue if queue is not None else get_job_queue(),
+        concurrency=concurrency,
+        poll_interval_s=settings.JOB_POLL_INTERVAL_S,
+        lease_s=settings.JOB_LEASE_S,
+        max_attempts=settings.JOB_MAX_ATTEMPTS,
+        retention_s=settings.JOB_RETENTION_S
+    )
+
+def main(argv: list[str] | None = None) -> int:
+    from app.core.config import settings
+
+    parser = argparse.ArgumentParser(description="Runs RoomWaves background jobs.")
+    parser.add_argument('--concurrency', type=int, default=1, help="Jobs run at once (default: 1)")
+    args = parser.parse_args(argv)
+
+    if settings.JOB_QUEUE_BACKEND == 'memory':
+        print("The memory job queue only lives inside the API process; "
+              "set JOB_QUEUE_BACKEND to 'sqlite' or 'redis'.", file=sys.stderr)
+        return 1
+
+    logging.basicConfig(level=logging.INFO)
+    worker = create_worker(args.concurrency)
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: worker.request_stop())
+
+    logger.info("Job worker %s polling the %s queue", worker.worker_id, settings.JOB_QUEUE_BACKEND)
+    worker.start()
+    worker.wait()
+    worker.stop()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
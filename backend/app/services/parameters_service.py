@@ -0,0 +1,94 @@
+"""
+Acoustic parameters of stored files, one at a time or as a streamed batch.
+"""
+import asyncio
+import json
+import logging
+
+from fastapi import HTTPException
+
+from app.services.analysis_bundle import cached_view
+from app.services.audio_loader import load_audio_async
+from app.services.dsp_pool import run_dsp
+from app.services.get_parameters import process_impulse_response
+from app.services.response_encoding import to_json_compatible
+
+logger = logging.getLogger(__name__)
+
+NDJSON_MEDIA_TYPE = 'application/x-ndjson'
+
+async def compute_parameters(file_key: str, bands: int, multichannel: bool = False) -> dict:
+    """Loads a stored file and runs the parameters pipeline in the DSP pool."""
+    y, fs = await load_audio_async(file_key, mono=not multichannel)
+    if multichannel and y.ndim == 1:
+        y = y.reshape(1, -1)
+
+    return await run_dsp(
+        process_impulse_response,
+        ri=y,
+        fs=fs,
+        filter_type=bands,
+        smoothing_window_ms=10
+    )
+
+async def _batch_entry(file_key: str, bands: int, multichannel: bool) -> dict:
+    try:
+        result = await cached_view(
+            file_key,
+            'parameters',
+            lambda: compute_parameters(file_key, bands, multichannel),
+            parameter_bands=bands,
+            multichannel=multichannel
+        )
+        return {'file': file_key, 'status': 200, **result}
+    except HTTPException as e:
+        return {'file': file_key, 'status': e.status_code, 'error': e.detail}
+    except Exception:
+        logger.exception("Failed to compute the parameters of %s", file_key)
+        return {'file': file_key, 'status': 500, 'error': "Failed to compute the acoustic parameters."}
+
+def _ndjson_line(entry: dict) -> str:
+    try:
+        # Same rules as JSONResponse, so a line is always valid JSON
+        return json.dumps(to_json_compatible(entry), allow_nan=False) + '\n'
+    except ValueError:
+        entry = {
+            'index': entry.get('index'),
+            'file': entry['file'],
+            'status': 500,
+            'error': "The result is not JSON-serializable."
+        }
+        return json.dumps(entry) + '\n'
+
+async def stream_parameters_batch(
+    file_keys: list[str],
+    bands: int,
+    multichannel: bool = False,
+    concurrency: int | None = None
+):
+    """
+    Computes the parameters of several files and yields one NDJSON line per
+    file as soon as it is ready, in completion order.
+
+    At most ``concurrency`` files (defaults to ``PARAMETERS_BATCH_CONCURRENCY``)
+    are downloaded, decoded and analysed at once. Each line holds ``index``
+    (position in ``file_keys``), ``file`` and ``status``, plus either the
+    ``parameters`` of the file (as in ``GET /parameters``) or an ``error``.
+    Files still pending are cancelled when the client goes away.
+    """
+    if concurrency is None:
+        from app.core.config import settings
+        concurrency = settings.PARAMETERS_BATCH_CONCURRENCY
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(index: int, file_key: str) -> dict:
+        async with semaphore:
+            return {'index': index, **await _batch_entry(file_key, bands, multichannel)}
+
+    tasks = [asyncio.create_task(run(index, file_key)) for index, file_key in enumerate(file_keys)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield _ndjson_line(await next_done)
+    finally:
+        for task in tasks:
+            task.cancel()
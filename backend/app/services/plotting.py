@@ -1,47 +1,57 @@
 from app.utils.graph import get_waveform_data, get_spectrogram_data, get_frequency_data, get_csd_data, get_envelope_db_data
 from app.utils.pipeline.processor import DecayAnalyzer, EnvelopeSmoother
 
-def plot_waveform(signal, sr: int, num_points: int = 2000) -> dict[str, list[object]]:
+def _precision(precision: str | None) -> str:
+    """Defaults to the ``DSP_PRECISION`` setting."""
+    if precision is None:
+        from app.core.config import settings
+        precision = settings.DSP_PRECISION
+    return precision
+
+def plot_waveform(signal, sr: int, num_points: int = 2000) -> dict:
     return get_waveform_data(signal, sr, num_points)
 
-def plot_envelope_db(signal, sr: int, num_points: int = 2000) -> dict[str, list[object]]:
-    return get_envelope_db_data(signal, sr, num_points)
+def plot_envelope_db(signal, sr: int, num_points: int = 2000, precision: str | None = None) -> dict:
+    return get_envelope_db_data(signal, sr, num_points, precision=_precision(precision))
 
-def plot_frequency_response(signal, sr: int, bands_per_oct: int) -> dict:
-    return get_frequency_data(signal, sr, bands_per_oct)
+def plot_frequency_response(signal, sr: int, bands_per_oct: int, precision: str | None = None) -> dict:
+    return get_frequency_data(signal, sr, bands_per_oct, precision=_precision(precision))
 
-def plot_spectrogram(signal, sr: int) -> dict:
+def find_truncation_index(signal, sr: int, precision: str | None = None) -> int:
     """
-    Creates a spectrogram from a signal, intelligently truncating it first
-    by analyzing its energy decay curve.
+    Finds where an impulse response's decay meets the noise floor.
 
-    This function implements a processing pipeline:
     1.  Calculates the smoothed energy envelope of the whole signal.
     2.  Uses the Lundeby algorithm to find the point where the signal's decay
         meets the noise floor (the crossover point).
-    3.  Truncates the original signal at this crossover point.
-    4.  Generates the spectrogram only for the acoustically relevant part of the signal.
+
+    Returns the crossover index, or the signal length when the signal is too
+    short (under 100 ms) or no valid crossover is found.
     """
-    # If the signal is too short to be processed, return an empty spectrogram
-    if len(signal) < sr * 0.1:  # Example: require at least 100ms
-        return get_spectrogram_data(signal, sr)
+    import numpy as np
+
+    if len(signal) < sr * 0.1:
+        return len(signal)
 
     # --- 1. SETUP THE PROCESSING PIPELINE ---
-    smoother = EnvelopeSmoother(fs=sr)
-    decay_analyzer = DecayAnalyzer(fs=sr)
+    precision = _precision(precision)
+    smoother = EnvelopeSmoother(fs=sr, precision=precision)
+    decay_analyzer = DecayAnalyzer(fs=sr, precision=precision)
 
     # --- 2. PREPARE DATA FOR THE PIPELINE ---
-    pipeline_data = {'filtered_signals': {'broadband': signal}}
+    pipeline_data = {
+        'band_frequencies': ['broadband'],
+        'filtered_signals': np.atleast_2d(np.asarray(signal, dtype=precision))
+    }
 
     # --- 3. EXECUTE THE PIPELINE ---
     try:
         pipeline_data = smoother.process(pipeline_data)
 
-        pipeline_data = decay_analyzer._lundeby_crossover(pipeline_data['envelopes']['broadband'])
+        pipeline_data = decay_analyzer._lundeby_crossover(pipeline_data['envelopes'][0])
 
     except Exception:
-        return get_spectrogram_data(signal, sr)
-
+        return len(signal)
 
     # --- 4. EXTRACT THE TRUNCATION POINT ---
     try:
@@ -53,59 +63,42 @@ def plot_spectrogram(signal, sr: int) -> dict:
     except (KeyError, IndexError):
         crossover_index = len(signal)
 
-    # --- 5. TRUNCATE SIGNAL AND GENERATE SPECTROGRAM ---
-    truncated_signal = signal[:crossover_index]
+    return crossover_index
 
-    return get_spectrogram_data(truncated_signal, sr)
+def plot_spectrogram(
+    signal,
+    sr: int,
+    truncation_index: int | None = None,
+    precision: str | None = None
+) -> dict:
+    """
+    Creates a spectrogram from a signal, intelligently truncating it first
+    at the crossover point of its energy decay curve (see find_truncation_index),
+    so it only covers the acoustically relevant part of the signal.
 
-def plot_csd(signal, sr: int, bands_per_oct: int) -> dict:
+    A precomputed ``truncation_index`` can be passed to skip the decay analysis.
     """
-    Creates a Cumulative Spectral Decay (CSD) plot from a signal.
+    precision = _precision(precision)
+    if truncation_index is None:
+        truncation_index = find_truncation_index(signal, sr, precision)
+
+    return get_spectrogram_data(signal[:truncation_index], sr, precision=precision)
+
+def plot_csd(
+    signal,
+    sr: int,
+    bands_per_oct: int,
+    truncation_index: int | None = None,
+    precision: str | None = None
+) -> dict:
     """
-    if len(signal) < sr * 0.1:  
-        return get_csd_data(signal, sr, bands_per_oct=bands_per_oct)
-
-    # If the signal is too short to be processed, return an empty CSD
-    if len(signal) < sr * 0.1:  # Example: require at least 100ms
-        return get_csd_data(signal, sr, bands_per_oct=bands_per_oct)
-
-    # --- 1. SETUP THE PROCESSING PIPELINE ---
-    smoother = EnvelopeSmoother(fs=sr)
-    decay_analyzer = DecayAnalyzer(fs=sr)
-
-    # --- 2. PREPARE DATA FOR THE PIPELINE ---
-    pipeline_data = {'filtered_signals': {'broadband': signal}}
-
-    # --- 3. EXECUTE THE PIPELINE ---
-
-    # --- 1. SETUP THE PROCESSING PIPELINE ---
-    smoother = EnvelopeSmoother(fs=sr)
-    decay_analyzer = DecayAnalyzer(fs=sr)
-
-    # --- 2. PREPARE DATA FOR THE PIPELINE ---
-    pipeline_data = {'filtered_signals': {'broadband': signal}}
-
-    # --- 3. EXECUTE THE PIPELINE ---
-    try:
-        pipeline_data = smoother.process(pipeline_data)
-
-        pipeline_data = decay_analyzer._lundeby_crossover(pipeline_data['envelopes']['broadband'])
-
-    except Exception:
-        return get_csd_data(signal, sr, bands_per_oct=bands_per_oct)
-
-
-    # --- 4. EXTRACT THE TRUNCATION POINT ---
-    try:
-        crossover_index = pipeline_data['crossover_index']
-
-        if not (0 < crossover_index <= len(signal)):
-            crossover_index = len(signal)
+    Creates a Cumulative Spectral Decay (CSD) plot from a signal truncated
+    at the crossover point of its energy decay curve (see find_truncation_index).
 
-    except (KeyError, IndexError):
-        crossover_index = len(signal)
-
-    # --- 5. TRUNCATE SIGNAL AND GENERATE CSD ---
-    truncated_signal = signal[:crossover_index]
+    A precomputed ``truncation_index`` can be passed to skip the decay analysis.
+    """
+    precision = _precision(precision)
+    if truncation_index is None:
+        truncation_index = find_truncation_index(signal, sr, precision)
 
-    return get_csd_data(truncated_signal, sr, bands_per_oct=bands_per_oct)
\ No newline at end of file
+    return get_csd_data(signal[:truncation_index], sr, bands_per_oct=bands_per_oct, precision=precision)
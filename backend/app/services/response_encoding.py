@@ -0,0 +1,165 @@
+"""
+Response encodings for array-heavy payloads (plots, spectrograms, CSD).
+
+JSON stays the default. Clients can opt into a compact binary encoding by
+sending ``Accept: application/x-roomwaves-arrays``, optionally with a
+``dtype=float16`` parameter to halve the size of the value arrays again.
+
+Binary layout (little-endian):
+    header length (uint32)
+    header:  UTF-8 JSON, padded with spaces to an 8-byte boundary
+             {"version": 1,
+              "metadata": <payload with every array removed>,
+              "arrays": [{"name", "dtype", "shape", "offset", "nbytes"}, ...]}
+    data:    the raw arrays, each starting on an 8-byte boundary; ``offset``
+             is relative to the start of the data section and ``name`` is the
+             dotted path of the array in the payload (e.g. ``spectrogram.Sxx``)
+
+Axis arrays (time and frequency labels) are always sent as float32, as
+float16 cannot represent them precisely enough.
+"""
+import json
+import struct
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+from starlette.concurrency import run_in_threadpool
+
+ARRAY_MEDIA_TYPE = 'application/x-roomwaves-arrays'
+ARRAY_FORMAT_VERSION = 1
+ARRAY_DTYPES = {'float32': '<f4', 'float16': '<f2'}
+AXIS_KEYS = frozenset({'labels', 'f', 't', 'frequencies'})
+
+_ALIGNMENT = 8
+
+# Placeholder returned while stripping arrays out of the metadata
+_ARRAY = object()
+
+def _padding(size: int) -> int:
+    return -size % _ALIGNMENT
+
+def negotiate_array_dtype(accept: str | None) -> str | None:
+    """
+    Returns the requested binary dtype (``'float32'`` or ``'float16'``) when
+    the Accept header asks for the binary encoding, or None for JSON.
+    """
+    if not accept:
+        return None
+
+    for media_range in accept.split(','):
+        media_type, *params = (part.strip() for part in media_range.split(';'))
+        if media_type.lower() != ARRAY_MEDIA_TYPE:
+            continue
+
+        options = dict(
+            (name.strip().lower(), value.strip().strip('"').lower())
+            for name, _, value in (param.partition('=') for param in params)
+        )
+        try:
+            if float(options.get('q', 1)) == 0:
+                return None
+        except ValueError:
+            pass
+        dtype = options.get('dtype', 'float32')
+        return dtype if dtype in ARRAY_DTYPES else 'float32'
+    return None
+
+def to_json_compatible(payload):
+    """Recursively converts arrays and numpy scalars to plain Python values."""
+    import numpy as np
+
+    if isinstance(payload, dict):
+        return {key: to_json_compatible(value) for key, value in payload.items()}
+    if isinstance(payload, (list, tuple)):
+        return [to_json_compatible(value) for value in payload]
+    if isinstance(payload, (np.ndarray, np.generic)):
+        return payload.tolist()
+    return payload
+
+def encode_arrays(payload: dict, dtype: str = 'float32') -> bytes:
+    """Serializes a payload into the binary array format described above."""
+    import numpy as np
+
+    arrays = []
+    chunks = []
+    offset = 0
+
+    def strip_arrays(value, path: str):
+        nonlocal offset
+        if isinstance(value, dict):
+            return {
+                key: stripped
+                for key, item in value.items()
+                if (stripped := strip_arrays(item, f"{path}.{key}" if path else str(key))) is not _ARRAY
+            }
+        if isinstance(value, np.ndarray):
+            name = path.rsplit('.', 1)[-1]
+            target = ARRAY_DTYPES['float32'] if name in AXIS_KEYS else ARRAY_DTYPES[dtype]
+            if value.dtype.kind not in 'fiu':
+                return value.tolist()
+            data = np.ascontiguousarray(value, dtype=target)
+            arrays.append({
+                'name': path,
+                'dtype': target,
+                'shape': list(data.shape),
+                'offset': offset,
+                'nbytes': data.nbytes
+            })
+            chunks.append(data.data)
+            chunks.append(b'\0' * _padding(data.nbytes))
+            offset += data.nbytes + _padding(data.nbytes)
+            return _ARRAY
+        return to_json_compatible(value)
+
+    metadata = strip_arrays(payload, '')
+    header = json.dumps({
+        'version': ARRAY_FORMAT_VERSION,
+        'metadata': metadata,
+        'arrays': arrays
+    }, separators=(',', ':')).encode('utf-8')
+    header += b' ' * _padding(4 + len(header))
+
+    return b''.join([struct.pack('<I', len(header)), header, *chunks])
+
+def decode_arrays(data: bytes) -> dict:
+    """Inverse of :func:`encode_arrays`, mainly for tests and Python clients."""
+    import numpy as np
+
+    (header_length,) = struct.unpack_from('<I', data)
+    header = json.loads(data[4:4 + header_length])
+    data_start = 4 + header_length
+
+    payload = header['metadata']
+    for entry in header['arrays']:
+        array = np.frombuffer(
+            data,
+            dtype=entry['dtype'],
+            count=int(np.prod(entry['shape'], dtype=np.int64)),
+            offset=data_start + entry['offset']
+        ).reshape(entry['shape'])
+
+        *parents, name = entry['name'].split('.')
+        target = payload
+        for parent in parents:
+            target = target.setdefault(parent, {})
+        target[name] = array
+    return payload
+
+def _render(payload: dict, dtype: str | None) -> Response:
+    if dtype is None:
+        return JSONResponse(to_json_compatible(payload))
+    return Response(
+        content=encode_arrays(payload, dtype),
+        media_type=f"{ARRAY_MEDIA_TYPE}; dtype={dtype}"
+    )
+
+async def array_response(request: Request, payload: dict) -> Response:
+    """
+    Renders an array payload as JSON or, when the client asks for it, in the
+    binary array format. Serialization runs in the threadpool as it can take
+    longer than the DSP for large spectrograms.
+    """
+    dtype = negotiate_array_dtype(request.headers.get('accept'))
+    response = await run_in_threadpool(_render, payload, dtype)
+    response.headers['Vary'] = 'Accept'
+    return response
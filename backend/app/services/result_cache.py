@@ -0,0 +1,201 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    cache_key   TEXT PRIMARY KEY,
+    file_key    TEXT NOT NULL,
+    endpoint    TEXT NOT NULL,
+    params      TEXT NOT NULL,
+    version     TEXT NOT NULL,
+    size        INTEGER NOT NULL,
+    last_access REAL NOT NULL,
+    payload     BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_last_access ON results (last_access);
+CREATE INDEX IF NOT EXISTS results_lookup ON results (file_key, endpoint, params);
+"""
+
+# Objects under these prefixes get UUID keys and are never rewritten, so what
+# is computed from them can be cached for good; any other object may be
+# rewritten in place and is always recomputed
+IMMUTABLE_KEY_PREFIXES = ('uploads/',)
+
+def is_immutable_key(file_key: str) -> bool:
+    return file_key.startswith(IMMUTABLE_KEY_PREFIXES)
+
+def result_cache_key(file_key: str, endpoint: str, params: dict, version: str) -> str:
+    """Stable key of an analysis result; ``params`` must be JSON-serializable."""
+    identity = json.dumps([file_key, endpoint, params, version], sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(identity.encode('utf-8')).hexdigest()
+
+class ResultCache:
+    """
+    Persistent cache of analysis results, bounded by a byte budget.
+
+    Uploaded objects are immutable, so a result only depends on its file key,
+    endpoint, query parameters and the version of the algorithm that produced
+    it. Results are pickled into a SQLite database under ``cache_dir``; storing
+    a result with a new version removes the ones computed by older versions,
+    and the least recently read results are evicted first.
+    """
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._connection = sqlite3.connect(
+            os.path.join(self.cache_dir, 'results.sqlite3'),
+            check_same_thread=False,
+            timeout=30
+        )
+        with self._lock:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.executescript(_SCHEMA)
+            self._connection.commit()
+
+    def get(self, file_key: str, endpoint: str, params: dict, version: str):
+        """Returns the cached result, or None on a miss."""
+        cache_key = result_cache_key(file_key, endpoint, params, version)
+        with self._lock:
+            try:
+                row = self._connection.execute(
+                    'SELECT payload FROM results WHERE cache_key = ?', (cache_key,)
+                ).fetchone()
+                if row is not None:
+                    self._connection.execute(
+                        'UPDATE results SET last_access = ? WHERE cache_key = ?', (time.time(), cache_key)
+                    )
+                    self._connection.commit()
+            except sqlite3.Error:
+                logger.exception("Failed to read a cached result")
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        try:
+            return pickle.loads(row[0])
+        except Exception:
+            logger.exception("Discarding an unreadable cached result")
+            return None
+
+    def put(self, file_key: str, endpoint: str, params: dict, version: str, result) -> None:
+        payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(payload) > self.max_bytes:
+            return
+
+        params_json = json.dumps(params, sort_keys=True, separators=(',', ':'))
+        cache_key = result_cache_key(file_key, endpoint, params, version)
+        with self._lock:
+            try:
+                # Results of older algorithm versions can never be read again
+                self._connection.execute(
+                    'DELETE FROM results WHERE file_key = ? AND endpoint = ? AND params = ? AND version != ?',
+                    (file_key, endpoint, params_json, version)
+                )
+                self._connection.execute(
+                    'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    (cache_key, file_key, endpoint, params_json, version, len(payload), time.time(), payload)
+                )
+                self._evict()
+                self._connection.commit()
+            except sqlite3.Error:
+                self._connection.rollback()
+                logger.exception("Failed to store a result in the cache")
+
+    def _evict(self) -> None:
+        """Removes least recently read results until the cache fits its budget."""
+        (current_bytes,) = self._connection.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()
+        if current_bytes <= self.max_bytes:
+            return
+
+        rows = self._connection.execute('SELECT cache_key, size FROM results ORDER BY last_access').fetchall()
+        for cache_key, size in rows:
+            if current_bytes <= self.max_bytes:
+                break
+            self._connection.execute('DELETE FROM results WHERE cache_key = ?', (cache_key,))
+            current_bytes -= size
+            self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute('DELETE FROM results')
+            self._connection.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries, current_bytes = self._connection.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results'
+            ).fetchone()
+            return {
+                'entries': entries,
+                'current_bytes': current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+
+_result_cache: ResultCache | None = None
+_result_cache_lock = threading.Lock()
+
+def get_result_cache() -> ResultCache | None:
+    """
+    Returns the process-wide result cache, creating it on first use, or None
+    when it is disabled.
+    """
+    global _result_cache
+    if _result_cache is None:
+        with _result_cache_lock:
+            if _result_cache is None:
+                from app.core.config import settings
+                if not settings.RESULT_CACHE_DIR:
+                    return None
+                _result_cache = ResultCache(settings.RESULT_CACHE_DIR, settings.RESULT_CACHE_MAX_BYTES)
+    return _result_cache
+
+def result_cache_for(file_key: str) -> ResultCache | None:
+    """
+    The result cache to use for the results of ``file_key``: None when the
+    cache is disabled or the object is not immutable.
+    """
+    if not is_immutable_key(file_key):
+        return None
+    return get_result_cache()
+
+async def cached_result(file_key: str, endpoint: str, params: dict, version: str, compute):
+    """
+    Returns the cached result of ``endpoint`` for a file, or awaits
+    ``compute()`` and stores what it returns. Results of files that are not
+    immutable are never cached.
+    """
+    cache = result_cache_for(file_key)
+    if cache is None:
+        return await compute()
+
+    result = await run_in_threadpool(cache.get, file_key, endpoint, params, version)
+    if result is not None:
+        return result
+
+    result = await compute()
+    await run_in_threadpool(cache.put, file_key, endpoint, params, version, result)
+    return result
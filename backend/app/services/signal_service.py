@@ -1,11 +1,14 @@
-from app.utils.signals.signals import generar_sweep_inverse, wav_to_b64
+import base64
+
+from app.services.sweep_registry import get_sweep_file_cache, make_sweep_id, validate_sweep_parameters
 
 
 def generate_sweep_signals(
     duration: float,
     f_inf: int,
     f_sup: int,
-    fs: int
+    fs: int,
+    include_audio: bool = True
 ) -> dict:
     """
     Generates sweep and inverse sweep signals with their base64 encoded audio data.
@@ -20,21 +23,29 @@ def generate_sweep_signals(
         Upper frequency bound in Hz.
     fs : int
         Sampling frequency in Hz.
+    include_audio : bool
+        Whether to include the base64 encoded audio data.
     
     Returns
     -------
     dict
         Dictionary containing base64 encoded audio data and filenames for both
-        sweep and inverse sweep signals.
+        sweep and inverse sweep signals, and the sweep ID that /calculate-ir
+        accepts in place of the inverse filter. The WAV files are read from
+        the sweep file cache, the same ones served by /signal/{sweep_id}.
     """
-    sweep, inverse, fs = generar_sweep_inverse(duration, fs, f_inf, f_sup)
-    
-    sweep_b64 = wav_to_b64(sweep, fs)
-    inverse_b64 = wav_to_b64(inverse, fs)
-
-    return {
-        "audio_sweep_b64": sweep_b64,
-        "audio_inverse_b64": inverse_b64,
+    validate_sweep_parameters(duration, f_inf, f_sup, fs)
+    sweep_id = make_sweep_id(duration, f_inf, f_sup, fs)
+    result = {
         "filename_sweep": f'sweep_{duration:.1f}s_{int(f_inf)}-{int(f_sup)}.wav',
-        "filename_inverse": f'inverse_{duration:.1f}s_{int(f_inf)}-{int(f_sup)}.wav'
+        "filename_inverse": f'inverse_{duration:.1f}s_{int(f_inf)}-{int(f_sup)}.wav',
+        "sweep_id": sweep_id
     }
+    if not include_audio:
+        return result
+
+    file_cache = get_sweep_file_cache()
+    for kind in ('sweep', 'inverse'):
+        with file_cache.open(sweep_id, kind) as wav_file:
+            result[f"audio_{kind}_b64"] = base64.b64encode(wav_file.read()).decode('ascii')
+    return result
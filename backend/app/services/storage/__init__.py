@@ -0,0 +1,104 @@
+import threading
+from typing import BinaryIO
+
+from starlette.concurrency import run_in_threadpool
+
+from .base import StorageBackend, UploadWriter
+from .disk_cache import DiskCachedStorage
+from .local import LocalStorage
+from .r2 import R2Storage
+
+_storage: StorageBackend | None = None
+_storage_lock = threading.Lock()
+
+def _build_storage() -> StorageBackend:
+    from app.core.config import settings
+
+    if settings.STORAGE_BACKEND == 'local':
+        return LocalStorage(settings.LOCAL_STORAGE_DIR, settings.PUBLIC_BASE_URL)
+
+    if settings.STORAGE_BACKEND != 'r2':
+        raise ValueError(f"Unknown storage backend '{settings.STORAGE_BACKEND}'. Use 'r2' or 'local'.")
+
+    missing = [
+        name for name in ('R2_ENDPOINT_URL', 'R2_ACCESS_KEY_ID', 'R2_SECRET_ACCESS_KEY', 'R2_BUCKET_NAME')
+        if not getattr(settings, name)
+    ]
+    if missing:
+        raise ValueError(f"R2 storage backend requires the following settings: {', '.join(missing)}")
+
+    storage = R2Storage(
+        endpoint_url=settings.R2_ENDPOINT_URL,
+        access_key_id=settings.R2_ACCESS_KEY_ID,
+        secret_access_key=settings.R2_SECRET_ACCESS_KEY,
+        bucket_name=settings.R2_BUCKET_NAME,
+        max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+        connect_timeout=settings.S3_CONNECT_TIMEOUT_S,
+        read_timeout=settings.S3_READ_TIMEOUT_S,
+        max_attempts=settings.S3_MAX_ATTEMPTS,
+        upload_part_size=settings.UPLOAD_PART_SIZE_BYTES,
+        upload_max_in_flight_parts=settings.UPLOAD_MAX_IN_FLIGHT_PARTS
+    )
+
+    if settings.STORAGE_CACHE_DIR:
+        storage = DiskCachedStorage(
+            storage,
+            cache_dir=settings.STORAGE_CACHE_DIR,
+            max_bytes=settings.STORAGE_CACHE_MAX_BYTES,
+            use_mmap=settings.STORAGE_CACHE_MMAP
+        )
+    return storage
+
+def get_storage() -> StorageBackend:
+    """Returns the process-wide storage backend configured in the settings."""
+    global _storage
+    if _storage is None:
+        with _storage_lock:
+            if _storage is None:
+                _storage = _build_storage()
+    return _storage
+
+def upload_file(file: BinaryIO, file_key: str) -> None:
+    get_storage().upload(file, file_key)
+
+def download_file(file_key: str) -> BinaryIO:
+    return get_storage().download(file_key)
+
+def delete_file(file_key: str) -> None:
+    get_storage().delete(file_key)
+
+def generate_file_url(file_key: str, expiration: int = 3600) -> str:
+    return get_storage().generate_url(file_key, expiration)
+
+async def upload_file_async(file: BinaryIO, file_key: str) -> None:
+    """Runs upload_file in the threadpool so the event loop is not blocked."""
+    return await run_in_threadpool(upload_file, file, file_key)
+
+async def download_file_async(file_key: str) -> BinaryIO:
+    """Runs download_file in the threadpool so the event loop is not blocked."""
+    return await run_in_threadpool(download_file, file_key)
+
+async def delete_file_async(file_key: str) -> None:
+    """Runs delete_file in the threadpool so the event loop is not blocked."""
+    return await run_in_threadpool(delete_file, file_key)
+
+async def generate_file_url_async(file_key: str, expiration: int = 3600) -> str:
+    """Runs generate_file_url in the threadpool so the event loop is not blocked."""
+    return await run_in_threadpool(generate_file_url, file_key, expiration)
+
+__all__ = [
+    "StorageBackend",
+    "UploadWriter",
+    "R2Storage",
+    "LocalStorage",
+    "DiskCachedStorage",
+    "get_storage",
+    "upload_file",
+    "download_file",
+    "delete_file",
+    "generate_file_url",
+    "upload_file_async",
+    "download_file_async",
+    "delete_file_async",
+    "generate_file_url_async"
+]
@@ -0,0 +1,78 @@
+import tempfile
+from abc import ABC, abstractmethod
+from typing import BinaryIO
+
+class UploadWriter(ABC):
+    """Incremental writer for an object whose content arrives in chunks."""
+
+    @abstractmethod
+    def write(self, data: bytes) -> None:
+        pass
+
+    @abstractmethod
+    def complete(self) -> None:
+        """Finishes the upload and makes the object visible."""
+        pass
+
+    @abstractmethod
+    def abort(self) -> None:
+        """Discards everything written so far."""
+        pass
+
+
+class _SpooledUploadWriter(UploadWriter):
+    """Fallback writer that buffers the chunks and uploads them at the end."""
+    def __init__(self, storage: 'StorageBackend', file_key: str):
+        self.storage = storage
+        self.file_key = file_key
+        self._file = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024)
+
+    def write(self, data: bytes) -> None:
+        self._file.write(data)
+
+    def complete(self) -> None:
+        try:
+            self._file.seek(0)
+            self.storage.upload(self._file, self.file_key)
+        finally:
+            self._file.close()
+
+    def abort(self) -> None:
+        self._file.close()
+
+
+class StorageBackend(ABC):
+    """Interface of the object stores that hold uploaded and generated audio."""
+
+    @abstractmethod
+    def upload(self, file: BinaryIO, file_key: str) -> None:
+        pass
+
+    @abstractmethod
+    def download(self, file_key: str) -> BinaryIO:
+        """Returns a readable, seekable file object positioned at the start."""
+        pass
+
+    @abstractmethod
+    def exists(self, file_key: str) -> bool:
+        pass
+
+    @abstractmethod
+    def delete(self, file_key: str) -> None:
+        """Removes an object; deleting a missing object is not an error."""
+        pass
+
+    @abstractmethod
+    def generate_url(self, file_key: str, expiration: int = 3600) -> str:
+        pass
+
+    def open_upload(self, file_key: str) -> UploadWriter:
+        """Returns a writer that uploads ``file_key`` as its chunks arrive."""
+        return _SpooledUploadWriter(self, file_key)
+
+    def local_path(self, file_key: str) -> str | None:
+        """Returns a path on local disk holding the object, if there is one."""
+        return None
+
+    def stats(self) -> dict:
+        return {'backend': type(self).__name__}
@@ -0,0 +1,193 @@
+import hashlib
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+from typing import BinaryIO
+
+from app.services.storage.base import StorageBackend, UploadWriter
+
+class _CachingUploadWriter(UploadWriter):
+    """Forwards chunks to the backend writer and keeps a copy in the cache."""
+    def __init__(self, storage: 'DiskCachedStorage', file_key: str):
+        self.storage = storage
+        self.file_key = file_key
+        self._writer = storage.backend.open_upload(file_key)
+        fd, self._tmp_path = tempfile.mkstemp(dir=storage.cache_dir, suffix='.part')
+        self._file = os.fdopen(fd, 'wb')
+
+    def write(self, data: bytes) -> None:
+        self._writer.write(data)
+        self._file.write(data)
+
+    def complete(self) -> None:
+        self._file.close()
+        try:
+            self._writer.complete()
+        except Exception:
+            os.remove(self._tmp_path)
+            raise
+        self.storage._add_to_cache(self._tmp_path, self.file_key)
+
+    def abort(self) -> None:
+        self._writer.abort()
+        self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+
+class DiskCachedStorage(StorageBackend):
+    """
+    Read-through local disk cache in front of another storage backend.
+
+    Objects under ``uploads/`` are immutable, so a cached copy never needs to
+    be invalidated. The cache is bounded to ``max_bytes`` and evicts the least
+    recently read files first. With ``use_mmap`` cache hits are returned as
+    read-only memory maps instead of being copied into memory.
+    """
+    def __init__(self, backend: StorageBackend, cache_dir: str, max_bytes: int, use_mmap: bool = True):
+        self.backend = backend
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_bytes = max_bytes
+        self.use_mmap = use_mmap
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._current_bytes = sum(
+            entry.stat().st_size for entry in os.scandir(self.cache_dir)
+            if entry.is_file() and not entry.name.endswith('.part')
+        )
+
+    def _cache_path(self, file_key: str) -> str:
+        digest = hashlib.sha256(file_key.encode('utf-8')).hexdigest()
+        _, extension = os.path.splitext(file_key)
+        return os.path.join(self.cache_dir, f"{digest}{extension}")
+
+    def _add_to_cache(self, tmp_path: str, file_key: str) -> None:
+        """Moves a fully written temporary file into the cache."""
+        try:
+            size = os.path.getsize(tmp_path)
+            if size > self.max_bytes:
+                os.remove(tmp_path)
+                return
+
+            path = self._cache_path(file_key)
+            with self._lock:
+                if os.path.exists(path):
+                    self._current_bytes -= os.path.getsize(path)
+                os.replace(tmp_path, path)
+                self._current_bytes += size
+                self._evict()
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _store(self, file: BinaryIO, file_key: str) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.part')
+        try:
+            with os.fdopen(fd, 'wb') as tmp_file:
+                shutil.copyfileobj(file, tmp_file)
+        except OSError:
+            os.remove(tmp_path)
+            return
+        self._add_to_cache(tmp_path, file_key)
+
+    def _evict(self) -> None:
+        """Removes least recently used files until the cache fits its budget."""
+        if self._current_bytes <= self.max_bytes:
+            return
+
+        entries = [
+            entry for entry in os.scandir(self.cache_dir)
+            if entry.is_file() and not entry.name.endswith('.part')
+        ]
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries:
+            if self._current_bytes <= self.max_bytes:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+            except OSError:
+                continue
+            self._current_bytes -= size
+            self.evictions += 1
+
+    def _open_cached(self, path: str) -> BinaryIO | None:
+        try:
+            # The modification time doubles as the last access time for eviction
+            os.utime(path)
+            with open(path, 'rb') as cached_file:
+                if self.use_mmap and os.fstat(cached_file.fileno()).st_size > 0:
+                    return mmap.mmap(cached_file.fileno(), 0, access=mmap.ACCESS_READ)
+                return open(path, 'rb')
+        except FileNotFoundError:
+            return None
+
+    def upload(self, file: BinaryIO, file_key: str) -> None:
+        self.backend.upload(file, file_key)
+        if file.seekable():
+            # Freshly uploaded files are opened by the frontend right away
+            file.seek(0)
+            self._store(file, file_key)
+
+    def open_upload(self, file_key: str) -> UploadWriter:
+        return _CachingUploadWriter(self, file_key)
+
+    def download(self, file_key: str) -> BinaryIO:
+        cached = self._open_cached(self._cache_path(file_key))
+        if cached is not None:
+            with self._lock:
+                self.hits += 1
+            return cached
+
+        with self._lock:
+            self.misses += 1
+        remote_file = self.backend.download(file_key)
+        self._store(remote_file, file_key)
+
+        cached = self._open_cached(self._cache_path(file_key))
+        if cached is not None:
+            return cached
+        remote_file.seek(0)
+        return remote_file
+
+    def exists(self, file_key: str) -> bool:
+        if os.path.exists(self._cache_path(file_key)):
+            return True
+        return self.backend.exists(file_key)
+
+    def delete(self, file_key: str) -> None:
+        self.backend.delete(file_key)
+        path = self._cache_path(file_key)
+        with self._lock:
+            try:
+                size = os.path.getsize(path)
+                os.remove(path)
+            except OSError:
+                return
+            self._current_bytes -= size
+
+    def generate_url(self, file_key: str, expiration: int = 3600) -> str:
+        return self.backend.generate_url(file_key, expiration)
+
+    def local_path(self, file_key: str) -> str | None:
+        path = self._cache_path(file_key)
+        return path if os.path.exists(path) else self.backend.local_path(file_key)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'backend': type(self.backend).__name__,
+                'cache_dir': self.cache_dir,
+                'current_bytes': self._current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
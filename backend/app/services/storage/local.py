@@ -0,0 +1,92 @@
+import os
+import shutil
+import tempfile
+from typing import BinaryIO
+from urllib.parse import quote
+
+from fastapi import HTTPException
+
+from app.services.storage.base import StorageBackend, UploadWriter
+
+class _LocalUploadWriter(UploadWriter):
+    """Writes chunks to a temporary file that is renamed into place on completion."""
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.part')
+        self._file = os.fdopen(fd, 'wb')
+
+    def write(self, data: bytes) -> None:
+        self._file.write(data)
+
+    def complete(self) -> None:
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self) -> None:
+        self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+
+class LocalStorage(StorageBackend):
+    """
+    Storage backend that keeps objects as plain files under a root directory.
+
+    Meant for development and load tests, where it stands in for R2 so the
+    service can run without any external dependency.
+    """
+    def __init__(self, root_dir: str, public_base_url: str):
+        self.root_dir = os.path.abspath(root_dir)
+        self.public_base_url = public_base_url.rstrip('/')
+        os.makedirs(self.root_dir, exist_ok=True)
+
+    def _path(self, file_key: str) -> str:
+        path = os.path.abspath(os.path.join(self.root_dir, file_key))
+        if os.path.commonpath([path, self.root_dir]) != self.root_dir or path == self.root_dir:
+            raise HTTPException(status_code=400, detail="Invalid file path")
+        return path
+
+    def upload(self, file: BinaryIO, file_key: str) -> None:
+        path = self._path(file_key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            # Write to a temporary file first so readers never see a partial object
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.part')
+            with os.fdopen(fd, 'wb') as tmp_file:
+                shutil.copyfileobj(file, tmp_file)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            raise HTTPException(status_code=500, detail=f"Could not upload file: {e}")
+
+    def open_upload(self, file_key: str) -> UploadWriter:
+        return _LocalUploadWriter(self._path(file_key))
+
+    def download(self, file_key: str) -> BinaryIO:
+        path = self._path(file_key)
+        try:
+            return open(path, 'rb')
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="File not found")
+        except OSError as e:
+            raise HTTPException(status_code=500, detail=f"Error downloading file: {e}")
+
+    def exists(self, file_key: str) -> bool:
+        return os.path.isfile(self._path(file_key))
+
+    def delete(self, file_key: str) -> None:
+        try:
+            os.remove(self._path(file_key))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            raise HTTPException(status_code=500, detail=f"Could not delete file: {e}")
+
+    def generate_url(self, file_key: str, expiration: int = 3600) -> str:
+        if not self.exists(file_key):
+            raise HTTPException(status_code=404, detail="File not found")
+        return f"{self.public_base_url}/api/files/{quote(file_key)}"
+
+    def local_path(self, file_key: str) -> str | None:
+        path = self._path(file_key)
+        return path if os.path.isfile(path) else None
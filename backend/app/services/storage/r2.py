@@ -0,0 +1,243 @@
+import io
+import threading
+from typing import BinaryIO
+
+from fastapi import HTTPException
+
+from app.services.storage.base import StorageBackend, UploadWriter
+
+class _R2MultipartWriter(UploadWriter):
+    """
+    Uploads an object as an S3 multipart upload while its chunks arrive.
+
+    Chunks are buffered until a full part is available, which is then sent
+    in a background thread. At most ``max_in_flight`` parts are pending at
+    any time, so memory stays bounded by ``part_size * (max_in_flight + 1)``.
+    Objects smaller than one part are sent with a single ``put_object``.
+    """
+    def __init__(self, storage: 'R2Storage', file_key: str, part_size: int, max_in_flight: int):
+        self.storage = storage
+        self.file_key = file_key
+        self.part_size = part_size
+        self.max_in_flight = max_in_flight
+        self._buffer = bytearray()
+        self._upload_id = None
+        self._part_number = 0
+        self._pending = []
+        self._parts = []
+
+    def _upload_part(self, part_number: int, body: bytes) -> dict:
+        response = self.storage.client.upload_part(
+            Bucket=self.storage.bucket_name,
+            Key=self.file_key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=body
+        )
+        return {'PartNumber': part_number, 'ETag': response['ETag']}
+
+    def _submit_part(self, body: bytes) -> None:
+        if self._upload_id is None:
+            response = self.storage.client.create_multipart_upload(
+                Bucket=self.storage.bucket_name,
+                Key=self.file_key
+            )
+            self._upload_id = response['UploadId']
+
+        while len(self._pending) >= self.max_in_flight:
+            self._parts.append(self._pending.pop(0).result())
+
+        self._part_number += 1
+        future = self.storage.part_executor.submit(self._upload_part, self._part_number, body)
+        self._pending.append(future)
+
+    def write(self, data: bytes) -> None:
+        self._buffer.extend(data)
+        try:
+            while len(self._buffer) >= self.part_size:
+                body = bytes(self._buffer[:self.part_size])
+                del self._buffer[:self.part_size]
+                self._submit_part(body)
+        except Exception as e:
+            self.abort()
+            raise HTTPException(status_code=500, detail=f"Could not upload file: {e}")
+
+    def complete(self) -> None:
+        try:
+            if self._upload_id is None:
+                self.storage.client.put_object(
+                    Bucket=self.storage.bucket_name,
+                    Key=self.file_key,
+                    Body=bytes(self._buffer)
+                )
+                return
+
+            if self._buffer:
+                self._submit_part(bytes(self._buffer))
+                self._buffer.clear()
+            self._parts.extend(future.result() for future in self._pending)
+            self._pending.clear()
+
+            self.storage.client.complete_multipart_upload(
+                Bucket=self.storage.bucket_name,
+                Key=self.file_key,
+                UploadId=self._upload_id,
+                MultipartUpload={'Parts': sorted(self._parts, key=lambda part: part['PartNumber'])}
+            )
+        except Exception as e:
+            self.abort()
+            raise HTTPException(status_code=500, detail=f"Could not upload file: {e}")
+
+    def abort(self) -> None:
+        self._buffer.clear()
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        if self._upload_id is not None:
+            try:
+                self.storage.client.abort_multipart_upload(
+                    Bucket=self.storage.bucket_name,
+                    Key=self.file_key,
+                    UploadId=self._upload_id
+                )
+            except Exception:
+                pass
+            self._upload_id = None
+
+
+class R2Storage(StorageBackend):
+    """
+    Storage backend for Cloudflare R2 or any other S3-compatible service.
+
+    boto3 clients are thread-safe, so a single client (and its connection
+    pool) is shared by every request instead of being rebuilt on each call.
+    """
+    def __init__(
+        self,
+        endpoint_url: str,
+        access_key_id: str,
+        secret_access_key: str,
+        bucket_name: str,
+        max_pool_connections: int = 50,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 60.0,
+        max_attempts: int = 3,
+        upload_part_size: int = 8 * 1024 * 1024,
+        upload_max_in_flight_parts: int = 2
+    ):
+        self.endpoint_url = endpoint_url
+        self.access_key_id = access_key_id
+        self.secret_access_key = secret_access_key
+        self.bucket_name = bucket_name
+        self.max_pool_connections = max_pool_connections
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_attempts = max_attempts
+        self.upload_part_size = upload_part_size
+        self.upload_max_in_flight_parts = upload_max_in_flight_parts
+        self._client = None
+        self._client_lock = threading.Lock()
+        self._part_executor = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    import boto3
+                    from botocore.config import Config
+
+                    # Sessions are not thread-safe, so the client is built from
+                    # a dedicated one rather than from the boto3 default session.
+                    session = boto3.session.Session()
+                    self._client = session.client(
+                        's3',
+                        endpoint_url=self.endpoint_url,
+                        aws_access_key_id=self.access_key_id,
+                        aws_secret_access_key=self.secret_access_key,
+                        region_name='auto',
+                        config=Config(
+                            signature_version='s3v4',
+                            max_pool_connections=self.max_pool_connections,
+                            connect_timeout=self.connect_timeout,
+                            read_timeout=self.read_timeout,
+                            retries={'max_attempts': self.max_attempts, 'mode': 'standard'},
+                            tcp_keepalive=True
+                        )
+                    )
+        return self._client
+
+    @property
+    def part_executor(self):
+        """Threads shared by all multipart uploads to send their parts."""
+        if self._part_executor is None:
+            with self._client_lock:
+                if self._part_executor is None:
+                    from concurrent.futures import ThreadPoolExecutor
+                    self._part_executor = ThreadPoolExecutor(
+                        max_workers=self.max_pool_connections,
+                        thread_name_prefix='r2-upload'
+                    )
+        return self._part_executor
+
+    @staticmethod
+    def _is_not_found(error: Exception) -> bool:
+        response = getattr(error, 'response', None) or {}
+        return response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound')
+
+    def upload(self, file: BinaryIO, file_key: str) -> None:
+        try:
+            self.client.upload_fileobj(file, self.bucket_name, file_key)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Could not upload file: {e}")
+
+    def open_upload(self, file_key: str) -> UploadWriter:
+        # S3 rejects multipart parts smaller than 5 MiB, except for the last one
+        return _R2MultipartWriter(
+            self,
+            file_key,
+            part_size=max(self.upload_part_size, 5 * 1024 * 1024),
+            max_in_flight=self.upload_max_in_flight_parts
+        )
+
+    def download(self, file_key: str) -> io.BytesIO:
+        try:
+            in_memory_file = io.BytesIO()
+            self.client.download_fileobj(self.bucket_name, file_key, in_memory_file)
+            in_memory_file.seek(0)
+            return in_memory_file
+        except Exception as e:
+            if self._is_not_found(e):
+                raise HTTPException(status_code=404, detail="File not found")
+            raise HTTPException(status_code=500, detail=f"Error downloading file: {e}")
+
+    def exists(self, file_key: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket_name, Key=file_key)
+            return True
+        except Exception as e:
+            if self._is_not_found(e):
+                return False
+            raise HTTPException(status_code=500, detail=f"Error checking file: {e}")
+
+    def delete(self, file_key: str) -> None:
+        try:
+            # S3 answers deletes of missing keys with success as well
+            self.client.delete_object(Bucket=self.bucket_name, Key=file_key)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Could not delete file: {e}")
+
+    def generate_url(self, file_key: str, expiration: int = 3600) -> str:
+        if not self.exists(file_key):
+            raise HTTPException(status_code=404, detail="File not found")
+        try:
+            return self.client.generate_presigned_url(
+                'get_object',
+                Params={
+                    'Bucket': self.bucket_name,
+                    'Key': file_key
+                },
+                ExpiresIn=expiration
+            )
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error generating presigned URL: {e}")
@@ -0,0 +1,278 @@
+"""
+Registry of the sweeps generated by ``/signal``.
+
+A sweep is fully determined by ``(duration, f_inf, f_sup, fs)``, so its ID
+encodes those parameters and any process can regenerate it: clients that
+measured with a generated sweep send its ID to ``/calculate-ir`` instead of
+uploading the inverse filter. Each process keeps the inverse filters and
+their spectra, per FFT size, in a byte-bounded LRU cache, and the WAV
+downloads of the sweeps are rendered once into a disk cache.
+"""
+import logging
+import os
+import tempfile
+import threading
+from typing import BinaryIO
+
+from fastapi import HTTPException
+
+from app.services.audio_cache import DecodedAudioCache
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever generar_sweep_inverse changes its output, so IDs handed out
+# before no longer resolve to a different sweep
+SWEEP_ID_VERSION = 1
+
+# Signals of a sweep that can be downloaded
+SWEEP_KINDS = ('sweep', 'inverse')
+
+def validate_sweep_parameters(duration: float, f_inf: int, f_sup: int, fs: int) -> None:
+    """Rejects sweeps that cannot be generated or exceed the configured limits."""
+    from app.core.config import settings
+
+    if not 0 < duration <= settings.SWEEP_MAX_DURATION_S:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Sweep duration must be between 0 and {settings.SWEEP_MAX_DURATION_S} seconds."
+        )
+    if not 0 < fs <= settings.SWEEP_MAX_SAMPLE_RATE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Sample rate must be between 1 and {settings.SWEEP_MAX_SAMPLE_RATE} Hz."
+        )
+    if not 0 < f_inf < f_sup:
+        raise HTTPException(status_code=400, detail="Sweep frequencies must satisfy 0 < f_inf < f_sup.")
+
+def make_sweep_id(duration: float, f_inf: int, f_sup: int, fs: int) -> str:
+    return f"v{SWEEP_ID_VERSION}-{float(duration)!r}-{int(f_inf)}-{int(f_sup)}-{int(fs)}"
+
+def sweep_filename(sweep_id: str, kind: str) -> str:
+    """Download name of a sweep's signal, as returned by ``/signal``."""
+    duration, f_inf, f_sup, _ = parse_sweep_id(sweep_id)
+    return f'{kind}_{duration:.1f}s_{f_inf}-{f_sup}.wav'
+
+def parse_sweep_id(sweep_id: str) -> tuple[float, int, int, int]:
+    """Returns the ``(duration, f_inf, f_sup, fs)`` of a sweep ID, or raises a 404."""
+    try:
+        version, rest = sweep_id.split('-', 1)
+        # Split from the right: the duration's repr may hold a '-' (e.g. 1e-05)
+        duration, f_inf, f_sup, fs = rest.rsplit('-', 3)
+        if version != f"v{SWEEP_ID_VERSION}":
+            raise ValueError(version)
+        parameters = (float(duration), int(f_inf), int(f_sup), int(fs))
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Sweep not found.")
+
+    validate_sweep_parameters(*parameters)
+    return parameters
+
+
+class SweepRegistry:
+    """
+    Inverse filters of the registered sweeps and their spectra, cached by
+    sweep ID and FFT size. Cached arrays are read-only.
+    """
+    def __init__(self, max_bytes: int):
+        self._cache = DecodedAudioCache(max_bytes)
+
+    def inverse_filter(self, sweep_id: str) -> tuple:
+        """Returns ``(inverse_filter, fs)`` of a sweep."""
+        def generate():
+            from app.utils.signals.signals import generar_sweep_inverse
+
+            duration, f_inf, f_sup, fs = parse_sweep_id(sweep_id)
+            _, inverse, fs = generar_sweep_inverse(duration, fs, f_inf, f_sup)
+            return inverse, fs
+
+        return self._cache.get_or_load(('inverse', sweep_id), generate)
+
+    def inverse_spectrum(self, sweep_id: str, n_fft: int):
+        """Returns the half spectrum of a sweep's inverse filter at ``n_fft`` points."""
+        def transform():
+            from app.utils.signals.signals import inverse_filter_spectrum
+
+            inverse, _ = self.inverse_filter(sweep_id)
+            return inverse_filter_spectrum(inverse, n_fft), n_fft
+
+        return self._cache.get_or_load(('spectrum', sweep_id, n_fft), transform)[0]
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+_sweep_registry: SweepRegistry | None = None
+_sweep_registry_lock = threading.Lock()
+
+def get_sweep_registry() -> SweepRegistry:
+    """Returns the process-wide sweep registry, creating it on first use."""
+    global _sweep_registry
+    if _sweep_registry is None:
+        with _sweep_registry_lock:
+            if _sweep_registry is None:
+                from app.core.config import settings
+                _sweep_registry = SweepRegistry(settings.SWEEP_CACHE_MAX_BYTES)
+    return _sweep_registry
+
+class SweepFileCache:
+    """
+    WAV files of the sweeps and inverse filters, rendered chunk by chunk on
+    first use into ``cache_dir``, which the processes of a node can share.
+
+    Files never change for a given sweep ID, so they are only evicted, least
+    recently served first, once the files in the directory exceed
+    ``max_bytes``; the file just rendered is always kept. Files are handed
+    out open, so an eviction by another process cannot pull one from under
+    a response.
+    """
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._rendering: dict[str, threading.Lock] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def open(self, sweep_id: str, kind: str) -> BinaryIO:
+        """Opens a sweep's WAV file for reading, rendering it if needed."""
+        parameters = parse_sweep_id(sweep_id)
+        path = os.path.join(self.cache_dir, f"{sweep_id}-{kind}.wav")
+        for attempt in range(3):
+            try:
+                wav_file = open(path, 'rb')
+            except FileNotFoundError:
+                # Missing, or evicted by another process right after rendering
+                self._render(path, parameters, kind)
+                continue
+
+            try:
+                # The modification time doubles as the last access time for eviction
+                os.utime(path)
+            except FileNotFoundError:
+                pass
+            if attempt == 0:
+                with self._lock:
+                    self.hits += 1
+            return wav_file
+
+        logger.warning("Sweep file %s keeps being evicted; SWEEP_FILE_CACHE_MAX_MB is too small", path)
+        raise HTTPException(
+            status_code=503,
+            detail="Server is busy generating other sweeps. Please retry shortly.",
+            headers={"Retry-After": "1"}
+        )
+
+    def _render(self, path: str, parameters: tuple, kind: str) -> None:
+        with self._lock:
+            render_lock = self._rendering.setdefault(path, threading.Lock())
+        # Concurrent requests for the same file wait for a single rendering
+        with render_lock:
+            if os.path.exists(path):
+                return
+            with self._lock:
+                self.misses += 1
+
+            from app.utils.signals.signals import write_sweep_wav
+
+            duration, f_inf, f_sup, fs = parameters
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.part')
+            os.close(fd)
+            try:
+                write_sweep_wav(tmp_path, duration, fs, f_inf, f_sup, inverse=kind == 'inverse')
+                os.replace(tmp_path, path)
+                self._evict(keep=path)
+            finally:
+                with self._lock:
+                    self._rendering.pop(path, None)
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+    def _entries(self) -> list:
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith('.part'):
+                continue
+            try:
+                if entry.is_file():
+                    entries.append((entry.path, entry.stat()))
+            except FileNotFoundError:
+                continue
+        return entries
+
+    def _evict(self, keep: str) -> None:
+        """
+        Removes least recently served files until the cache fits its budget.
+        The size is read from the directory, as other processes add and
+        evict files too.
+        """
+        entries = self._entries()
+        current_bytes = sum(stat.st_size for _, stat in entries)
+        if current_bytes <= self.max_bytes:
+            return
+
+        entries.sort(key=lambda entry: entry[1].st_mtime)
+        for path, stat in entries:
+            if current_bytes <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            current_bytes -= stat.st_size
+            with self._lock:
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        current_bytes = sum(stat.st_size for _, stat in self._entries())
+        with self._lock:
+            return {
+                'cache_dir': self.cache_dir,
+                'current_bytes': current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+
+_sweep_file_cache: SweepFileCache | None = None
+
+def get_sweep_file_cache() -> SweepFileCache:
+    """Returns the process-wide cache of sweep WAV files, creating it on first use."""
+    global _sweep_file_cache
+    if _sweep_file_cache is None:
+        with _sweep_registry_lock:
+            if _sweep_file_cache is None:
+                from app.core.config import settings
+                _sweep_file_cache = SweepFileCache(settings.SWEEP_FILE_CACHE_DIR, settings.SWEEP_FILE_CACHE_MAX_BYTES)
+    return _sweep_file_cache
+
+def get_ir_from_sweep(
+    recording,
+    sweep_id: str,
+    start_margin_ms: float = 20.0,
+    duration_factor: float = 4.0
+) -> dict | None:
+    """
+    get_ir_from_deconvolution against a registered sweep, reusing its cached
+    inverse spectrum. Runs in the DSP workers, each with its own registry.
+    """
+    from app.utils.signals.signals import deconvolution_size, get_ir_from_deconvolution
+
+    registry = get_sweep_registry()
+    inverse, fs = registry.inverse_filter(sweep_id)
+    n_fft = deconvolution_size(len(recording) + len(inverse) - 1)
+    return get_ir_from_deconvolution(
+        recording,
+        inverse,
+        fs,
+        start_margin_ms=start_margin_ms,
+        duration_factor=duration_factor,
+        inverse_spectrum=registry.inverse_spectrum(sweep_id, n_fft)
+    )
@@ -0,0 +1,157 @@
+import os
+import uuid
+
+from fastapi import HTTPException, Request
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.services.storage import get_storage
+
+# Room for the multipart boundaries and part headers around the file itself
+_MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+def _too_large() -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"File size exceeds the {settings.MAX_FILE_SIZE_MB}MB limit."
+    )
+
+class _FilePartCollector:
+    """
+    Callbacks for the multipart parser that pick out the ``file`` field.
+
+    Parser callbacks are synchronous, so the data of the file part is only
+    collected here and drained by the request loop after every chunk.
+    """
+    def __init__(self, field_name: str):
+        self.field_name = field_name
+        self.header_field = b''
+        self.header_value = b''
+        self.headers: dict[bytes, bytes] = {}
+        self.in_file_part = False
+        self.file_seen = False
+        self.filename = ''
+        self.content_type = ''
+        self.chunks: list[bytes] = []
+        self.new_file_part = False
+
+    def on_part_begin(self):
+        self.headers = {}
+        self.in_file_part = False
+
+    def on_header_field(self, data: bytes, start: int, end: int):
+        self.header_field += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int):
+        self.header_value += data[start:end]
+
+    def on_header_end(self):
+        self.headers[self.header_field.lower()] = self.header_value
+        self.header_field = b''
+        self.header_value = b''
+
+    def on_headers_finished(self):
+        from python_multipart.multipart import parse_options_header
+
+        _, options = parse_options_header(self.headers.get(b'content-disposition', b''))
+        if options.get(b'name', b'').decode('latin-1') != self.field_name or self.file_seen:
+            return
+
+        self.in_file_part = True
+        self.file_seen = True
+        self.new_file_part = True
+        self.filename = options.get(b'filename', b'').decode('utf-8', errors='replace')
+        self.content_type = self.headers.get(b'content-type', b'').decode('latin-1').strip()
+
+    def on_part_data(self, data: bytes, start: int, end: int):
+        if self.in_file_part:
+            self.chunks.append(data[start:end])
+
+    def on_part_end(self):
+        self.in_file_part = False
+
+    def callbacks(self) -> dict:
+        return {
+            'on_part_begin': self.on_part_begin,
+            'on_header_field': self.on_header_field,
+            'on_header_value': self.on_header_value,
+            'on_header_end': self.on_header_end,
+            'on_headers_finished': self.on_headers_finished,
+            'on_part_data': self.on_part_data,
+            'on_part_end': self.on_part_end
+        }
+
+
+async def stream_upload(request: Request, field_name: str = 'file', key_prefix: str = 'uploads/') -> dict:
+    """
+    Streams the ``field_name`` file of a multipart request into storage.
+
+    The body is parsed chunk by chunk as it arrives and forwarded to a storage
+    upload writer, so memory use does not depend on the file size and nothing
+    is spooled to disk. The upload is aborted with a 413 as soon as the file
+    exceeds ``MAX_FILE_SIZE_BYTES``.
+
+    Returns the generated ``filename``, its storage ``path`` and its ``size``.
+    """
+    from python_multipart.multipart import MultipartParser, parse_options_header
+
+    content_type, options = parse_options_header(request.headers.get('content-type', ''))
+    boundary = options.get(b'boundary')
+    if content_type != b'multipart/form-data' or not boundary:
+        raise HTTPException(status_code=400, detail="Expected a multipart/form-data request.")
+
+    content_length = request.headers.get('content-length')
+    if content_length and content_length.isdigit() \
+            and int(content_length) > settings.MAX_FILE_SIZE_BYTES + _MULTIPART_OVERHEAD_BYTES:
+        raise _too_large()
+
+    collector = _FilePartCollector(field_name)
+    parser = MultipartParser(boundary, collector.callbacks())
+
+    writer = None
+    file_key = None
+    unique_filename = None
+    file_size = 0
+
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+
+            if collector.new_file_part:
+                collector.new_file_part = False
+                if collector.content_type not in settings.ALLOWED_MIME_TYPES:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"File type not allowed. Please upload one of: {', '.join(settings.ALLOWED_MIME_TYPES)}"
+                    )
+                _, extension = os.path.splitext(collector.filename)
+                unique_filename = f"{uuid.uuid4()}{extension}"
+                file_key = f"{key_prefix}{unique_filename}"
+                writer = await run_in_threadpool(get_storage().open_upload, file_key)
+
+            if not collector.chunks:
+                continue
+
+            data = b''.join(collector.chunks)
+            collector.chunks.clear()
+            file_size += len(data)
+            if file_size > settings.MAX_FILE_SIZE_BYTES:
+                raise _too_large()
+
+            await run_in_threadpool(writer.write, data)
+
+        parser.finalize()
+        if writer is None:
+            raise HTTPException(status_code=422, detail=f"Field '{field_name}' is required.")
+
+        await run_in_threadpool(writer.complete)
+    except Exception:
+        if writer is not None:
+            await run_in_threadpool(writer.abort)
+        raise
+
+    return {
+        "filename": unique_filename,
+        "path": file_key,
+        "size": file_size
+    }
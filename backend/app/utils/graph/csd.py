@@ -1,5 +1,8 @@
-def get_csd_data(signal, sr: int, bands_per_oct: int) -> dict:
+VERSION = 2
+
+def get_csd_data(signal, sr: int, bands_per_oct: int, precision: str = 'float64') -> dict:
     import numpy as np
+    from scipy import fft
     from scipy.interpolate import interp1d
     from scipy.signal import windows
     from scipy.ndimage import gaussian_filter
@@ -9,9 +12,10 @@ def get_csd_data(signal, sr: int, bands_per_oct: int) -> dict:
     Args:
         signal: The impulse response signal
         sr: Sample rate in Hz
+        precision: Working dtype, 'float64' or 'float32'
         
     Returns:
-        Dictionary containing waterfall plot data
+        Dictionary containing waterfall plot data as arrays
     """
     # Configuration Parameters
     fft_size = 8192  # Power of 2 for FFT
@@ -24,8 +28,13 @@ def get_csd_data(signal, sr: int, bands_per_oct: int) -> dict:
 
     hop_length = fft_size // 4 
     # Create Hann window
-    window = windows.hann(fft_size)
+    window = windows.hann(fft_size).astype(precision)
+    signal = np.asarray(signal, dtype=precision)
     
+    # Signals shorter than one FFT frame (short, truncated IRs) give a single slice
+    if len(signal) < fft_size:
+        signal = np.pad(signal, (0, fft_size - len(signal)))
+
     # Core CSD Loop
     num_slices = (len(signal) - fft_size) // hop_length + 1
     slices = []
@@ -42,8 +51,8 @@ def get_csd_data(signal, sr: int, bands_per_oct: int) -> dict:
         # Apply window
         windowed_chunk = chunk * window
         
-        # Compute FFT
-        fft_result = np.fft.rfft(windowed_chunk, n=fft_size)
+        # Compute FFT (scipy.fft keeps float32 chunks in single precision)
+        fft_result = fft.rfft(windowed_chunk, n=fft_size)
         
         # Calculate magnitude in dB
         magnitude = np.abs(fft_result)
@@ -61,7 +70,7 @@ def get_csd_data(signal, sr: int, bands_per_oct: int) -> dict:
     f_log = np.logspace(np.log10(min_freq), np.log10(max_freq), num=1024)
     
     # Post-Processing (Smoothing and Resampling)
-    Sxx_log_smoothed = np.zeros((num_slices_actual, len(f_log)))
+    Sxx_log_smoothed = np.zeros((num_slices_actual, len(f_log)), dtype=precision)
     
     for slice_idx, db_slice in enumerate(slices):
         # Apply Fractional-Octave Smoothing
@@ -98,9 +107,9 @@ def get_csd_data(signal, sr: int, bands_per_oct: int) -> dict:
     
     # Return data structure
     return {
-        "Sxx": Sxx_gaussian.T.tolist(),  # Transpose to have frequency as first dimension
-        "f": f_log.tolist(),
-        "t": t.tolist(),
+        "Sxx": Sxx_gaussian.T,  # Transpose to have frequency as first dimension
+        "f": f_log,
+        "t": t,
         "min_db": -dynamic_range_db,
         "max_db": 0
     }
@@ -1,9 +1,16 @@
-def get_envelope_db_data(signal, sr: int, num_points: int = 2000, min_db: float = -70.0) -> dict[str, list[object]]:
-    import librosa
+VERSION = 2
+
+def get_envelope_db_data(
+    signal,
+    sr: int,
+    num_points: int = 2000,
+    min_db: float = -70.0,
+    precision: str = 'float64'
+) -> dict:
     import numpy as np
     from app.utils.pipeline.helpers import to_db_scale
     
-    envelope = np.abs(signal)
+    envelope = np.abs(np.asarray(signal, dtype=precision))
     
     envelope_db = to_db_scale(envelope)
     envelope_db_clipped = np.clip(envelope_db, min_db, None)
@@ -14,9 +21,7 @@ def get_envelope_db_data(signal, sr: int, num_points: int = 2000, min_db: float
     else:
         envelope_plot = envelope_db_clipped
     
-    duration = librosa.get_duration(y=signal, sr=sr)
-    time_labels = np.linspace(0, duration, len(envelope_plot)).tolist()
+    duration = len(signal) / sr
+    time_labels = np.linspace(0, duration, len(envelope_plot))
     
-    amplitude_data = envelope_plot.tolist()
-    
-    return {"labels": time_labels, "data": amplitude_data}
+    return {"labels": time_labels, "data": envelope_plot}
@@ -1,3 +1,5 @@
+VERSION = 2
+
 def nextpow2(x: float) -> int:
     import numpy as np
     """Calculates the next power of 2 greater than or equal to x."""
@@ -45,11 +47,14 @@ def get_frequency_data(
     y,
     sr: int,
     bands_per_oct: int = 24,
-    max_nfft: int = 262144
-) -> dict[str, list[float]]:
+    max_nfft: int = 262144,
+    precision: str = 'float64'
+) -> dict:
     import numpy as np
     from scipy.fft import rfft, rfftfreq
     
+    # scipy.fft keeps float32 inputs in single precision
+    y = np.asarray(y, dtype=precision)
     nfft = min(nextpow2(len(y)) * 4, max_nfft)
 
     H = rfft(y, n=nfft)
@@ -67,6 +72,6 @@ def get_frequency_data(
     mask = (f >= fmin) & (f <= fmax)
     
     return {
-        "frequencies": f[mask].tolist(), 
-        "magnitudes": mag_smooth_db[mask].tolist()
+        "frequencies": f[mask],
+        "magnitudes": mag_smooth_db[mask]
     }
@@ -1,4 +1,6 @@
-def get_spectrogram_data(y, sr: int) -> dict:
+VERSION = 2
+
+def get_spectrogram_data(y, sr: int, precision: str = 'float64') -> dict:
     import numpy as np
     from scipy import signal
     from scipy.interpolate import interp1d, RectBivariateSpline
@@ -9,11 +11,14 @@ def get_spectrogram_data(y, sr: int) -> dict:
     Args:
         y (np.ndarray): The time-domain audio signal.
         sr (int): The sample rate.
+        precision (str): Working dtype, ``'float64'`` or ``'float32'``.
 
     Returns:
-        dict: A dictionary containing the log-resampled spectrogram data.
+        dict: A dictionary containing the log-resampled spectrogram data as
+            arrays (see ``app.services.response_encoding`` for serialization).
     """
     # 1. Calculate the original linear spectrogram
+    y = np.asarray(y, dtype=precision)
     nperseg = int(0.046 * sr)  # Use a larger window for better frequency resolution (e.g., 46ms)
     noverlap = nperseg // 2     # 50% overlap
 
@@ -32,7 +37,7 @@ def get_spectrogram_data(y, sr: int) -> dict:
     f_log = np.logspace(np.log10(min_freq), np.log10(max_freq), num=num_log_bins)
 
     # 3. Resample the spectrogram data for each time slice
-    Sxx_log = np.zeros((num_log_bins, len(t)))
+    Sxx_log = np.zeros((num_log_bins, len(t)), dtype=precision)
 
     for i in range(len(t)):
         # Create an interpolation function for the current time slice
@@ -82,9 +87,9 @@ def get_spectrogram_data(y, sr: int) -> dict:
     min_db = np.min(Sxx_smoothed)
 
     return {
-        "Sxx": Sxx_smoothed.tolist(),
-        "f": f_log.tolist(), # Send the new log frequencies
-        "t": t.tolist(),
+        "Sxx": Sxx_smoothed,
+        "f": f_log, # Send the new log frequencies
+        "t": t,
         "min_db": min_db,
         "max_db": max_db
     }
\ No newline at end of file
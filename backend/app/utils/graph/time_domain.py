@@ -1,9 +1,10 @@
-def get_waveform_data(signal, sr: int, num_points: int = 2000) -> dict[str, list[object]]:
-    import librosa
+VERSION = 1
+
+def get_waveform_data(signal, sr: int, num_points: int = 2000) -> dict:
     import numpy as np
     """
     Downsamples a signal and prepares its time-domain data (labels and amplitude)
-    for plotting in a JSON-compatible format.
+    for plotting.
 
     Args:
         signal (np.ndarray): The time-domain audio signal (impulse response).
@@ -11,8 +12,8 @@ def get_waveform_data(signal, sr: int, num_points: int = 2000) -> dict[str, list
         num_points (int): The maximum number of data points to return for plotting.
 
     Returns:
-        dict[str, list[object]]: A dictionary with 'labels' (time in seconds) and
-                              'data' (amplitude values).
+        dict: A dictionary with 'labels' (time in seconds) and 'data'
+              (amplitude values) arrays.
     """
     if len(signal) > num_points:
         step = len(signal) // num_points
@@ -20,9 +21,7 @@ def get_waveform_data(signal, sr: int, num_points: int = 2000) -> dict[str, list
     else:
         signal_plot = signal
 
-    duration = librosa.get_duration(y=signal, sr=sr)
-    time_labels = np.linspace(0, duration, len(signal_plot)).tolist()
-
-    amplitude_data = signal_plot.tolist()
+    duration = len(signal) / sr
+    time_labels = np.linspace(0, duration, len(signal_plot))
 
-    return {"labels": time_labels, "data": amplitude_data}
\ No newline at end of file
+    return {"labels": time_labels, "data": signal_plot}
\ No newline at end of file
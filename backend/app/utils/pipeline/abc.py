@@ -1,8 +1,15 @@
 from abc import ABC, abstractmethod
 
+from app.utils.pipeline.helpers import check_precision
+
 class SignalProcessor(ABC):
-    def __init__(self, fs: int):
+    # Bump whenever a change alters the output, so cached results are recomputed
+    VERSION: int = 1
+
+    def __init__(self, fs: int, precision: str = 'float64'):
         self.fs = fs
+        # dtype of the band matrices; accumulations always run in float64
+        self.precision = check_precision(precision)
 
     @abstractmethod
     def process(self, data: dict[str, object]) -> dict[str, object]:
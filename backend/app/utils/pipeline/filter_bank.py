@@ -0,0 +1,70 @@
+"""
+Cached Butterworth filter-bank designs for the band-pass stage.
+
+A design only depends on ``(fs, filter_type, filter_order)``, so each
+configuration is designed once per process and shared by every pipeline run.
+"""
+from functools import lru_cache
+
+from app.utils.pipeline.constants import (
+    OCTAVE_FREQUENCIES,
+    THIRD_OCTAVE_FREQUENCIES,
+    BANDWIDTH_FACTOR_OCTAVE,
+    BANDWIDTH_FACTOR_THIRD_OCTAVE
+)
+
+class FilterBank:
+    """
+    Second-order sections of the octave or third-octave band-pass filters
+    for one sample rate, keyed by center frequency.
+    """
+    def __init__(self, fs: int, filter_type: int = 1, filter_order: int = 12):
+        import numpy as np
+        from scipy import signal
+
+        if filter_type == 1:
+            bandwidth_factor = BANDWIDTH_FACTOR_OCTAVE
+            center_frequencies = OCTAVE_FREQUENCIES
+        elif filter_type == 3:
+            bandwidth_factor = BANDWIDTH_FACTOR_THIRD_OCTAVE
+            center_frequencies = THIRD_OCTAVE_FREQUENCIES
+        else:
+            raise ValueError("Filter type must be 'octava' or 'tercio_octava'")
+
+        self.fs = fs
+        self.filter_type = filter_type
+        self.filter_order = filter_order
+
+        ratio = np.power(2, bandwidth_factor)
+        self.sos = {}
+        for center_freq in center_frequencies:
+            low_cutoff = center_freq / ratio
+            high_cutoff = center_freq * ratio
+
+            sos = signal.iirfilter(
+                filter_order,
+                [low_cutoff, high_cutoff],
+                btype='band',
+                ftype='butter',
+                fs=fs,
+                output='sos'
+            )
+            # Shared between requests, so it must never be modified in place
+            # (scipy's filtering routines reject read-only arrays)
+            self.sos[center_freq] = sos
+
+    @property
+    def center_frequencies(self) -> list:
+        return list(self.sos)
+
+
+@lru_cache(maxsize=32)
+def get_filter_bank(fs: int, filter_type: int = 1, filter_order: int = 12) -> FilterBank:
+    """Returns the filter bank of a configuration, designing it on first use."""
+    return FilterBank(fs, filter_type, filter_order)
+
+def prebuild_filter_banks(sample_rates: list[int], filter_types: tuple = (1, 3), filter_order: int = 12) -> None:
+    """Designs the filter banks of the common configurations ahead of time."""
+    for fs in sample_rates:
+        for filter_type in filter_types:
+            get_filter_bank(int(fs), filter_type, filter_order)
@@ -1,3 +1,11 @@
+PRECISIONS = ('float64', 'float32')
+
+def check_precision(precision: str) -> str:
+    """Validates a precision setting (``'float64'`` or ``'float32'``)."""
+    if precision not in PRECISIONS:
+        raise ValueError(f"Precision must be one of: {', '.join(PRECISIONS)}")
+    return precision
+
 def to_db_scale(signal):
     import numpy as np
     
@@ -11,7 +19,8 @@ def to_db_scale(signal):
 def linear_regression(x, y) -> dict:
     import numpy as np
     
-    x, y = np.asarray(x), np.asarray(y)
+    # Sums run in float64 even for float32 curves
+    x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
     n = len(x)
     if n == 0:
         return {'slope': 0, 'intercept': 0}
@@ -35,4 +44,79 @@ def linear_regression_in_range(x, y, upper_limit: float, lower_limit: float) ->
     if not np.any(mask):
         return {'slope': -np.inf, 'intercept': 0}
         
-    return linear_regression(x[mask], y[mask])
\ No newline at end of file
+    return linear_regression(x[mask], y[mask])
+
+
+class DecayCurveIndex:
+    """
+    Answers ``linear_regression_in_range`` queries on one decay curve.
+
+    Schroeder decay curves are non-increasing, so the samples within a level
+    range are contiguous and their bounds can be found by binary search. Each
+    regression then only touches that slice instead of masking and copying
+    the whole curve, and gives exactly the same result. Curves that are not
+    monotonic fall back to the masked regression.
+    """
+    def __init__(self, x, y):
+        import numpy as np
+
+        self.x = np.asarray(x)
+        self.y = np.asarray(y)
+        self.monotonic = len(self.y) < 2 or bool(np.all(self.y[1:] <= self.y[:-1]))
+        # Ascending copy for the binary searches
+        self._negated_y = -self.y if self.monotonic else None
+
+    def range_indices(self, upper_limit: float, lower_limit: float) -> tuple[int, int]:
+        """Bounds ``[start, stop)`` of the samples with lower <= y <= upper."""
+        import numpy as np
+
+        start = int(np.searchsorted(self._negated_y, -upper_limit, side='left'))
+        stop = int(np.searchsorted(self._negated_y, -lower_limit, side='right'))
+        return start, max(start, stop)
+
+    def regression(self, upper_limit: float, lower_limit: float) -> dict:
+        """Same result as ``linear_regression_in_range(x, y, upper_limit, lower_limit)``."""
+        import numpy as np
+
+        if not self.monotonic:
+            return linear_regression_in_range(self.x, self.y, upper_limit, lower_limit)
+
+        start, stop = self.range_indices(upper_limit, lower_limit)
+        if start == stop:
+            return {'slope': -np.inf, 'intercept': 0}
+
+        return linear_regression(self.x[start:stop], self.y[start:stop])
+
+
+class CumulativeEnergy:
+    """
+    Cumulative energy of one signal, for energy lookups over any window.
+
+    The squared signal is accumulated in float64 once, as prefix sums of
+    ``block_size``-sample blocks, so the energy of a window is a difference
+    of two prefix sums plus at most two partial blocks instead of a sum over
+    the whole window. Block sums use NumPy's pairwise summation, which is
+    faster and more accurate than a per-sample running sum.
+    """
+    def __init__(self, signal, block_size: int = 256):
+        import numpy as np
+
+        self.p_squared = np.square(signal, dtype=np.float64)
+        self.block_size = block_size
+        num_blocks = len(self.p_squared) // block_size
+
+        self._block_prefix = np.zeros(num_blocks + 1)
+        blocks = self.p_squared[:num_blocks * block_size].reshape(num_blocks, block_size)
+        np.cumsum(blocks.sum(axis=1), out=self._block_prefix[1:])
+
+    def __len__(self) -> int:
+        return len(self.p_squared)
+
+    def prefix(self, index: int) -> float:
+        """Energy of the samples ``[0, index)``."""
+        block = min(index // self.block_size, len(self._block_prefix) - 1)
+        return float(self._block_prefix[block] + self.p_squared[block * self.block_size:index].sum())
+
+    def energy(self, start: int, stop: int) -> float:
+        """Energy of the samples ``[start, stop)``."""
+        return self.prefix(stop) - self.prefix(start)
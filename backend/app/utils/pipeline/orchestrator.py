@@ -9,15 +9,52 @@ from .processor import (
 )
 
 class AcousticPipeline:
-    """Orchestrates the execution of the signal processing chain."""
-    def __init__(self, fs: int, filter_type: int, smoothing_window_ms: int):
+    """
+    Orchestrates the execution of the signal processing chain.
+
+    Per-band data is kept as contiguous ``(bands * channels x samples)``
+    matrices whose rows follow ``processing_data['band_frequencies']``.
+    Multichannel impulse responses ``(channels x samples)`` are stacked
+    band-major (``row = band * channels + channel``), so every channel goes
+    through a single pass sharing the filter bank and the batched FFTs.
+
+    With ``max_workers > 1`` the bands are processed concurrently: each band
+    runs its own filter -> envelope -> decay -> parameters chain in a thread
+    pool (SciPy and NumPy release the GIL in the heavy parts) and the results
+    are merged in band order, so they are identical to a serial run.
+
+    With ``lean=True`` the envelopes are overwritten by the decay curves and
+    only the results (see ``RESULT_KEYS``) are kept once the run finishes, so
+    peak memory stays close to two matrices of the input size.
+
+    ``precision='float32'`` stores the band matrices in single precision,
+    halving their memory and bandwidth. Filtering and every accumulation
+    (Schroeder integral, energies, regressions) still run in float64; see
+    the "Precision" section of the README for the resulting parameter deviations.
+    """
+    RESULT_KEYS = ('fs', 'band_frequencies', 'channels', 'noise_start_indices', 'acoustic_parameters')
+
+    def __init__(
+        self,
+        fs: int,
+        filter_type: int,
+        smoothing_window_ms: int,
+        max_workers: int = 1,
+        lean: bool = False,
+        precision: str = 'float64'
+    ):
         self.fs = fs
+        self.max_workers = max_workers
+        self.lean = lean
+        self.precision = precision
+        self.multichannel = False
         
+        self.bandpass_filter = BandpassFilter(fs, filter_type=filter_type, precision=precision)
         self.processors: list[SignalProcessor] = [
-            BandpassFilter(fs, filter_type=filter_type),
-            EnvelopeSmoother(fs, smoothing_window_ms=smoothing_window_ms),
-            DecayAnalyzer(fs),
-            ParameterCalculator(fs)
+            self.bandpass_filter,
+            EnvelopeSmoother(fs, smoothing_window_ms=smoothing_window_ms, precision=precision),
+            DecayAnalyzer(fs, in_place=lean, precision=precision),
+            ParameterCalculator(fs, precision=precision)
         ]
         self.processing_data: dict[str, object] = {}
 
@@ -25,14 +62,84 @@ class AcousticPipeline:
         """
         Executes the full processing pipeline on an impulse response.
         The results are stored internally.
+
+        ``impulse_response`` is 1-D, or ``(channels x samples)`` for
+        multichannel results (see get_final_parameters).
         """
+        self.multichannel = impulse_response.ndim == 2
+        if self.max_workers > 1:
+            self._run_band_parallel(impulse_response)
+            return
+
         self.processing_data = {'ri': impulse_response, 'fs': self.fs}
         for processor in self.processors:
             self.processing_data = processor.process(self.processing_data)
+        self._release_intermediates(self.processing_data)
 
-    def get_final_parameters(self) -> dict[str, object]:
+    def _release_intermediates(self, data: dict[str, object]) -> None:
+        """Drops everything but the results from ``data`` in lean mode."""
+        if not self.lean:
+            return
+        for key in [key for key in data if key not in self.RESULT_KEYS]:
+            del data[key]
+
+    def _run_band(self, impulse_response: np.ndarray, center_freq) -> dict[str, object]:
+        """Runs the whole chain for a single band."""
+        band_data = {
+            'ri': impulse_response,
+            'fs': self.fs,
+            'band_frequencies': [center_freq],
+            'channels': len(np.atleast_2d(impulse_response)),
+            'filtered_signals': np.atleast_2d(
+                self.bandpass_filter.filter_band(impulse_response, center_freq).astype(self.precision, copy=False)
+            )
+        }
+        for processor in self.processors[1:]:
+            band_data = processor.process(band_data)
+        self._release_intermediates(band_data)
+        return band_data
+
+    def _run_band_parallel(self, impulse_response: np.ndarray) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        center_frequencies = self.bandpass_filter.filter_bank.center_frequencies
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(center_frequencies))) as executor:
+            band_results = list(executor.map(
+                lambda center_freq: self._run_band(impulse_response, center_freq),
+                center_frequencies
+            ))
+
+        # Stack the single-band matrices and join the band lists and the
+        # per-channel parameters in band order
+        self.processing_data = {'ri': impulse_response, 'fs': self.fs}
+        for key, value in band_results[0].items():
+            values = [band_data[key] for band_data in band_results]
+            if key == 'acoustic_parameters':
+                self.processing_data[key] = [
+                    {band: item for band_value in channel_values for band, item in band_value.items()}
+                    for channel_values in zip(*values)
+                ]
+            elif isinstance(value, np.ndarray):
+                self.processing_data[key] = np.concatenate(values)
+            elif isinstance(value, list):
+                self.processing_data[key] = [item for band_value in values for item in band_value]
+            elif key not in self.processing_data:
+                self.processing_data[key] = value
+        self._release_intermediates(self.processing_data)
+
+    def get_final_parameters(self) -> dict[str, object] | list[dict[str, object]]:
         """
-        Returns the essential acoustic parameters calculated by the pipeline.
-        This should be called after run().
+        Returns the essential acoustic parameters calculated by the pipeline,
+        keyed by band, or a list with those of each channel for multichannel
+        impulse responses. This should be called after run().
         """
-        return self.processing_data.get('acoustic_parameters', {})
\ No newline at end of file
+        channel_parameters = self.processing_data.get('acoustic_parameters', [{}])
+        return channel_parameters if self.multichannel else channel_parameters[0]
+
+    @staticmethod
+    def algorithm_version() -> str:
+        """Combined version of the processors, e.g. ``'1.1.1.1'``."""
+        return '.'.join(
+            str(processor.VERSION)
+            for processor in (BandpassFilter, EnvelopeSmoother, DecayAnalyzer, ParameterCalculator)
+        )
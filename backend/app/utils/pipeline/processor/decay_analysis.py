@@ -1,10 +1,22 @@
 from app.utils.pipeline.abc import SignalProcessor
-from app.utils.pipeline.helpers import to_db_scale, linear_regression_in_range
+from app.utils.pipeline.helpers import to_db_scale, DecayCurveIndex
 
 class DecayAnalyzer(SignalProcessor):
     """
     Processor to run the Lundeby algorithm and calculate the Schroeder integral.
+
+    With ``in_place`` the dB decay curves overwrite the envelopes, which are
+    removed from the data, and the linear curves are not kept, to save memory.
+
+    The block RMS and the Schroeder integral are accumulated in float64
+    whatever the precision of the envelopes.
     """
+    VERSION = 1
+
+    def __init__(self, fs: int, in_place: bool = False, precision: str = 'float64'):
+        super().__init__(fs, precision)
+        self.in_place = in_place
+
     def _calculate_rms_by_block(self, impulse_response, block_ms: int = 20) -> dict:
         import numpy as np
         
@@ -12,14 +24,14 @@ class DecayAnalyzer(SignalProcessor):
         num_blocks = len(impulse_response) // block_size
         trimmed_ir = impulse_response[:num_blocks * block_size]
         ir_blocks = trimmed_ir.reshape(num_blocks, block_size)
-        rms_per_block = np.sqrt(np.mean(ir_blocks**2, axis=1))
+        rms_per_block = np.sqrt(np.mean(np.asarray(ir_blocks, dtype=np.float64)**2, axis=1))
         return {'rms_values': rms_per_block, 'block_size': block_size}
 
     def _schroeder_integral(self, power_signal, fs: float, crossover_index: int = None) -> dict:
         import numpy as np
         
         dt = 1.0 / fs
-        p2 = power_signal**2
+        p2 = np.asarray(power_signal, dtype=np.float64)**2
         if crossover_index is None:
             crossover_index = len(p2)
         
@@ -44,10 +56,11 @@ class DecayAnalyzer(SignalProcessor):
         fs_rms = self.fs / block_size
         sch_data = self._schroeder_integral(rms_values, fs_rms)
         sch_db = to_db_scale(sch_data['schroeder_curve'])
+        sch_index = DecayCurveIndex(time_vector_rms, sch_db)
         
         noise_level = np.mean(sch_db[int(len(sch_db) * 0.9):])
         
-        reg = linear_regression_in_range(time_vector_rms, sch_db, 0, noise_level + 7.5)
+        reg = sch_index.regression(0, noise_level + 7.5)
         slope, intercept = reg['slope'], reg['intercept']
         
         crossover_time = (noise_level - intercept) / slope if slope != 0 else float('inf')
@@ -65,7 +78,7 @@ class DecayAnalyzer(SignalProcessor):
             upper_db, lower_db = -5.0, noise_level + 10.0
             if lower_db >= upper_db: break
 
-            reg = linear_regression_in_range(time_vector_rms, sch_db, upper_db, lower_db)
+            reg = sch_index.regression(upper_db, lower_db)
             slope, intercept = reg['slope'], reg['intercept']
             
             crossover_time = (noise_level - intercept) / slope if slope != 0 else float('inf')
@@ -77,22 +90,36 @@ class DecayAnalyzer(SignalProcessor):
         return {'crossover_index': crossover_index, 'noise_start_index': noise_start_index_final}
 
     def process(self, data: dict) -> dict:
+        """
+        Expects the ``(bands x samples)`` 'envelopes' matrix in the data.
+        Adds the 'decay_curves' (unless ``in_place``) and 'decay_curves_db'
+        matrices and the per-band 'noise_start_indices'.
+        """
+        import numpy as np
+
         envelopes = data['envelopes']
-        decay_curves = {}
-        decay_curves_db = {}
-        lundeby_data = {}
+        num_bands = len(envelopes)
+
+        decay_curves = None if self.in_place else np.empty_like(envelopes)
+        decay_curves_db = envelopes if self.in_place else np.empty_like(envelopes)
+        noise_start_indices = np.empty(num_bands, dtype=np.int64)
         
-        for freq, envelope in envelopes.items():
+        for row in range(num_bands):
+            envelope = envelopes[row]
             crossover_data = self._lundeby_crossover(envelope)
             crossover_index = crossover_data['crossover_index']
-            noise_start_index = crossover_data['noise_start_index']
+            noise_start_indices[row] = crossover_data['noise_start_index']
             
-            schroeder_data = self._schroeder_integral(envelope, self.fs, crossover_index)
-            decay_curves[freq] = schroeder_data
-            decay_curves_db[freq] = to_db_scale(schroeder_data['schroeder_curve'])
-            lundeby_data[freq] = {'noise_start_index': noise_start_index}
+            schroeder_curve = self._schroeder_integral(envelope, self.fs, crossover_index)['schroeder_curve']
+            if decay_curves is not None:
+                decay_curves[row] = schroeder_curve
+            # With in_place this overwrites the envelope, which is no longer needed
+            decay_curves_db[row] = to_db_scale(schroeder_curve)
 
-        data['decay_curves'] = decay_curves
+        if self.in_place:
+            del data['envelopes']
+        else:
+            data['decay_curves'] = decay_curves
         data['decay_curves_db'] = decay_curves_db
-        data['lundeby_data'] = lundeby_data
-        return data
\ No newline at end of file
+        data['noise_start_indices'] = noise_start_indices
+        return data
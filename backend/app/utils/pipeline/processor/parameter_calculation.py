@@ -1,77 +1,110 @@
 from app.utils.pipeline.abc import SignalProcessor
-from app.utils.pipeline.helpers import linear_regression_in_range
+from app.utils.pipeline.helpers import CumulativeEnergy, DecayCurveIndex
 
 class ParameterCalculator(SignalProcessor):
     """
     Final processor to calculate acoustic parameters according to ISO 3382.
+
+    Energies and regressions are computed in float64 from the band matrices.
+    Adds 'acoustic_parameters', a list with the parameters of each channel
+    keyed by band.
     """
-    def _calculate_clarity_and_definition(self, p_squared, noise_start_index: int) -> dict:
+    VERSION = 2
+
+    # Early/late boundaries of the clarity (C) and definition (D) parameters
+    CLARITY_LIMITS_MS = (50, 80)
+    DEFINITION_LIMITS_MS = (50,)
+
+    def _calculate_energy_parameters(self, filtered_signals, noise_start_indices) -> dict:
+        """
+        Computes the clarity, definition and centre time (in ms) of every row.
+
+        Each row is squared and accumulated once (see CumulativeEnergy); every
+        window energy is then a lookup, and the parameters of all rows are
+        computed together from those. Times are counted from the direct
+        sound (the peak), and the energy of the noise after the Lundeby noise
+        start is subtracted from every window.
+        """
         import numpy as np
-        
-        if noise_start_index >= len(p_squared) or noise_start_index < 0:
-            noise_start_index = max(0, len(p_squared) - 1)
-        
-        noise_slice = p_squared[noise_start_index:]
-        if len(noise_slice) == 0:
-            noise_power_per_sample = 0.0
-        else:
-            noise_power_per_sample = np.mean(noise_slice)
 
-        peak_index = np.argmax(p_squared)
+        num_rows, num_samples = filtered_signals.shape
+        limits_ms = sorted(set(self.CLARITY_LIMITS_MS + self.DEFINITION_LIMITS_MS))
+        sample_offsets = np.arange(num_samples, dtype=np.float64)
 
-        samples_50ms = int(0.050 * self.fs)
+        t0 = np.empty(num_rows, dtype=np.int64)
+        noise_start = np.empty(num_rows, dtype=np.int64)
+        moments = np.empty(num_rows)
+        total_energy = np.empty(num_rows)
+        decay_energy = np.empty(num_rows)
+        noise_energy = np.empty(num_rows)
+        early_energy = {limit: np.empty(num_rows) for limit in limits_ms}
+        early_samples = {limit: np.empty(num_rows, dtype=np.int64) for limit in limits_ms}
 
-        t0 = peak_index
-        t50 = min(t0 + samples_50ms, len(p_squared))
+        for row in range(num_rows):
+            energy = CumulativeEnergy(filtered_signals[row])
+            peak = int(np.argmax(energy.p_squared))
+            t0[row] = peak
+            # First moment of the energy after the direct sound, for Ts
+            moments[row] = energy.p_squared[peak:] @ sample_offsets[:num_samples - peak]
 
-        total_len = len(p_squared)
-        total_energy_raw = np.sum(p_squared)
-        total_energy_corrected = total_energy_raw - (total_len * noise_power_per_sample)
+            start = int(noise_start_indices[row])
+            if start >= num_samples or start < 0:
+                start = max(0, num_samples - 1)
+            noise_start[row] = start
 
-        early_50_len = t50 - t0
-        early_energy_50_raw = np.sum(p_squared[t0:t50])
-        early_energy_50_corrected = early_energy_50_raw - (early_50_len * noise_power_per_sample)
+            total_energy[row] = energy.prefix(num_samples)
+            decay_energy[row] = total_energy[row] - energy.prefix(peak)
+            noise_energy[row] = total_energy[row] - energy.prefix(start)
+            for limit in limits_ms:
+                stop = min(peak + int(limit / 1000 * self.fs), num_samples)
+                early_energy[limit][row] = energy.energy(peak, stop)
+                early_samples[limit][row] = stop - peak
 
-        late_energy_50_corrected = total_energy_corrected - early_energy_50_corrected
+        noise_power = noise_energy / (num_samples - noise_start)
+        total_corrected = np.maximum(total_energy - num_samples * noise_power, 1e-12)
 
-        # Ensure all values are valid and positive to prevent NaN/inf
-        total_energy_corrected = max(total_energy_corrected, 1e-12)
-        early_energy_50_corrected = max(early_energy_50_corrected, 1e-12)
-        late_energy_50_corrected = max(late_energy_50_corrected, 1e-12)
+        results = {}
+        for limit in self.CLARITY_LIMITS_MS:
+            early = early_energy[limit] - early_samples[limit] * noise_power
+            late = total_corrected - early
+            results[f'C{limit}'] = 10.0 * np.log10(np.maximum(early, 1e-12) / np.maximum(late, 1e-12))
+        for limit in self.DEFINITION_LIMITS_MS:
+            early = early_energy[limit] - early_samples[limit] * noise_power
+            results[f'D{limit}'] = 100.0 * np.maximum(early, 1e-12) / total_corrected
 
-        d50 = 100.0 * (early_energy_50_corrected / total_energy_corrected)
-        c50 = 10.0 * np.log10(early_energy_50_corrected / late_energy_50_corrected)
+        decay_samples = num_samples - t0
+        decay_corrected = decay_energy - decay_samples * noise_power
+        moment_corrected = moments - noise_power * decay_samples * (decay_samples - 1) / 2
+        results['Ts'] = 1000.0 * np.maximum(moment_corrected, 0.0) / np.maximum(decay_corrected, 1e-12) / self.fs
+        return results
 
-        return {'D50': d50, 'C50': c50}
-        
     def process(self, data: dict) -> dict:
         import numpy as np
-        
+
         decay_curves_db = data['decay_curves_db']
-        filtered_signals = data['filtered_signals']
-        lundeby_data = data['lundeby_data']
-        acoustic_parameters = {}
-        
-        for freq, curve_db in decay_curves_db.items():
-            time_vector = np.arange(len(curve_db)) / self.fs
+        channels = data.get('channels', 1)
+        acoustic_parameters = [{} for _ in range(channels)]
+
+        energy_parameters = self._calculate_energy_parameters(data['filtered_signals'], data['noise_start_indices'])
+        time_vector = np.arange(decay_curves_db.shape[1]) / self.fs
+
+        for row in range(len(decay_curves_db)):
+            band, channel = divmod(row, channels)
+            freq = data['band_frequencies'][band]
+            curve_db = decay_curves_db[row]
             norm_curve_db = curve_db - np.max(curve_db)
-            
-            edt_reg = linear_regression_in_range(time_vector, norm_curve_db, -1, -11)
-            t20_reg = linear_regression_in_range(time_vector, norm_curve_db, -5, -25)
-            t30_reg = linear_regression_in_range(time_vector, norm_curve_db, -5, -35)
-            
-            original_filtered_signal = filtered_signals[freq]
-            p_squared_for_clarity = original_filtered_signal ** 2
-            noise_start_index = lundeby_data[freq]['noise_start_index']
-            clarity_def_params = self._calculate_clarity_and_definition(p_squared_for_clarity, noise_start_index)
-
-            acoustic_parameters[str(freq)] = {
+
+            curve_index = DecayCurveIndex(time_vector, norm_curve_db)
+            edt_reg = curve_index.regression(-1, -11)
+            t20_reg = curve_index.regression(-5, -25)
+            t30_reg = curve_index.regression(-5, -35)
+
+            acoustic_parameters[channel][str(freq)] = {
                 'EDT': -60.0 / edt_reg['slope'],
                 'T60_from_T20': -60.0 / t20_reg['slope'],
                 'T60_from_T30': -60.0 / t30_reg['slope'],
-                'C50': clarity_def_params['C50'],
-                'D50': clarity_def_params['D50']
+                **{name: float(values[row]) for name, values in energy_parameters.items()}
             }
-        
+
         data['acoustic_parameters'] = acoustic_parameters
-        return data
\ No newline at end of file
+        return data
@@ -3,53 +3,95 @@ from app.utils.pipeline .abc import SignalProcessor
 class EnvelopeSmoother(SignalProcessor):
     """
     Processor to calculate the smoothed envelope for each filtered signal.
+
+    The FFTs follow the dtype of the filtered signals (single precision for
+    float32 matrices); the moving-average running sums always use float64.
     """
-    def __init__(self, fs: int, smoothing_window_ms: int = 5):
-        super().__init__(fs)
+    VERSION = 2
+
+    # Upper bound on the spectra of a batch of bands held in memory at once
+    MAX_BATCH_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, fs: int, smoothing_window_ms: int = 5, precision: str = 'float64'):
+        super().__init__(fs, precision)
         self.window_samples = int(smoothing_window_ms * 1e-3 * fs)
 
-    def _hilbert_transform(self, time_signal):
+    def _hilbert_envelopes(self, time_signals):
+        """
+        Magnitude of the analytic signal of each row of a 2-D array.
+
+        Uses real-input FFTs zero-padded to a fast length, processing the rows
+        as one batched transform.
+        """
         import numpy as np
-        
-        signal_length = len(time_signal)
+        from scipy import fft
+
+        num_signals, signal_length = time_signals.shape
         if signal_length == 0:
-            return np.array([])
-            
-        freq_domain_signal = np.fft.fft(time_signal)
-        
-        h = np.zeros(signal_length)
-        if signal_length > 1:
-            h[0] = 1
-            h[1:signal_length // 2] = 2
-            if signal_length % 2 == 0:
-                h[signal_length // 2] = 1
-        
-        analytic_signal = np.fft.ifft(freq_domain_signal * h)
-        return np.abs(analytic_signal)
+            return np.zeros((num_signals, 0), dtype=time_signals.dtype)
+
+        fft_length = fft.next_fast_len(signal_length, real=True)
+        spectrum = fft.rfft(time_signals, n=fft_length, axis=-1)
+
+        # One-sided spectrum of the analytic signal: double the positive
+        # frequencies, keep DC (and Nyquist for even lengths) as they are
+        spectrum[:, 1:(fft_length + 1) // 2] *= 2
+
+        analytic_spectrum = np.zeros((num_signals, fft_length), dtype=spectrum.dtype)
+        analytic_spectrum[:, :spectrum.shape[1]] = spectrum
+        analytic_signal = fft.ifft(analytic_spectrum, axis=-1, overwrite_x=True)
+        return np.abs(analytic_signal[:, :signal_length])
+
+    def _hilbert_transform(self, time_signal):
+        import numpy as np
+
+        return self._hilbert_envelopes(np.atleast_2d(time_signal))[0]
 
     def _moving_average_filter(self, signal_to_smooth, window_length: int):
+        """
+        Centered moving average with the same alignment as
+        ``np.convolve(signal, np.ones(w) / w, mode='same')``, computed in O(n)
+        from a running sum. Works on the last axis of 1-D or 2-D inputs.
+        """
         import numpy as np
         
         if window_length < 1:
             raise ValueError("Window length must be at least 1.")
-        if window_length == 1 or len(signal_to_smooth) == 0:
+        if window_length == 1 or signal_to_smooth.shape[-1] == 0:
             return signal_to_smooth
 
-        kernel = np.ones(window_length) / window_length
-        return np.convolve(signal_to_smooth, kernel, mode='same')
+        if window_length > signal_to_smooth.shape[-1]:
+            # np.convolve returns window_length samples in this case
+            kernel = np.ones(window_length) / window_length
+            if signal_to_smooth.ndim == 1:
+                return np.convolve(signal_to_smooth, kernel, mode='same')
+            return np.stack([np.convolve(row, kernel, mode='same') for row in signal_to_smooth])
+
+        padding = [(0, 0)] * (signal_to_smooth.ndim - 1) + [(window_length // 2 + 1, (window_length - 1) // 2)]
+        running_sum = np.cumsum(np.pad(signal_to_smooth, padding), axis=-1, dtype=np.float64)
+        smoothed = (running_sum[..., window_length:] - running_sum[..., :-window_length]) / window_length
+        return smoothed.astype(signal_to_smooth.dtype, copy=False)
 
     def process(self, data: dict) -> dict:
         """
-        Expects 'filtered_signals' in the data dictionary.
-        Adds 'envelopes' to the data.
+        Expects the ``(bands x samples)`` 'filtered_signals' matrix in the
+        data dictionary. Adds the matching 'envelopes' matrix to the data.
         """
+        import numpy as np
+
         filtered_signals = data['filtered_signals']
-        envelopes = {}
-        
-        for freq, signal_data in filtered_signals.items():
-            hilbert_envelope = self._hilbert_transform(signal_data)
-            smoothed_envelope = self._moving_average_filter(hilbert_envelope, self.window_samples)
-            envelopes[freq] = smoothed_envelope
-            
-        data['envelopes'] = envelopes
-        return data
\ No newline at end of file
+        num_bands, signal_length = filtered_signals.shape
+        # Complex spectrum plus the float64 running sum of each band
+        batch_size = max(1, self.MAX_BATCH_BYTES // max(1, 16 * signal_length))
+
+        envelopes = None
+        for start in range(0, num_bands, batch_size):
+            hilbert_envelopes = self._hilbert_envelopes(filtered_signals[start:start + batch_size])
+            smoothed_envelopes = self._moving_average_filter(hilbert_envelopes, self.window_samples)
+            if envelopes is None:
+                # Windows longer than the signal yield window-length envelopes
+                envelopes = np.empty((num_bands, smoothed_envelopes.shape[1]), dtype=self.precision)
+            envelopes[start:start + len(smoothed_envelopes)] = smoothed_envelopes
+
+        data['envelopes'] = envelopes if envelopes is not None else np.empty((0, signal_length), dtype=self.precision)
+        return data
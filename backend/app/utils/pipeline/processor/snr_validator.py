@@ -2,6 +2,8 @@ import warnings
 from app.utils.pipeline.abc import SignalProcessor
 
 class SNRValidator(SignalProcessor):
+    VERSION = 1
+
     def __init__(self, fs: int, noise_tail_percentage: float = 0.2):
         super().__init__(fs)
         if not 0 < noise_tail_percentage < 1:
@@ -53,6 +53,53 @@ def generar_sweep_inverse(duracion,fs=44100 ,f_inferior=20 ,f_superior=20000):
 
     return sweep.astype(np.float32), inverse_sweep.astype(np.float32), fs
 
+# Samples synthesized at once by sweep_chunks
+SWEEP_CHUNK_SAMPLES = 1 << 16
+
+def sweep_chunks(duration, fs=44100, f_inf=20, f_sup=20000, inverse=False, chunk_size=SWEEP_CHUNK_SAMPLES):
+    """
+    Yields the sweep of generar_sweep_inverse, or its inverse filter, in
+    float32 chunks of ``chunk_size`` samples, with the same values.
+
+    The signal is synthesized twice, once to find the peak it is normalized
+    by and once to yield it, so memory does not grow with the duration.
+    """
+    import numpy as np
+
+    num_samples = int(duration * fs)
+    R = np.log(f_sup / f_inf)
+    L = duration / R
+    K = L * 2 * np.pi * f_inf
+    step = duration / num_samples if num_samples else 0.0
+
+    def synthesize(start, stop):
+        t = np.arange(start, stop, dtype=np.float64) * step
+        if not inverse:
+            return np.sin(K * (np.exp(t / L) - 1))
+        # The inverse filter is the time-reversed sweep with a decaying amplitude
+        t_reversed = np.arange(num_samples - 1 - start, num_samples - 1 - stop, -1, dtype=np.float64) * step
+        block = f_inf / ((K / L) * (np.exp(t / L)))
+        block *= np.sin(K * (np.exp(t_reversed / L) - 1))
+        return block
+
+    bounds = [(start, min(start + chunk_size, num_samples)) for start in range(0, num_samples, chunk_size)]
+    peak = max((np.max(np.abs(synthesize(start, stop))) for start, stop in bounds), default=1.0)
+    for start, stop in bounds:
+        block = synthesize(start, stop)
+        block /= peak
+        yield block.astype(np.float32)
+
+def write_sweep_wav(path, duration, fs=44100, f_inf=20, f_sup=20000, inverse=False) -> None:
+    """
+    Writes the sweep (or inverse filter) as a WAV file chunk by chunk, in the
+    format of wav_to_b64.
+    """
+    import soundfile as sf
+
+    with sf.SoundFile(path, 'w', samplerate=fs, channels=1, format='WAV', subtype='PCM_16') as wav_file:
+        for chunk in sweep_chunks(duration, fs, f_inf, f_sup, inverse=inverse):
+            wav_file.write(chunk)
+
 def wav_to_b64(signal, fs):
     from soundfile import write
     buf = BytesIO()
@@ -60,62 +107,122 @@ def wav_to_b64(signal, fs):
     buf.seek(0)
     return base64.b64encode(buf.read()).decode('ascii')
 
+# Block length of the decimated envelope used to estimate the T60
+ENVELOPE_BLOCK_MS = 1.0
+
+def deconvolution_size(n_linear: int) -> int:
+    """
+    FFT size used to deconvolve into ``n_linear`` output samples.
+
+    The length is rounded up to a multiple of 1/8 of its octave before
+    picking a fast length, so recordings of similar lengths share an FFT
+    size (and a cached inverse spectrum) for at most 12.5% of padding.
+    """
+    from scipy import fft
+
+    quantum = max(1, (1 << (n_linear.bit_length() - 1)) // 8)
+    return fft.next_fast_len(-(-n_linear // quantum) * quantum, real=True)
+
+def inverse_filter_spectrum(inverse_filter, n_fft: int):
+    """Half spectrum of an inverse filter at ``n_fft`` points, as used by deconvolve."""
+    import numpy as np
+    from scipy import fft
+
+    return fft.rfft(np.asarray(inverse_filter, dtype=np.float32), n=n_fft)
+
+def deconvolve(recording, inverse_filter, inverse_spectrum=None):
+    """
+    Linear convolution of a recorded sweep with its inverse filter.
+
+    Uses real FFTs at a fast length (see deconvolution_size) in single
+    precision: the impulse response is stored as 16-bit PCM, whose -96 dB
+    quantization floor sits about 40 dB above the error of complex64
+    transforms. Only the two half spectra and the output are alive at once.
+    ``inverse_spectrum`` skips the transform of the inverse filter when it
+    is already known at the right size.
+    """
+    import numpy as np
+    from scipy import fft
+
+    n_linear = len(recording) + len(inverse_filter) - 1
+    n_fft = deconvolution_size(n_linear)
+    if inverse_spectrum is None:
+        inverse_spectrum = inverse_filter_spectrum(inverse_filter, n_fft)
+    elif len(inverse_spectrum) != n_fft // 2 + 1:
+        raise ValueError(f"The inverse spectrum must be computed at {n_fft} points")
+
+    spectrum = fft.rfft(np.asarray(recording, dtype=np.float32), n=n_fft)
+    spectrum *= inverse_spectrum
+    return fft.irfft(spectrum, n=n_fft, overwrite_x=True)[:n_linear]
+
+def estimate_t60(decay, fs: int, peak_value: float) -> float:
+    """
+    Rough T60 of an impulse response from its samples after the peak, used
+    to decide where to trim it.
+
+    Fits the -5 to -35 dB range of an energy envelope decimated to
+    ``ENVELOPE_BLOCK_MS`` blocks, relative to the peak. Returns 1 s when
+    there is no usable decay, and clips the estimate to 0.1-10 s.
+    """
+    import numpy as np
+
+    block_size = max(1, int(fs * ENVELOPE_BLOCK_MS / 1000))
+    num_blocks = len(decay) // block_size
+    blocks = np.asarray(decay[:num_blocks * block_size]).reshape(num_blocks, block_size)
+    block_energy = np.mean(np.square(blocks, dtype=np.float64), axis=1)
+    # The analytic signal holds twice the energy of the real one, so the
+    # levels line up with a Hilbert envelope relative to the peak
+    envelope_db = 10 * np.log10(2 * block_energy / peak_value ** 2 + 1e-18)
+
+    valid_blocks = np.flatnonzero((envelope_db >= -35) & (envelope_db <= -5))
+    if len(valid_blocks) * block_size <= int(0.05 * fs):
+        return 1.0
+
+    time_vals = (valid_blocks + 0.5) * block_size / fs
+    slope = np.polyfit(time_vals, envelope_db[valid_blocks], 1)[0]
+    if slope >= 0:
+        return 1.0
+    return float(np.clip(-60.0 / slope, 0.1, 10.0))
+
 def get_ir_from_deconvolution(
     recording,
     inverse_filter,
     fs: int,
     start_margin_ms: float = 20.0,
-    duration_factor: float = 4.0
+    duration_factor: float = 4.0,
+    inverse_spectrum=None
 ) -> dict | None:
+    """
+    Extracts the impulse response from a recorded sweep and its inverse
+    filter, trimmed from ``start_margin_ms`` before the direct sound to
+    ``duration_factor`` times the estimated T60 after it, and normalized.
+    ``inverse_spectrum`` is passed on to deconvolve.
+    """
     import numpy as np
-    from scipy.signal import hilbert
     
     try:
-        n_linear = len(recording) + len(inverse_filter) - 1
-        n_fft = 1 << int(np.ceil(np.log2(n_linear)))
+        ir_full = deconvolve(recording, inverse_filter, inverse_spectrum)
 
-        fft_rec = np.fft.fft(recording, n=n_fft)
-        fft_inv = np.fft.fft(inverse_filter, n=n_fft)
+        if len(ir_full) == 0:
+            return None
 
-        ir_full_complex = np.fft.ifft(fft_rec * fft_inv)
-        ir_full = np.real(ir_full_complex)
-        ir_full = ir_full[:n_linear]
+        # Largest magnitude without an |ir| temporary of the full length
+        max_index, min_index = int(np.argmax(ir_full)), int(np.argmin(ir_full))
+        peak_index = max_index if ir_full[max_index] >= -ir_full[min_index] else min_index
+        peak_value = float(np.abs(ir_full[peak_index]))
 
-        if len(ir_full) == 0 or np.all(ir_full == 0):
+        if peak_value == 0:
             return None
 
-        peak_index = np.argmax(np.abs(ir_full))
-        peak_value = np.abs(ir_full[peak_index])
-
         if peak_value < 1e-9:
-            max_abs = np.max(np.abs(ir_full))
-            if max_abs > 1e-9:
-                ir_full /= max_abs
             return {'audio_data': ir_full, 'fs': fs}
 
         start_samples = int(start_margin_ms * fs / 1000)
         start_index = max(0, peak_index - start_samples)
 
-        analytic_signal = hilbert(ir_full[peak_index:])
-        envelope = np.abs(analytic_signal)
-        envelope_db = 20 * np.log10(envelope / peak_value + 1e-9)
-
-        valid_indices = np.where((envelope_db >= -35) & (envelope_db <= -5))[0]
-        
-        if len(valid_indices) > int(0.05 * fs):
-            time_vals = valid_indices / fs
-            db_vals = envelope_db[valid_indices]
-            
-            try:
-                slope = np.polyfit(time_vals, db_vals, 1)[0]
-                if slope < 0:
-                    estimated_t60 = -60.0 / slope
-                    estimated_t60 = np.clip(estimated_t60, 0.1, 10.0)
-                else:
-                    estimated_t60 = 1.0
-            except:
-                estimated_t60 = 1.0
-        else:
+        try:
+            estimated_t60 = estimate_t60(ir_full[peak_index:], fs, peak_value)
+        except Exception:
             estimated_t60 = 1.0
 
         ir_duration = estimated_t60 * duration_factor
@@ -126,7 +233,9 @@ def get_ir_from_deconvolution(
             start_index = 0
             end_index = len(ir_full)
 
-        trimmed_ir = ir_full[start_index:end_index]
+        # Copy the segment so the full-length output can be released
+        trimmed_ir = ir_full[start_index:end_index].copy()
+        del ir_full
 
         max_abs_trimmed = np.max(np.abs(trimmed_ir))
         if max_abs_trimmed > 1e-9:
@@ -138,4 +247,4 @@ def get_ir_from_deconvolution(
         print(f"Error during deconvolution and trimming: {e}")
         import traceback
         traceback.print_exc()
-        return None
\ No newline at end of file
+        return None
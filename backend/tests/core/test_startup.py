@@ -0,0 +1,44 @@
+import asyncio
+
+from app.core.startup import import_time_report, main, preload_modules, run_dsp_warmup
+
+
+class TestStartup:
+
+    def test_preload_modules_reports_each_module(self):
+        timings = preload_modules(['json', 'numpy'])
+
+        assert set(timings) == {'json', 'numpy'}
+        assert all(value >= 0 for value in timings.values())
+
+    def test_dsp_warmup_runs_every_stage(self):
+        timings = run_dsp_warmup()
+        assert set(timings) == {'pipeline', 'spectrogram', 'csd'}
+
+    def test_import_time_report_groups_by_package(self):
+        report = import_time_report(['json'])
+        packages = [entry['package'] for entry in report]
+
+        assert 'json' in packages
+        assert report == sorted(report, key=lambda entry: entry['ms'], reverse=True)
+
+    def test_budget_check_fails_when_exceeded(self, capsys):
+        assert main(['json', '--budget-ms', '0']) == 1
+        assert main(['json', '--budget-ms', '100000']) == 0
+
+    def test_failed_warmup_is_not_ready(self, monkeypatch):
+        import app.main as main_module
+
+        async def failing_warm_up(*args):
+            raise RuntimeError("no numpy")
+
+        monkeypatch.setattr(main_module, 'warm_up', failing_warm_up)
+        monkeypatch.setattr(main_module.app.state, 'ready', False, raising=False)
+        monkeypatch.setattr(main_module.app.state, 'startup_report', {}, raising=False)
+
+        asyncio.run(main_module._run_warmup(main_module.app))
+        response = main_module.ready()
+
+        assert main_module.app.state.ready is False
+        assert response.status_code == 503
+        assert b'"failed"' in response.body and b'no numpy' in response.body
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+from app.core.config import settings
+from app.services.analysis_bundle import ANALYSIS_VIEWS, AnalysisContext, compute_analysis_bundle, view_version
+from app.services.plotting import plot_spectrogram, plot_csd, plot_waveform
+from app.services.response_encoding import to_json_compatible
+
+
+class TestAnalysisBundle:
+
+    def test_views_match_standalone_functions(self, synthetic_ri_single_band):
+        ri, fs = synthetic_ri_single_band['audio_data'], synthetic_ri_single_band['fs']
+        bundle = to_json_compatible(
+            compute_analysis_bundle(ri, fs, ['waveform', 'spectrogram', 'csd'], csd_bands=12)
+        )
+
+        assert bundle['waveform'] == to_json_compatible(plot_waveform(ri, fs))
+        assert bundle['spectrogram'] == to_json_compatible(plot_spectrogram(ri, fs))
+        assert bundle['csd'] == to_json_compatible(plot_csd(ri, fs, bands_per_oct=12))
+
+    def test_returns_only_requested_views_in_order(self, synthetic_ri_single_band):
+        ri, fs = synthetic_ri_single_band['audio_data'], synthetic_ri_single_band['fs']
+        bundle = compute_analysis_bundle(ri, fs, ['snr', 'waveform'])
+
+        assert list(bundle) == ['snr', 'waveform']
+        assert 'snr_db' in bundle['snr']
+
+    def test_all_views_are_computed(self, synthetic_ri_single_band):
+        ri, fs = synthetic_ri_single_band['audio_data'], synthetic_ri_single_band['fs']
+        bundle = compute_analysis_bundle(ri, fs, list(ANALYSIS_VIEWS))
+
+        assert set(bundle) == set(ANALYSIS_VIEWS)
+        assert 'parameters' in bundle['parameters']
+
+    def test_truncation_is_computed_once(self, synthetic_ri_single_band, monkeypatch):
+        import app.services.analysis_bundle as analysis_bundle
+
+        calls = []
+        original = analysis_bundle.find_truncation_index
+        monkeypatch.setattr(
+            analysis_bundle,
+            'find_truncation_index',
+            lambda signal, sr: calls.append(sr) or original(signal, sr)
+        )
+
+        ri, fs = synthetic_ri_single_band['audio_data'], synthetic_ri_single_band['fs']
+        compute_analysis_bundle(ri, fs, ['spectrogram', 'csd'])
+
+        assert len(calls) == 1
+
+    def test_unknown_view_raises(self):
+        with pytest.raises(ValueError):
+            compute_analysis_bundle(np.zeros(4800, dtype=np.float32), 48000, ['histogram'])
+
+
+class TestViewVersion:
+
+    def test_float32_results_have_their_own_version(self, monkeypatch):
+        reference = view_version('spectrogram')
+        monkeypatch.setattr(settings, 'DSP_PRECISION', 'float32')
+
+        assert view_version('spectrogram') == f"{reference}-float32"
+        assert view_version('waveform') == '1'
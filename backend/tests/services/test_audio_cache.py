@@ -0,0 +1,93 @@
+import threading
+
+import numpy as np
+import pytest
+from app.services.audio_cache import DecodedAudioCache
+
+
+def _entry(num_samples: int, sr: int = 44100):
+    return np.zeros(num_samples, dtype=np.float32), sr
+
+
+class TestDecodedAudioCache:
+
+    def test_hit_and_miss_counters(self):
+        cache = DecodedAudioCache(max_bytes=1024 * 1024)
+        key = ('uploads/a.wav', None, True)
+
+        assert cache.get(key) is None
+        cache.put(key, _entry(100))
+        assert cache.get(key) is not None
+
+        stats = cache.stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['entries'] == 1
+        assert stats['current_bytes'] == 400
+
+    def test_lru_eviction_respects_byte_budget(self):
+        cache = DecodedAudioCache(max_bytes=1000)
+        cache.put(('a', None, True), _entry(100))
+        cache.put(('b', None, True), _entry(100))
+        cache.get(('a', None, True))
+        cache.put(('c', None, True), _entry(100))
+
+        assert cache.get(('b', None, True)) is None
+        assert cache.get(('a', None, True)) is not None
+        assert cache.get(('c', None, True)) is not None
+        assert cache.stats()['evictions'] == 1
+        assert cache.stats()['current_bytes'] <= 1000
+
+    def test_oversized_entry_is_not_cached(self):
+        cache = DecodedAudioCache(max_bytes=100)
+        cache.put(('big', None, True), _entry(1000))
+
+        assert cache.get(('big', None, True)) is None
+        assert cache.stats()['current_bytes'] == 0
+
+    def test_oversized_loaded_signal_is_still_read_only(self):
+        cache = DecodedAudioCache(max_bytes=100)
+        signal, _ = cache.get_or_load(('big', None, True), lambda: _entry(1000))
+
+        with pytest.raises(ValueError):
+            signal[0] = 1.0
+
+    def test_cached_signal_is_read_only(self):
+        cache = DecodedAudioCache(max_bytes=1024 * 1024)
+        cache.put(('a', None, True), _entry(10))
+        signal, _ = cache.get(('a', None, True))
+
+        with pytest.raises(ValueError):
+            signal[0] = 1.0
+
+    def test_get_or_load_decodes_once_for_concurrent_callers(self):
+        cache = DecodedAudioCache(max_bytes=1024 * 1024)
+        calls = []
+        barrier = threading.Barrier(4)
+
+        def loader():
+            calls.append(1)
+            return _entry(10)
+
+        def worker():
+            barrier.wait()
+            cache.get_or_load(('a', None, True), loader)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+
+    def test_failed_load_is_not_cached(self):
+        cache = DecodedAudioCache(max_bytes=1024 * 1024)
+
+        def failing_loader():
+            raise RuntimeError("download failed")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_load(('a', None, True), failing_loader)
+
+        assert cache.get_or_load(('a', None, True), lambda: _entry(10)) is not None
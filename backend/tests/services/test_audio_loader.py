@@ -0,0 +1,59 @@
+import io
+
+import numpy as np
+import pytest
+import soundfile as sf
+from app.services.audio_loader import decode_audio
+
+
+def _encode(signal, fs: int, fmt: str = 'WAV', subtype: str = 'FLOAT') -> io.BytesIO:
+    buffer = io.BytesIO()
+    sf.write(buffer, signal, fs, format=fmt, subtype=subtype)
+    buffer.seek(0)
+    return buffer
+
+
+class TestDecodeAudio:
+
+    def test_mono_wav_matches_source(self):
+        signal = (0.1 * np.random.randn(4800)).astype(np.float32)
+        decoded, sr = decode_audio(_encode(signal, 48000))
+
+        assert sr == 48000
+        assert decoded.dtype == np.float32
+        np.testing.assert_array_equal(decoded, signal)
+
+    def test_stereo_is_downmixed_to_channel_mean(self):
+        stereo = (0.1 * np.random.randn(4800, 2)).astype(np.float32)
+        decoded, _ = decode_audio(_encode(stereo, 48000))
+
+        assert decoded.ndim == 1
+        assert decoded.flags.c_contiguous
+        np.testing.assert_allclose(decoded, stereo.mean(axis=1), atol=1e-7)
+
+    def test_multichannel_layout_without_downmix(self):
+        channels = (0.1 * np.random.randn(1000, 4)).astype(np.float32)
+        decoded, _ = decode_audio(_encode(channels, 44100), mono=False)
+
+        assert decoded.shape == (4, 1000)
+        np.testing.assert_array_equal(decoded, channels.T)
+
+    @pytest.mark.parametrize('fmt, subtype', [('WAV', 'PCM_16'), ('FLAC', 'PCM_24')])
+    def test_matches_librosa(self, fmt, subtype):
+        import librosa
+
+        stereo = (0.1 * np.random.randn(4410, 2)).astype(np.float32)
+        data = _encode(stereo, 44100, fmt, subtype).getvalue()
+
+        expected, expected_sr = librosa.load(io.BytesIO(data), sr=None, mono=True)
+        decoded, sr = decode_audio(io.BytesIO(data))
+
+        assert sr == expected_sr
+        np.testing.assert_allclose(decoded, expected, atol=1e-6)
+
+    def test_resamples_when_rate_is_requested(self):
+        signal = (0.1 * np.random.randn(48000)).astype(np.float32)
+        decoded, sr = decode_audio(_encode(signal, 48000), sr=16000)
+
+        assert sr == 16000
+        assert len(decoded) == 16000
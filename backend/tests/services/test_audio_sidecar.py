@@ -0,0 +1,56 @@
+import io
+import mmap
+
+import numpy as np
+import pytest
+from app.services import storage
+from app.services.audio_loader import load_audio, store_canonical_audio
+from app.services.audio_cache import get_audio_cache
+from app.services.audio_sidecar import HEADER_SIZE, decode_sidecar, encode_sidecar
+
+
+class TestAudioSidecar:
+
+    def test_mono_roundtrip(self):
+        signal = np.random.randn(1000).astype(np.float32)
+        decoded, sr = decode_sidecar(encode_sidecar(signal, 48000))
+
+        assert sr == 48000
+        assert decoded.shape == (1000,)
+        np.testing.assert_array_equal(decoded, signal)
+
+    def test_multichannel_roundtrip_is_channel_planar(self):
+        signal = np.random.randn(4, 500).astype(np.float32)
+        decoded, sr = decode_sidecar(encode_sidecar(signal, 44100))
+
+        assert decoded.shape == (4, 500)
+        np.testing.assert_array_equal(decoded, signal)
+
+    def test_decodes_memory_map_without_copy(self, tmp_path):
+        signal = np.arange(256, dtype=np.float32)
+        path = tmp_path / 'ir.wav.pcm'
+        path.write_bytes(encode_sidecar(signal, 44100).getvalue())
+
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        decoded, _ = decode_sidecar(mapped)
+
+        assert not decoded.flags.owndata
+        np.testing.assert_array_equal(decoded, signal)
+
+    def test_rejects_unknown_format(self):
+        with pytest.raises(ValueError):
+            decode_sidecar(io.BytesIO(b'\x00' * HEADER_SIZE))
+
+    def test_load_audio_reads_sidecar_and_downmixes(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(storage, '_storage', storage.LocalStorage(str(tmp_path), 'http://localhost:8000'))
+        stereo = np.stack([np.ones(100), np.zeros(100)]).astype(np.float32)
+        store_canonical_audio('uploads/stereo.ogg', stereo, 22050)
+        get_audio_cache().clear()
+
+        mono, sr = load_audio('uploads/stereo.ogg')
+        both, _ = load_audio('uploads/stereo.ogg', mono=False)
+
+        assert sr == 22050
+        np.testing.assert_allclose(mono, 0.5)
+        assert both.shape == (2, 100)
@@ -0,0 +1,79 @@
+import asyncio
+import os
+import time
+
+import numpy as np
+import pytest
+from fastapi import HTTPException
+from app.services.dsp_pool import DSPPool
+from app.services.get_snr import calculate_snr
+
+
+class TestDSPPool:
+
+    def test_worker_result_matches_inline(self, synthetic_ri_single_band):
+        ri = synthetic_ri_single_band['audio_data']
+        pool = DSPPool(max_workers=1, max_pending=2, shared_memory_min_bytes=1024)
+
+        try:
+            snr = asyncio.run(pool.run(calculate_snr, ri, noise_tail_percentage=0.2))
+        finally:
+            pool.shutdown()
+
+        assert snr == calculate_snr(ri, noise_tail_percentage=0.2)
+        assert pool.pending() == 0
+
+    def test_threadpool_mode_without_workers(self):
+        pool = DSPPool(max_workers=0, max_pending=2, shared_memory_min_bytes=1024)
+        result = asyncio.run(pool.run(np.sum, np.ones(10)))
+        assert result == 10.0
+
+    def test_rejects_when_queue_is_full(self):
+        pool = DSPPool(max_workers=0, max_pending=0, shared_memory_min_bytes=1024)
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(pool.run(np.sum, np.ones(10)))
+
+        assert exc_info.value.status_code == 503
+        assert 'Retry-After' in exc_info.value.headers
+
+    def test_recovers_from_a_dead_worker(self):
+        pool = DSPPool(max_workers=1, max_pending=2, shared_memory_min_bytes=1024)
+
+        try:
+            with pytest.raises(HTTPException) as exc_info:
+                asyncio.run(pool.run(os._exit, 1))
+            result = asyncio.run(pool.run(np.sum, np.ones(10)))
+        finally:
+            pool.shutdown()
+
+        assert exc_info.value.status_code == 503
+        assert 'Retry-After' in exc_info.value.headers
+        assert result == 10.0
+        assert pool.pending() == 0
+
+    def test_cancelled_caller_keeps_the_slot_until_the_worker_returns(self):
+        pool = DSPPool(max_workers=1, max_pending=2, shared_memory_min_bytes=1024)
+
+        async def scenario():
+            # Start the worker process so the job below is running when cancelled
+            await pool.run(np.sum, np.ones(10))
+            task = asyncio.create_task(pool.run(time.sleep, 0.5))
+            await asyncio.sleep(0.2)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            pending_after_cancel = pool.pending()
+
+            deadline = time.monotonic() + 10
+            while pool.pending() and time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+            return pending_after_cancel, pool.pending()
+
+        try:
+            pending_after_cancel, pending_after_job = asyncio.run(scenario())
+        finally:
+            pool.shutdown()
+
+        assert pending_after_cancel == 1
+        assert pending_after_job == 0
@@ -26,7 +26,9 @@ class TestParametersPipeline:
             assert 'T60_from_T20' in parameters[freq_str]
             assert 'T60_from_T30' in parameters[freq_str]
             assert 'C50' in parameters[freq_str]
+            assert 'C80' in parameters[freq_str]
             assert 'D50' in parameters[freq_str]
+            assert 'Ts' in parameters[freq_str]
     
     def test_t60_accuracy_with_known_values(self, synthetic_ri_multi_band, known_t60_values):
         result = synthetic_ri_multi_band
@@ -107,6 +109,26 @@ class TestParametersPipeline:
         for freq_str, values in parameters.items():
             d50 = values['D50']
             assert 0 <= d50 <= 100, f"D50 at {freq_str}Hz out of range [0,100]: {d50}"
+
+    def test_energy_parameters_match_exponential_decay(self, synthetic_ri_multi_band, known_t60_values):
+        result = synthetic_ri_multi_band
+
+        params = process_impulse_response(
+            ri=result['audio_data'],
+            fs=result['fs'],
+            filter_type=1,
+            smoothing_window_ms=10
+        )
+
+        for freq_str, t60 in known_t60_values.items():
+            values = params['parameters'][freq_str]
+            # Energy decays as exp(-13.8 t / T60): Ts = T60 / 13.8 and
+            # C = 10 log10(exp(13.8 te / T60) - 1) for an early limit te
+            decay_rate = 6 * np.log(10) / t60
+            assert values['Ts'] == pytest.approx(1000 / decay_rate, rel=0.1)
+            assert values['C80'] > values['C50']
+            assert values['C80'] == pytest.approx(10 * np.log10(np.expm1(0.08 * decay_rate)), abs=1.5)
+            assert values['D50'] == pytest.approx(100 / (1 + 10 ** (-values['C50'] / 10)), rel=0.01)
     
     def test_different_filter_types(self, synthetic_ri_single_band):
         result = synthetic_ri_single_band
@@ -216,3 +238,28 @@ class TestParametersPipeline:
         
         assert 'parameters' in params
         assert len(params['parameters']) > 0
+
+    @pytest.mark.parametrize("filter_type", [1, 3])
+    def test_band_parallel_matches_serial(self, synthetic_ri_multi_band, filter_type):
+        result = synthetic_ri_multi_band
+        ri = result['audio_data']
+        fs = result['fs']
+
+        serial = process_impulse_response(
+            ri=ri,
+            fs=fs,
+            filter_type=filter_type,
+            smoothing_window_ms=10,
+            band_workers=1
+        )
+
+        parallel = process_impulse_response(
+            ri=ri,
+            fs=fs,
+            filter_type=filter_type,
+            smoothing_window_ms=10,
+            band_workers=4
+        )
+
+        assert list(parallel['parameters']) == list(serial['parameters'])
+        assert parallel == serial
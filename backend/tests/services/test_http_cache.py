@@ -0,0 +1,125 @@
+import asyncio
+import io
+
+import pytest
+from fastapi import Request
+from app.services.http_cache import etag_matches, file_response, make_etag, parse_byte_range, view_response
+
+KEY = 'uploads/5b0c8a4e-0000-4000-8000-000000000000.wav'
+
+
+def _request(**headers) -> Request:
+    scope = {
+        'type': 'http',
+        'method': 'GET',
+        'path': f'/api/snr/{KEY}',
+        'headers': [(name.replace('_', '-').encode(), value.encode()) for name, value in headers.items()]
+    }
+    return Request(scope)
+
+
+class TestEtagMatches:
+
+    def test_exact_and_weak_match(self):
+        etag = make_etag('a', 'b')
+
+        assert etag_matches(_request(if_none_match=etag), etag)
+        assert etag_matches(_request(if_none_match=f'"other", W/{etag}'), etag)
+        assert etag_matches(_request(if_none_match='*'), etag)
+
+    def test_no_match(self):
+        assert not etag_matches(_request(), make_etag('a'))
+        assert not etag_matches(_request(if_none_match=make_etag('b')), make_etag('a'))
+
+
+class TestViewResponse:
+
+    def _respond(self, request, file_key=KEY, calls=None):
+        async def compute():
+            if calls is not None:
+                calls.append(1)
+            return {"snr_db": 40.0}
+
+        return asyncio.run(view_response(request, file_key, ['snr'], compute, arrays=False))
+
+    def test_sets_cache_headers_on_immutable_keys(self):
+        response = self._respond(_request())
+
+        assert response.status_code == 200
+        assert response.headers['etag'].startswith('"')
+        # Version bumps must reach clients through revalidation
+        assert 'no-cache' in response.headers['cache-control']
+        assert 'immutable' not in response.headers['cache-control']
+
+    def test_matching_etag_returns_304_without_computing(self):
+        etag = self._respond(_request()).headers['etag']
+        calls = []
+
+        response = self._respond(_request(if_none_match=etag), calls=calls)
+
+        assert response.status_code == 304
+        assert response.headers['etag'] == etag
+        assert calls == []
+
+    def test_representation_changes_the_etag(self):
+        identity = self._respond(_request()).headers['etag']
+        gzip = self._respond(_request(accept_encoding='gzip')).headers['etag']
+
+        assert identity != gzip
+
+    def test_mutable_keys_are_not_cached(self):
+        response = self._respond(_request(), file_key='recordings/take.wav')
+
+        assert 'etag' not in response.headers
+        assert 'cache-control' not in response.headers
+
+
+class TestFileResponse:
+
+    @pytest.mark.parametrize("header, expected", [
+        (None, None),
+        ('bytes=0-43', (0, 44)),
+        ('bytes=100-', (100, 1000)),
+        ('bytes=-10', (990, 1000)),
+        ('bytes=10-5000', (10, 1000)),
+        ('bytes=5-2', None),
+        ('bytes=0-1,3-4', None),
+        ('items=0-1', None)
+    ])
+    def test_parse_byte_range(self, header, expected):
+        assert parse_byte_range(header, 1000) == expected
+
+    @pytest.mark.parametrize("header", ['bytes=1000-', 'bytes=-0'])
+    def test_unsatisfiable_ranges(self, header):
+        with pytest.raises(ValueError):
+            parse_byte_range(header, 1000)
+
+    def _body(self, response) -> bytes:
+        async def read():
+            return b''.join([chunk async for chunk in response.body_iterator])
+        return asyncio.run(read())
+
+    def _file(self, tmp_path):
+        path = tmp_path / 'a.wav'
+        path.write_bytes(bytes(range(256)) * 4)
+        return open(path, 'rb')
+
+    def test_serves_a_single_range(self, tmp_path):
+        response = file_response(_request(range='bytes=10-19'), self._file(tmp_path), 'audio/wav', headers={'ETag': '"e"'})
+
+        assert response.status_code == 206
+        assert response.headers['content-range'] == 'bytes 10-19/1024'
+        assert self._body(response) == bytes(range(10, 20))
+
+    def test_if_range_mismatch_sends_the_whole_file(self, tmp_path):
+        request = _request(range='bytes=10-19', if_range='"old"')
+        response = file_response(request, self._file(tmp_path), 'audio/wav', headers={'ETag': '"e"'})
+
+        assert response.status_code == 200
+        assert len(self._body(response)) == 1024
+
+    def test_unsatisfiable_range_is_416(self, tmp_path):
+        response = file_response(_request(range='bytes=2000-'), self._file(tmp_path), 'audio/wav')
+
+        assert response.status_code == 416
+        assert response.headers['content-range'] == 'bytes */1024'
@@ -0,0 +1,183 @@
+import json
+import time
+import pytest
+from fastapi import HTTPException
+from app.services.jobs import (
+    CANCELLED, FAILED, QUEUED, RUNNING, SUCCEEDED, MemoryJobQueue, RedisJobQueue, SQLiteJobQueue
+)
+from app.services.jobs.worker import JobWorker
+
+
+@pytest.fixture(params=['memory', 'sqlite', 'redis'])
+def queue(request, tmp_path):
+    if request.param == 'memory':
+        return MemoryJobQueue()
+    if request.param == 'redis':
+        import fakeredis
+        return RedisJobQueue(client=fakeredis.FakeRedis(decode_responses=True))
+    return SQLiteJobQueue(str(tmp_path / 'jobs.sqlite3'))
+
+
+def _age(queue, job_id, seconds):
+    """Moves the last update of a job ``seconds`` into the past."""
+    if isinstance(queue, MemoryJobQueue):
+        queue._jobs[job_id].updated_at -= seconds
+    elif isinstance(queue, RedisJobQueue):
+        client, key = queue._client, queue._job_key(job_id)
+        job = json.loads(client.get(key))
+        job['updated_at'] -= seconds
+        client.set(key, json.dumps(job))
+        for index_key in (queue._running_key, queue._finished_key):
+            if client.zscore(index_key, job_id) is not None:
+                client.zadd(index_key, {job_id: job['updated_at']})
+    else:
+        queue._connection.execute('UPDATE jobs SET updated_at = updated_at - ? WHERE id = ?', (seconds, job_id))
+
+
+class TestJobQueue:
+
+    def test_claims_jobs_in_submission_order(self, queue):
+        first = queue.submit('parameters', {'file_key': 'a.wav'})
+        second = queue.submit('parameters', {'file_key': 'b.wav'})
+
+        claimed = queue.claim('w1', lease_s=60, max_attempts=2)
+
+        assert claimed.id == first.id
+        assert claimed.status == RUNNING
+        assert claimed.attempts == 1
+        assert claimed.params == {'file_key': 'a.wav'}
+        assert queue.claim('w2', lease_s=60, max_attempts=2).id == second.id
+        assert queue.claim('w3', lease_s=60, max_attempts=2) is None
+
+    def test_heartbeat_records_progress(self, queue):
+        job = queue.submit('parameters', {})
+        queue.claim('w1', lease_s=60, max_attempts=2)
+
+        assert queue.heartbeat(job.id, 'w1', 0.5, "Halfway") is True
+        assert queue.heartbeat(job.id, 'w2', 0.9) is False
+
+        status = queue.get(job.id)
+        assert (status.progress, status.message) == (0.5, "Halfway")
+
+    def test_finish_stores_the_result(self, queue):
+        job = queue.submit('parameters', {})
+        queue.claim('w1', lease_s=60, max_attempts=2)
+
+        queue.finish(job.id, 'w1', SUCCEEDED, result={'parameters': {'1000': {'EDT': 1.2}}})
+
+        finished = queue.get(job.id)
+        assert finished.status == SUCCEEDED
+        assert finished.progress == 1.0
+        assert finished.result == {'parameters': {'1000': {'EDT': 1.2}}}
+        assert 'result' not in finished.to_status()
+
+    def test_cancel_queued_and_running_jobs(self, queue):
+        running = queue.submit('parameters', {})
+        queued = queue.submit('parameters', {})
+        queue.claim('w1', lease_s=60, max_attempts=2)
+
+        assert queue.cancel(queued.id).status == CANCELLED
+        assert queue.cancel(running.id).status == RUNNING
+        assert queue.heartbeat(running.id, 'w1') is False
+        assert queue.claim('w2', lease_s=60, max_attempts=2) is None
+        assert queue.cancel('unknown') is None
+
+    def test_stale_jobs_are_retried_then_failed(self, queue):
+        job = queue.submit('calculate_ir', {})
+        queue.claim('w1', lease_s=60, max_attempts=2)
+        _age(queue, job.id, 120)
+
+        retried = queue.claim('w2', lease_s=60, max_attempts=2)
+        assert (retried.id, retried.worker_id, retried.attempts) == (job.id, 'w2', 2)
+        assert queue.heartbeat(job.id, 'w1') is False
+
+        _age(queue, job.id, 120)
+        assert queue.claim('w3', lease_s=60, max_attempts=2) is None
+        assert queue.get(job.id).status == FAILED
+
+    def test_purge_removes_old_finished_jobs(self, queue):
+        done = queue.submit('parameters', {})
+        pending = queue.submit('parameters', {})
+        queue.claim('w1', lease_s=60, max_attempts=2)
+        queue.finish(done.id, 'w1', SUCCEEDED, result={})
+        _age(queue, done.id, 120)
+        _age(queue, pending.id, 120)
+
+        assert [purged.id for purged in queue.purge(max_age_s=60)] == [done.id]
+        assert queue.get(done.id) is None
+        assert queue.get(pending.id).status == QUEUED
+
+
+class TestJobWorker:
+
+    def _worker(self, queue, handlers, cleanup=lambda job: None):
+        return JobWorker(queue, lease_s=60, worker_id='w1', handlers=handlers, cleanup=cleanup)
+
+    def test_runs_jobs_and_maps_outcomes(self, queue):
+        def handler(params, progress):
+            progress(0.5, "Working")
+            if params['outcome'] == 'http':
+                raise HTTPException(status_code=404, detail="File not found")
+            if params['outcome'] == 'error':
+                raise RuntimeError("boom")
+            return {'value': params['outcome']}
+
+        worker = self._worker(queue, {'test': handler})
+        ok = queue.submit('test', {'outcome': 'ok'})
+        http = queue.submit('test', {'outcome': 'http'})
+        error = queue.submit('test', {'outcome': 'error'})
+        unknown = queue.submit('other', {})
+
+        while worker.run_one() is not None:
+            pass
+
+        assert queue.get(ok.id).result == {'value': 'ok'}
+        assert (queue.get(http.id).status, queue.get(http.id).error) == (FAILED, "File not found")
+        assert queue.get(error.id).error == "Error processing job: boom"
+        assert queue.get(unknown.id).error == "Unknown job kind 'other'."
+
+    def test_cancelled_job_stops_at_the_next_checkpoint(self, queue):
+        def handler(params, progress):
+            queue.cancel(job.id)
+            progress(0.5)
+            return {}
+
+        worker = self._worker(queue, {'test': handler})
+        job = queue.submit('test', {})
+
+        worker.run_one()
+
+        assert queue.get(job.id).status == CANCELLED
+
+    def test_finished_jobs_are_cleaned_up(self, queue):
+        cleaned = []
+
+        def handler(params, progress):
+            if params['outcome'] == 'lost':
+                # Another worker took the job over; its inputs are still needed
+                _age(queue, job.id, 120)
+                queue.claim('w2', lease_s=60, max_attempts=3)
+            return {}
+
+        worker = self._worker(queue, {'test': handler}, cleanup=lambda job: cleaned.append(job.id))
+        done = queue.submit('test', {'outcome': 'ok'})
+        job = queue.submit('test', {'outcome': 'lost'})
+
+        worker.run_one()
+        worker.run_one()
+
+        assert cleaned == [done.id]
+
+    def test_background_threads_drain_the_queue(self, queue):
+        worker = JobWorker(
+            queue, concurrency=2, poll_interval_s=0.01, handlers={'test': lambda params, progress: params}
+        )
+        jobs = [queue.submit('test', {'n': n}) for n in range(5)]
+
+        worker.start()
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline and not all(queue.get(job.id).finished for job in jobs):
+            time.sleep(0.01)
+        worker.stop(timeout=5)
+
+        assert [queue.get(job.id).result for job in jobs] == [{'n': n} for n in range(5)]
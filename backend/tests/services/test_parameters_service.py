@@ -0,0 +1,76 @@
+import asyncio
+import json
+import pytest
+from fastapi import HTTPException
+from app.services import parameters_service
+
+
+async def _collect(stream) -> list[dict]:
+    return [json.loads(line) async for line in stream]
+
+
+class TestStreamParametersBatch:
+
+    @pytest.fixture
+    def delays(self, monkeypatch):
+        """Fake per-file computations that take ``delays[file_key]`` seconds."""
+        delays = {}
+        running = {'now': 0, 'max': 0}
+
+        async def fake_cached_view(file_key, view, compute, **band_settings):
+            return await compute()
+
+        async def fake_compute(file_key, bands, multichannel=False):
+            running['now'] += 1
+            running['max'] = max(running['max'], running['now'])
+            try:
+                await asyncio.sleep(delays[file_key])
+                if file_key == 'missing.wav':
+                    raise HTTPException(status_code=404, detail="File not found")
+                return {'parameters': {'1000': {'EDT': delays[file_key], 'bands': bands}}}
+            finally:
+                running['now'] -= 1
+
+        monkeypatch.setattr(parameters_service, 'cached_view', fake_cached_view)
+        monkeypatch.setattr(parameters_service, 'compute_parameters', fake_compute)
+        delays['running'] = running
+        return delays
+
+    def test_yields_in_completion_order(self, delays):
+        delays.update({'slow.wav': 0.2, 'fast.wav': 0.01, 'medium.wav': 0.05})
+        stream = parameters_service.stream_parameters_batch(['slow.wav', 'fast.wav', 'medium.wav'], bands=3)
+
+        lines = asyncio.run(_collect(stream))
+
+        assert [line['file'] for line in lines] == ['fast.wav', 'medium.wav', 'slow.wav']
+        assert [line['index'] for line in lines] == [1, 2, 0]
+        assert lines[0] == {
+            'index': 1, 'file': 'fast.wav', 'status': 200,
+            'parameters': {'1000': {'EDT': 0.01, 'bands': 3}}
+        }
+
+    def test_errors_are_reported_per_file(self, delays):
+        delays.update({'missing.wav': 0, 'ok.wav': 0.01})
+        stream = parameters_service.stream_parameters_batch(['missing.wav', 'ok.wav'], bands=1)
+
+        lines = {line['file']: line for line in asyncio.run(_collect(stream))}
+
+        assert lines['missing.wav']['status'] == 404
+        assert lines['missing.wav']['error'] == "File not found"
+        assert lines['ok.wav']['status'] == 200
+
+    def test_concurrency_is_bounded(self, delays):
+        files = [f'{index}.wav' for index in range(8)]
+        delays.update({file_key: 0.01 for file_key in files})
+        stream = parameters_service.stream_parameters_batch(files, bands=1, concurrency=3)
+
+        assert len(asyncio.run(_collect(stream))) == len(files)
+        assert delays['running']['max'] == 3
+
+    def test_non_finite_results_become_errors(self):
+        line = json.loads(parameters_service._ndjson_line(
+            {'index': 0, 'file': 'a.wav', 'status': 200, 'parameters': {'1000': {'EDT': float('nan')}}}
+        ))
+
+        assert line['index'] == 0
+        assert line['status'] == 500
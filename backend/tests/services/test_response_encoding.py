@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+from app.services.response_encoding import (
+    decode_arrays,
+    encode_arrays,
+    negotiate_array_dtype,
+    to_json_compatible
+)
+
+
+def _spectrogram_payload():
+    return {
+        "Sxx": np.random.randn(64, 32),
+        "f": np.logspace(np.log10(20), np.log10(20000), 64),
+        "t": np.linspace(0, 1, 32),
+        "min_db": np.float64(-80.0),
+        "max_db": 0
+    }
+
+
+class TestNegotiateArrayDtype:
+
+    @pytest.mark.parametrize("accept", [None, "", "application/json", "*/*"])
+    def test_defaults_to_json(self, accept):
+        assert negotiate_array_dtype(accept) is None
+
+    def test_binary_defaults_to_float32(self):
+        assert negotiate_array_dtype("application/x-roomwaves-arrays") == 'float32'
+
+    def test_dtype_parameter(self):
+        accept = "application/json;q=0.5, application/x-roomwaves-arrays; dtype=float16"
+        assert negotiate_array_dtype(accept) == 'float16'
+
+    def test_unknown_dtype_falls_back_to_float32(self):
+        assert negotiate_array_dtype("application/x-roomwaves-arrays;dtype=int8") == 'float32'
+
+    def test_zero_quality_is_refused(self):
+        assert negotiate_array_dtype("application/x-roomwaves-arrays;q=0") is None
+
+
+class TestEncodeArrays:
+
+    def test_round_trip_float32(self):
+        payload = _spectrogram_payload()
+        decoded = decode_arrays(encode_arrays(payload))
+
+        np.testing.assert_array_equal(decoded["Sxx"], payload["Sxx"].astype(np.float32))
+        np.testing.assert_array_equal(decoded["f"], payload["f"].astype(np.float32))
+        assert decoded["min_db"] == -80.0
+        assert decoded["max_db"] == 0
+
+    def test_float16_keeps_axes_in_float32(self):
+        decoded = decode_arrays(encode_arrays(_spectrogram_payload(), dtype='float16'))
+
+        assert decoded["Sxx"].dtype == np.float16
+        assert decoded["f"].dtype == np.float32
+        assert decoded["t"].dtype == np.float32
+
+    def test_arrays_are_aligned(self):
+        data = encode_arrays({"a": np.arange(3, dtype=np.float32), "b": np.arange(5.0)})
+        header_length = int.from_bytes(data[:4], 'little')
+
+        assert (4 + header_length) % 8 == 0
+        decoded = decode_arrays(data)
+        np.testing.assert_array_equal(decoded["b"], np.arange(5.0))
+
+    def test_nested_payload(self):
+        payload = {"waveform": {"labels": np.arange(4.0), "data": np.ones(4)}, "snr": {"snr_db": 42.0}}
+        decoded = decode_arrays(encode_arrays(payload))
+
+        np.testing.assert_array_equal(decoded["waveform"]["data"], np.ones(4))
+        assert decoded["snr"] == {"snr_db": 42.0}
+
+    def test_binary_is_smaller_than_json(self):
+        import json
+
+        payload = _spectrogram_payload()
+        assert len(encode_arrays(payload)) < len(json.dumps(to_json_compatible(payload)))
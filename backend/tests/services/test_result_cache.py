@@ -0,0 +1,99 @@
+import asyncio
+
+import numpy as np
+import pytest
+from app.services import result_cache
+from app.services.result_cache import ResultCache, cached_result
+
+
+class TestResultCache:
+
+    def test_round_trip_with_arrays(self, tmp_path):
+        cache = ResultCache(str(tmp_path), max_bytes=10 * 1024 * 1024)
+        result = {"Sxx": np.random.randn(8, 4), "min_db": -80.0}
+
+        cache.put('uploads/a.wav', 'spectrogram', {}, '1', result)
+        cached = cache.get('uploads/a.wav', 'spectrogram', {}, '1')
+
+        np.testing.assert_array_equal(cached["Sxx"], result["Sxx"])
+        assert cached["min_db"] == -80.0
+        assert cache.stats()['hits'] == 1
+
+    def test_params_are_part_of_the_key(self, tmp_path):
+        cache = ResultCache(str(tmp_path), max_bytes=1024 * 1024)
+        cache.put('uploads/a.wav', 'csd', {'bands_per_oct': 12}, '1', {"value": 12})
+
+        assert cache.get('uploads/a.wav', 'csd', {'bands_per_oct': 24}, '1') is None
+        assert cache.get('uploads/a.wav', 'csd', {'bands_per_oct': 12}, '1') == {"value": 12}
+
+    def test_version_bump_invalidates_results(self, tmp_path):
+        cache = ResultCache(str(tmp_path), max_bytes=1024 * 1024)
+        cache.put('uploads/a.wav', 'parameters', {}, '1.1.1.1', {"value": 1})
+
+        assert cache.get('uploads/a.wav', 'parameters', {}, '1.2.1.1') is None
+
+        cache.put('uploads/a.wav', 'parameters', {}, '1.2.1.1', {"value": 2})
+        assert cache.stats()['entries'] == 1
+        assert cache.get('uploads/a.wav', 'parameters', {}, '1.2.1.1') == {"value": 2}
+
+    def test_evicts_least_recently_read(self, tmp_path):
+        payload = np.zeros(1000)
+        cache = ResultCache(str(tmp_path), max_bytes=int(2.5 * payload.nbytes))
+
+        cache.put('a', 'view', {}, '1', payload)
+        cache.put('b', 'view', {}, '1', payload)
+        cache.get('a', 'view', {}, '1')
+        cache.put('c', 'view', {}, '1', payload)
+
+        assert cache.get('a', 'view', {}, '1') is not None
+        assert cache.get('b', 'view', {}, '1') is None
+        assert cache.stats()['evictions'] == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        ResultCache(str(tmp_path), max_bytes=1024 * 1024).put('a', 'snr', {}, '1', {"snr_db": 40.0})
+
+        assert ResultCache(str(tmp_path), max_bytes=1024 * 1024).get('a', 'snr', {}, '1') == {"snr_db": 40.0}
+
+
+class TestCachedResult:
+
+    @pytest.fixture
+    def cache(self, tmp_path, monkeypatch):
+        cache = ResultCache(str(tmp_path), max_bytes=1024 * 1024)
+        monkeypatch.setattr(result_cache, '_result_cache', cache)
+        return cache
+
+    def test_computes_once(self, cache):
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return {"snr_db": 42.0}
+
+        async def run():
+            first = await cached_result('uploads/a.wav', 'snr', {}, '1', compute)
+            second = await cached_result('uploads/a.wav', 'snr', {}, '1', compute)
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert first == second == {"snr_db": 42.0}
+        assert len(calls) == 1
+
+    @pytest.mark.parametrize("file_key", ['a.wav', 'measurements/a.wav', 'jobs/inputs/a.wav'])
+    def test_mutable_keys_are_never_persisted(self, cache, file_key):
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return {"snr_db": 42.0}
+
+        async def run():
+            await cached_result(file_key, 'snr', {}, '1', compute)
+            await cached_result(file_key, 'snr', {}, '1', compute)
+
+        asyncio.run(run())
+
+        assert len(calls) == 2
+        assert cache.get(file_key, 'snr', {}, '1') is None
+        assert cache.stats()['entries'] == 0
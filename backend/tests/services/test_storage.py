@@ -0,0 +1,105 @@
+import io
+import mmap
+
+import pytest
+from fastapi import HTTPException
+from app.services.storage import DiskCachedStorage, LocalStorage
+
+
+class TestLocalStorage:
+
+    def test_upload_and_download_roundtrip(self, tmp_path):
+        storage = LocalStorage(str(tmp_path), "http://localhost:8000")
+        storage.upload(io.BytesIO(b"audio-bytes"), "uploads/a.wav")
+
+        assert storage.exists("uploads/a.wav")
+        with storage.download("uploads/a.wav") as stored:
+            assert stored.read() == b"audio-bytes"
+
+    def test_missing_file_raises_404(self, tmp_path):
+        storage = LocalStorage(str(tmp_path), "http://localhost:8000")
+
+        with pytest.raises(HTTPException) as exc_info:
+            storage.download("uploads/missing.wav")
+        assert exc_info.value.status_code == 404
+
+    def test_rejects_paths_outside_root(self, tmp_path):
+        storage = LocalStorage(str(tmp_path / "root"), "http://localhost:8000")
+
+        with pytest.raises(HTTPException) as exc_info:
+            storage.upload(io.BytesIO(b"x"), "../escape.wav")
+        assert exc_info.value.status_code == 400
+
+    def test_delete_removes_the_file(self, tmp_path):
+        storage = LocalStorage(str(tmp_path), "http://localhost:8000")
+        storage.upload(io.BytesIO(b"x"), "jobs/inputs/a.wav")
+
+        storage.delete("jobs/inputs/a.wav")
+        storage.delete("jobs/inputs/a.wav")
+
+        assert not storage.exists("jobs/inputs/a.wav")
+
+    def test_generate_url_points_to_files_route(self, tmp_path):
+        storage = LocalStorage(str(tmp_path), "http://localhost:8000/")
+        storage.upload(io.BytesIO(b"x"), "uploads/a.wav")
+
+        assert storage.generate_url("uploads/a.wav") == "http://localhost:8000/api/files/uploads/a.wav"
+
+
+class TestDiskCachedStorage:
+
+    def _storages(self, tmp_path, max_bytes=1024, use_mmap=True):
+        remote = LocalStorage(str(tmp_path / "remote"), "http://localhost:8000")
+        cached = DiskCachedStorage(remote, str(tmp_path / "cache"), max_bytes=max_bytes, use_mmap=use_mmap)
+        return remote, cached
+
+    def test_repeat_reads_are_served_from_disk(self, tmp_path):
+        remote, cached = self._storages(tmp_path)
+        remote.upload(io.BytesIO(b"0123456789"), "uploads/a.wav")
+
+        assert cached.download("uploads/a.wav").read() == b"0123456789"
+        second = cached.download("uploads/a.wav")
+
+        assert isinstance(second, mmap.mmap)
+        assert second.read() == b"0123456789"
+        assert cached.stats()['misses'] == 1
+        assert cached.stats()['hits'] == 1
+
+    def test_reads_without_mmap(self, tmp_path):
+        remote, cached = self._storages(tmp_path, use_mmap=False)
+        remote.upload(io.BytesIO(b"abc"), "uploads/a.wav")
+        cached.download("uploads/a.wav")
+
+        with cached.download("uploads/a.wav") as stored:
+            assert stored.read() == b"abc"
+
+    def test_evicts_least_recently_used_files(self, tmp_path):
+        remote, cached = self._storages(tmp_path, max_bytes=25)
+        for name in ("a", "b", "c"):
+            remote.upload(io.BytesIO(b"x" * 10), f"uploads/{name}.wav")
+
+        cached.download("uploads/a.wav")
+        cached.download("uploads/b.wav")
+        cached.download("uploads/c.wav")
+
+        stats = cached.stats()
+        assert stats['current_bytes'] <= 25
+        assert stats['evictions'] == 1
+
+    def test_upload_writes_through_to_cache(self, tmp_path):
+        remote, cached = self._storages(tmp_path)
+        cached.upload(io.BytesIO(b"fresh"), "uploads/new.wav")
+
+        assert remote.exists("uploads/new.wav")
+        assert cached.download("uploads/new.wav").read() == b"fresh"
+        assert cached.stats()['misses'] == 0
+
+    def test_delete_removes_the_cached_copy(self, tmp_path):
+        remote, cached = self._storages(tmp_path)
+        cached.upload(io.BytesIO(b"0123456789"), "jobs/inputs/a.wav")
+
+        cached.delete("jobs/inputs/a.wav")
+
+        assert not remote.exists("jobs/inputs/a.wav")
+        assert not cached.exists("jobs/inputs/a.wav")
+        assert cached.stats()['current_bytes'] == 0
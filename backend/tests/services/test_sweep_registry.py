@@ -0,0 +1,136 @@
+import base64
+import os
+
+import numpy as np
+import pytest
+from fastapi import HTTPException
+
+from app.services.sweep_registry import (
+    SweepFileCache, SweepRegistry, get_ir_from_sweep, make_sweep_id, parse_sweep_id
+)
+from app.utils.signals.signals import (
+    generar_sweep_inverse, get_ir_from_deconvolution, inverse_filter_spectrum, wav_to_b64
+)
+
+
+class TestSweepIds:
+
+    def test_round_trip(self):
+        sweep_id = make_sweep_id(3, 20, 20000, 48000)
+
+        assert sweep_id == "v1-3.0-20-20000-48000"
+        assert parse_sweep_id(sweep_id) == (3.0, 20, 20000, 48000)
+
+    def test_fractional_durations_round_trip(self):
+        assert parse_sweep_id(make_sweep_id(0.1, 20, 20000, 44100))[0] == 0.1
+
+    def test_durations_with_an_exponent_round_trip(self):
+        sweep_id = make_sweep_id(1e-05, 20, 20000, 48000)
+
+        assert sweep_id == "v1-1e-05-20-20000-48000"
+        assert parse_sweep_id(sweep_id) == (1e-05, 20, 20000, 48000)
+
+    @pytest.mark.parametrize("sweep_id", ["", "v1-3.0-20-20000", "v0-3.0-20-20000-48000", "v1-x-20-20000-48000"])
+    def test_malformed_ids_are_not_found(self, sweep_id):
+        with pytest.raises(HTTPException) as exc_info:
+            parse_sweep_id(sweep_id)
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.parametrize("parameters", [(0, 20, 20000, 48000), (3, 20000, 20, 48000), (3, 20, 20000, 10 ** 7)])
+    def test_out_of_range_parameters_are_rejected(self, parameters):
+        with pytest.raises(HTTPException) as exc_info:
+            parse_sweep_id(make_sweep_id(*parameters))
+        assert exc_info.value.status_code == 400
+
+
+class TestSweepRegistry:
+
+    def test_inverse_filter_matches_the_generated_one(self):
+        registry = SweepRegistry(64 * 1024 * 1024)
+
+        inverse, fs = registry.inverse_filter(make_sweep_id(1, 20, 20000, 8000))
+
+        _, expected, _ = generar_sweep_inverse(1, 8000, 20, 20000)
+        assert fs == 8000
+        np.testing.assert_array_equal(inverse, expected)
+
+    def test_spectra_are_cached_per_fft_size(self):
+        registry = SweepRegistry(64 * 1024 * 1024)
+        sweep_id = make_sweep_id(1, 20, 20000, 8000)
+        inverse, _ = registry.inverse_filter(sweep_id)
+
+        first = registry.inverse_spectrum(sweep_id, 16384)
+        again = registry.inverse_spectrum(sweep_id, 16384)
+        other = registry.inverse_spectrum(sweep_id, 32768)
+
+        assert again is first
+        assert len(other) == 32768 // 2 + 1
+        np.testing.assert_array_equal(first, inverse_filter_spectrum(inverse, 16384))
+        assert registry.stats()['entries'] == 3
+
+    def test_ir_from_sweep_matches_the_uploaded_inverse_filter(self):
+        sweep, inverse, fs = generar_sweep_inverse(1, 8000, 20, 4000)
+        recording = np.concatenate((np.zeros(800), sweep, np.zeros(4000))).astype(np.float32)
+
+        result = get_ir_from_sweep(recording, make_sweep_id(1, 20, 4000, 8000))
+
+        expected = get_ir_from_deconvolution(recording, inverse, fs)
+        assert result['fs'] == fs
+        np.testing.assert_array_equal(result['audio_data'], expected['audio_data'])
+
+
+class TestSweepFileCache:
+
+    def _read(self, cache, sweep_id, kind='sweep'):
+        with cache.open(sweep_id, kind) as wav_file:
+            return wav_file.read()
+
+    def test_files_match_the_base64_signals(self, tmp_path):
+        cache = SweepFileCache(str(tmp_path), 64 * 1024 * 1024)
+        sweep, inverse, fs = generar_sweep_inverse(1, 8000, 20, 4000)
+
+        for kind, signal in (('sweep', sweep), ('inverse', inverse)):
+            assert self._read(cache, make_sweep_id(1, 20, 4000, 8000), kind) == base64.b64decode(wav_to_b64(signal, fs))
+
+    def test_files_are_rendered_once(self, tmp_path):
+        cache = SweepFileCache(str(tmp_path), 64 * 1024 * 1024)
+        sweep_id = make_sweep_id(1, 20, 4000, 8000)
+
+        first = self._read(cache, sweep_id)
+        assert self._read(cache, sweep_id) == first
+        assert cache.stats()['misses'] == 1
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['current_bytes'] == len(first)
+
+    def test_least_recently_served_files_are_evicted(self, tmp_path):
+        cache = SweepFileCache(str(tmp_path), 20000)
+        first = make_sweep_id(1, 20, 4000, 8000)
+        self._read(cache, first)
+        os.utime(tmp_path / f"{first}-sweep.wav", (0, 0))
+
+        self._read(cache, make_sweep_id(1, 20, 2000, 8000))
+
+        assert [entry.name for entry in tmp_path.iterdir()] == [f"{make_sweep_id(1, 20, 2000, 8000)}-sweep.wav"]
+        assert cache.stats()['evictions'] == 1
+
+    def test_budget_is_shared_with_other_processes(self, tmp_path):
+        other = SweepFileCache(str(tmp_path), 20000)
+        cache = SweepFileCache(str(tmp_path), 20000)
+        sweep_id = make_sweep_id(1, 20, 4000, 8000)
+        self._read(other, sweep_id)
+        os.utime(tmp_path / f"{sweep_id}-sweep.wav", (0, 0))
+
+        self._read(cache, make_sweep_id(1, 20, 2000, 8000))
+
+        assert not (tmp_path / f"{sweep_id}-sweep.wav").exists()
+        assert cache.stats()['current_bytes'] <= 20000
+
+    def test_open_files_survive_eviction(self, tmp_path):
+        cache = SweepFileCache(str(tmp_path), 64 * 1024 * 1024)
+        sweep_id = make_sweep_id(1, 20, 4000, 8000)
+        expected = self._read(cache, sweep_id)
+
+        with cache.open(sweep_id, 'sweep') as wav_file:
+            os.remove(tmp_path / f"{sweep_id}-sweep.wav")
+            assert wav_file.read() == expected
+        assert self._read(cache, sweep_id) == expected
@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.core.config import settings
+from app.services import upload_service
+from app.services.storage import LocalStorage
+from app.services.storage.r2 import R2Storage
+
+BOUNDARY = 'roomwavesboundary'
+
+
+def _multipart_body(payload: bytes, content_type: str = 'audio/wav', field: str = 'file') -> bytes:
+    return (
+        f'--{BOUNDARY}\r\n'
+        f'Content-Disposition: form-data; name="{field}"; filename="ir.wav"\r\n'
+        f'Content-Type: {content_type}\r\n\r\n'
+    ).encode() + payload + f'\r\n--{BOUNDARY}--\r\n'.encode()
+
+
+def _request(body: bytes, chunk_size: int = 1000) -> Request:
+    chunks = [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+    messages = [
+        {'type': 'http.request', 'body': chunk, 'more_body': i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ]
+
+    async def receive():
+        return messages.pop(0)
+
+    scope = {
+        'type': 'http',
+        'method': 'POST',
+        'path': '/api/upload',
+        'headers': [(b'content-type', f'multipart/form-data; boundary={BOUNDARY}'.encode())]
+    }
+    return Request(scope, receive)
+
+
+@pytest.fixture
+def local_storage(tmp_path, monkeypatch):
+    storage = LocalStorage(str(tmp_path), 'http://localhost:8000')
+    monkeypatch.setattr(upload_service, 'get_storage', lambda: storage)
+    return storage
+
+
+class TestStreamUpload:
+
+    def test_streams_file_into_storage(self, local_storage):
+        payload = bytes(range(256)) * 40
+        result = asyncio.run(upload_service.stream_upload(_request(_multipart_body(payload))))
+
+        assert result['path'].startswith('uploads/')
+        assert result['path'].endswith('.wav')
+        assert result['size'] == len(payload)
+        with local_storage.download(result['path']) as stored:
+            assert stored.read() == payload
+
+    def test_aborts_as_soon_as_limit_is_exceeded(self, local_storage, monkeypatch, tmp_path):
+        monkeypatch.setattr(settings, 'MAX_FILE_SIZE_MB', 0)
+        body = _multipart_body(b'x' * 5000)
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(upload_service.stream_upload(_request(body)))
+
+        assert exc_info.value.status_code == 413
+        assert not list((tmp_path / 'uploads').glob('*'))
+
+    def test_rejects_disallowed_content_type(self, local_storage):
+        body = _multipart_body(b'x', content_type='text/plain')
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(upload_service.stream_upload(_request(body)))
+        assert exc_info.value.status_code == 400
+
+    def test_requires_file_field(self, local_storage):
+        body = _multipart_body(b'x', field='other')
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(upload_service.stream_upload(_request(body)))
+        assert exc_info.value.status_code == 422
+
+
+class _FakeS3Client:
+    def __init__(self):
+        self.parts = {}
+        self.objects = {}
+        self.aborted = False
+
+    def create_multipart_upload(self, Bucket, Key):
+        return {'UploadId': 'upload-1'}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.parts[PartNumber] = Body
+        return {'ETag': f'etag-{PartNumber}'}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        numbers = [part['PartNumber'] for part in MultipartUpload['Parts']]
+        self.objects[Key] = b''.join(self.parts[number] for number in numbers)
+
+    def put_object(self, Bucket, Key, Body):
+        self.objects[Key] = Body
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.aborted = True
+
+
+class TestR2MultipartWriter:
+
+    def _writer(self, part_size):
+        storage = R2Storage('http://r2', 'key', 'secret', 'bucket')
+        storage._client = _FakeS3Client()
+        writer = storage.open_upload('uploads/a.wav')
+        writer.part_size = part_size
+        return storage._client, writer
+
+    def test_sends_parts_while_writing(self):
+        client, writer = self._writer(part_size=10)
+        for _ in range(5):
+            writer.write(b'0123456')
+        assert len(client.parts) >= 2
+
+        writer.complete()
+        assert client.objects['uploads/a.wav'] == b'0123456' * 5
+        assert all(len(client.parts[n]) == 10 for n in range(1, len(client.parts)))
+
+    def test_small_objects_use_single_put(self):
+        client, writer = self._writer(part_size=100)
+        writer.write(b'abc')
+        writer.complete()
+
+        assert client.objects['uploads/a.wav'] == b'abc'
+        assert client.parts == {}
+
+    def test_abort_cancels_multipart_upload(self):
+        client, writer = self._writer(part_size=4)
+        writer.write(b'0123456789')
+        writer.abort()
+
+        assert client.aborted
+        assert 'uploads/a.wav' not in client.objects
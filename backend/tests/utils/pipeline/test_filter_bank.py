@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+from scipy import signal
+from app.utils.pipeline.constants import OCTAVE_FREQUENCIES, THIRD_OCTAVE_FREQUENCIES
+from app.utils.pipeline.filter_bank import FilterBank, get_filter_bank, prebuild_filter_banks
+
+
+class TestFilterBank:
+
+    @pytest.mark.parametrize("filter_type, frequencies", [(1, OCTAVE_FREQUENCIES), (3, THIRD_OCTAVE_FREQUENCIES)])
+    def test_bands(self, filter_type, frequencies):
+        assert FilterBank(48000, filter_type).center_frequencies == frequencies
+
+    def test_matches_direct_design(self):
+        bank = FilterBank(44100, filter_type=1)
+        ratio = np.power(2, 0.5)
+        expected = signal.iirfilter(12, [1000 / ratio, 1000 * ratio], btype='band', ftype='butter', fs=44100, output='sos')
+
+        np.testing.assert_array_equal(bank.sos[1000], expected)
+
+    def test_invalid_filter_type(self):
+        with pytest.raises(ValueError):
+            FilterBank(48000, filter_type=2)
+
+
+class TestGetFilterBank:
+
+    def test_is_cached_per_configuration(self):
+        assert get_filter_bank(48000, 3) is get_filter_bank(48000, 3)
+        assert get_filter_bank(48000, 1) is not get_filter_bank(44100, 1)
+
+    def test_prebuild(self):
+        get_filter_bank.cache_clear()
+        prebuild_filter_banks([44100, 48000])
+
+        assert get_filter_bank.cache_info().currsize == 4
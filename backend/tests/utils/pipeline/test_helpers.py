@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+from app.utils.pipeline.helpers import (
+    CumulativeEnergy, DecayCurveIndex, linear_regression_in_range, to_db_scale
+)
+
+RANGES = [(-1, -11), (-5, -25), (-5, -35), (0, -200), (-300, -400)]
+
+
+def _schroeder_db(fs: int = 48000, duration_s: float = 1.0):
+    rng = np.random.default_rng(0)
+    t = np.arange(int(fs * duration_s)) / fs
+    p_squared = (np.exp(-6.9 * t / 0.8) * rng.standard_normal(len(t))) ** 2
+    curve_db = to_db_scale(np.sum(p_squared) - np.cumsum(p_squared))
+    return t, curve_db - np.max(curve_db)
+
+
+class TestDecayCurveIndex:
+
+    @pytest.mark.parametrize("upper, lower", RANGES)
+    def test_matches_masked_regression(self, upper, lower):
+        t, curve_db = _schroeder_db()
+        index = DecayCurveIndex(t, curve_db)
+
+        assert index.monotonic
+        assert index.regression(upper, lower) == linear_regression_in_range(t, curve_db, upper, lower)
+
+    def test_range_indices(self):
+        y = np.array([0.0, -1.0, -2.0, -2.0, -3.0, -4.0])
+        index = DecayCurveIndex(np.arange(len(y)), y)
+
+        assert index.range_indices(-1, -3) == (1, 5)
+        assert index.range_indices(-10, -20) == (6, 6)
+
+    def test_non_monotonic_curve_falls_back(self):
+        x = np.arange(6, dtype=float)
+        y = np.array([0.0, -6.0, -2.0, -8.0, -4.0, -10.0])
+        index = DecayCurveIndex(x, y)
+
+        assert not index.monotonic
+        assert index.regression(-1, -9) == linear_regression_in_range(x, y, -1, -9)
+
+
+class TestCumulativeEnergy:
+
+    @pytest.mark.parametrize("start, stop", [(0, 0), (0, 1000), (3, 700), (255, 257), (256, 512), (100, 1001)])
+    def test_window_energy(self, start, stop):
+        signal = np.random.default_rng(1).standard_normal(1001).astype(np.float32)
+        energy = CumulativeEnergy(signal, block_size=64)
+
+        expected = np.sum(signal[start:stop].astype(np.float64) ** 2)
+        np.testing.assert_allclose(energy.energy(start, stop), expected, rtol=1e-12, atol=1e-12)
+        assert energy.p_squared.dtype == np.float64
+
+    def test_signal_shorter_than_a_block(self):
+        energy = CumulativeEnergy(np.array([1.0, 2.0, 3.0]), block_size=256)
+
+        assert len(energy) == 3
+        assert energy.prefix(3) == 14.0
+        assert energy.energy(1, 3) == 13.0
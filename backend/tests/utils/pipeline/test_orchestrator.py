@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+from app.utils.pipeline.constants import OCTAVE_FREQUENCIES
+from app.utils.pipeline.orchestrator import AcousticPipeline
+
+
+class TestAcousticPipeline:
+
+    def test_band_matrices(self, synthetic_ri_multi_band):
+        audio, fs = synthetic_ri_multi_band['audio_data'], synthetic_ri_multi_band['fs']
+        pipeline = AcousticPipeline(fs, filter_type=1, smoothing_window_ms=10)
+        pipeline.run(audio)
+        data = pipeline.processing_data
+
+        assert data['band_frequencies'] == OCTAVE_FREQUENCIES
+        shape = (len(OCTAVE_FREQUENCIES), len(audio))
+        for key in ('filtered_signals', 'envelopes', 'decay_curves', 'decay_curves_db'):
+            assert data[key].shape == shape
+            assert data[key].flags.c_contiguous
+        assert data['noise_start_indices'].shape == (len(OCTAVE_FREQUENCIES),)
+
+    def test_lean_keeps_only_results(self, synthetic_ri_multi_band):
+        audio, fs = synthetic_ri_multi_band['audio_data'], synthetic_ri_multi_band['fs']
+        full = AcousticPipeline(fs, filter_type=1, smoothing_window_ms=10)
+        lean = AcousticPipeline(fs, filter_type=1, smoothing_window_ms=10, lean=True)
+        full.run(audio)
+        lean.run(audio)
+
+        assert set(lean.processing_data) == set(AcousticPipeline.RESULT_KEYS)
+        assert lean.get_final_parameters() == full.get_final_parameters()
+
+    def test_lean_band_parallel(self, synthetic_ri_multi_band):
+        audio, fs = synthetic_ri_multi_band['audio_data'], synthetic_ri_multi_band['fs']
+        serial = AcousticPipeline(fs, filter_type=1, smoothing_window_ms=10)
+        parallel = AcousticPipeline(fs, filter_type=1, smoothing_window_ms=10, max_workers=3, lean=True)
+        serial.run(audio)
+        parallel.run(audio)
+
+        assert parallel.get_final_parameters() == serial.get_final_parameters()
+        np.testing.assert_array_equal(
+            parallel.processing_data['noise_start_indices'], serial.processing_data['noise_start_indices']
+        )
+
+    def test_float32_precision(self, synthetic_ri_multi_band):
+        audio, fs = synthetic_ri_multi_band['audio_data'], synthetic_ri_multi_band['fs']
+        reference = AcousticPipeline(fs, filter_type=1, smoothing_window_ms=10)
+        single = AcousticPipeline(fs, filter_type=1, smoothing_window_ms=10, precision='float32')
+        reference.run(audio)
+        single.run(audio)
+
+        for key in ('filtered_signals', 'envelopes', 'decay_curves_db'):
+            assert single.processing_data[key].dtype == np.float32
+
+        expected = reference.get_final_parameters()
+        for band, parameters in single.get_final_parameters().items():
+            for name, value in parameters.items():
+                np.testing.assert_allclose(value, expected[band][name], rtol=1e-4)
+
+    def test_invalid_precision(self):
+        with pytest.raises(ValueError):
+            AcousticPipeline(48000, filter_type=1, smoothing_window_ms=10, precision='float16')
+
+    def test_multichannel_matches_single_channel_runs(self, synthetic_ri_multi_band):
+        audio, fs = synthetic_ri_multi_band['audio_data'], synthetic_ri_multi_band['fs']
+        channels = np.stack([audio, 0.5 * audio[::-1].copy(), audio])
+        expected = []
+        for channel in channels:
+            pipeline = AcousticPipeline(fs, filter_type=1, smoothing_window_ms=10)
+            pipeline.run(channel)
+            expected.append(pipeline.get_final_parameters())
+
+        for max_workers in (1, 3):
+            pipeline = AcousticPipeline(fs, filter_type=1, smoothing_window_ms=10, max_workers=max_workers)
+            pipeline.run(channels)
+
+            assert pipeline.processing_data['filtered_signals'].shape == (len(OCTAVE_FREQUENCIES) * 3, len(audio))
+            assert pipeline.get_final_parameters() == expected
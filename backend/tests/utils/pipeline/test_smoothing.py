@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from scipy.signal import hilbert
+from app.utils.pipeline.processor import EnvelopeSmoother
+
+
+class TestMovingAverage:
+
+    @pytest.mark.parametrize("length, window", [(100, 4), (101, 5), (1000, 480), (50, 7), (10, 10)])
+    def test_matches_convolution(self, length, window):
+        signal = np.random.default_rng(0).standard_normal(length)
+        expected = np.convolve(signal, np.ones(window) / window, mode='same')
+
+        smoothed = EnvelopeSmoother(48000)._moving_average_filter(signal, window)
+
+        np.testing.assert_allclose(smoothed, expected, atol=1e-12)
+
+    def test_window_longer_than_signal(self):
+        signal = np.ones(3)
+        expected = np.convolve(signal, np.ones(10) / 10, mode='same')
+
+        np.testing.assert_array_equal(EnvelopeSmoother(48000)._moving_average_filter(signal, 10), expected)
+
+    def test_rows_are_smoothed_independently(self):
+        signals = np.random.default_rng(0).standard_normal((3, 200))
+        smoother = EnvelopeSmoother(48000)
+
+        batched = smoother._moving_average_filter(signals, 9)
+
+        for row, smoothed in zip(signals, batched):
+            np.testing.assert_allclose(smoothed, smoother._moving_average_filter(row, 9), atol=1e-12)
+
+
+class TestHilbertEnvelope:
+
+    @pytest.mark.parametrize("length", [4800, 4801, 10007])
+    def test_matches_scipy_away_from_the_edges(self, length):
+        fs = 48000
+        t = np.arange(length) / fs
+        signal = np.exp(-20 * t) * np.cos(2 * np.pi * 1000 * t)
+
+        envelope = EnvelopeSmoother(fs)._hilbert_transform(signal)
+        expected = np.abs(hilbert(signal))
+
+        interior = slice(length // 10, -length // 10)
+        np.testing.assert_allclose(envelope[interior], expected[interior], atol=1e-3 * np.max(expected))
+
+    def test_process_batches_all_bands(self):
+        fs = 48000
+        rng = np.random.default_rng(0)
+        signals = rng.standard_normal((3, 4800))
+        smoother = EnvelopeSmoother(fs, smoothing_window_ms=10)
+
+        envelopes = smoother.process({'filtered_signals': signals})['envelopes']
+
+        assert envelopes.shape == signals.shape
+        for signal, envelope in zip(signals, envelopes):
+            single = smoother._moving_average_filter(smoother._hilbert_transform(signal), smoother.window_samples)
+            np.testing.assert_allclose(envelope, single, atol=1e-12)
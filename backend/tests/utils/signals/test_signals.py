@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+from scipy.signal import fftconvolve
+from app.utils.signals.signals import (
+    deconvolution_size, deconvolve, estimate_t60, generar_sweep_inverse,
+    get_ir_from_deconvolution, inverse_filter_spectrum, sweep_chunks
+)
+
+
+def _recorded_sweep(t60: float, fs: int = 48000, delay_s: float = 0.2):
+    """Sweep played in a room with an exponentially decaying response."""
+    sweep, inverse, _ = generar_sweep_inverse(3, fs)
+    rng = np.random.default_rng(0)
+    t = np.arange(int(1.5 * t60 * fs)) / fs
+    ir = np.exp(-6.9 * t / t60) * rng.standard_normal(len(t))
+    ir[0] = 3.0
+    recording = np.concatenate((np.zeros(int(delay_s * fs)), fftconvolve(sweep, ir)))
+    recording += 1e-5 * rng.standard_normal(len(recording))
+    return (recording / np.max(np.abs(recording))).astype(np.float32), inverse, fs
+
+
+class TestSweepChunks:
+
+    @pytest.mark.parametrize("inverse", [False, True])
+    def test_chunks_match_the_generated_signals(self, inverse):
+        sweep, inverse_sweep, _ = generar_sweep_inverse(0.7, 44100, 50, 16000)
+
+        chunks = list(sweep_chunks(0.7, 44100, 50, 16000, inverse=inverse, chunk_size=1000))
+
+        assert all(len(chunk) <= 1000 and chunk.dtype == np.float32 for chunk in chunks)
+        np.testing.assert_array_equal(np.concatenate(chunks), inverse_sweep if inverse else sweep)
+
+
+class TestDeconvolution:
+
+    def test_deconvolve_is_a_linear_convolution(self):
+        rng = np.random.default_rng(1)
+        recording, inverse = rng.standard_normal(1001), rng.standard_normal(257)
+
+        result = deconvolve(recording, inverse)
+
+        assert len(result) == 1001 + 257 - 1
+        np.testing.assert_allclose(result, np.convolve(recording, inverse), atol=1e-4)
+
+    @pytest.mark.parametrize("n_linear", [1, 1000, 144000, 1441999])
+    def test_deconvolution_size_pads_at_most_an_eighth(self, n_linear):
+        n_fft = deconvolution_size(n_linear)
+
+        assert n_linear <= n_fft <= 1.125 * n_linear + 1
+        assert deconvolution_size(n_linear + 1) in (n_fft, deconvolution_size(n_fft + 1))
+
+    def test_deconvolve_with_a_precomputed_spectrum(self):
+        rng = np.random.default_rng(2)
+        recording, inverse = rng.standard_normal(1001), rng.standard_normal(257)
+        n_fft = deconvolution_size(1001 + 257 - 1)
+
+        result = deconvolve(recording, inverse, inverse_filter_spectrum(inverse, n_fft))
+
+        np.testing.assert_allclose(result, deconvolve(recording, inverse))
+        with pytest.raises(ValueError):
+            deconvolve(recording, inverse, inverse_filter_spectrum(inverse, n_fft * 2))
+
+    @pytest.mark.parametrize("t60", [0.3, 1.5])
+    def test_estimate_t60(self, t60):
+        recording, inverse, fs = _recorded_sweep(t60)
+        ir = deconvolve(recording, inverse)
+        peak = int(np.argmax(np.abs(ir)))
+
+        assert estimate_t60(ir[peak:], fs, float(np.abs(ir[peak]))) == pytest.approx(t60, rel=0.05)
+
+    def test_ir_is_trimmed_around_the_direct_sound(self):
+        recording, inverse, fs = _recorded_sweep(0.5)
+
+        result = get_ir_from_deconvolution(recording, inverse, fs, start_margin_ms=20, duration_factor=4)
+
+        ir = result['audio_data']
+        assert result['fs'] == fs
+        assert int(np.argmax(np.abs(ir))) == int(0.020 * fs)
+        assert np.max(np.abs(ir)) == pytest.approx(1.0)
+        assert len(ir) / fs == pytest.approx(0.020 + 4 * 0.5, rel=0.05)
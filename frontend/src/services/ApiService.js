@@ -63,11 +63,16 @@ export default {
         duration: params.duration,
         f_inf: params.f_inf,
         f_sup: params.f_sup,
-        fs: params.fs
+        fs: params.fs,
+        include_audio: false
       }
     });
   },
 
+  getSignalFileUrl(sweepId, kind) {
+    return `${import.meta.env.VITE_API_BASE_URL}/api/signal/${sweepId}/${kind}.wav`;
+  },
+
   getFileUrl(filePath) {
     return apiClient.get(`/api/file-url/${filePath}`);
   },